@@ -1,33 +1,111 @@
+import hashlib
+import time
+from typing import Optional
+
 import jwt
-from fastapi import HTTPException, Security, status
+from fastapi import HTTPException, Request, Security, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jwt.exceptions import ExpiredSignatureError, InvalidTokenError
 
+from libs.fastapi.platform.modules.auth.src import (
+    REFRESH_TOKEN_TYPE,
+    RevocationList,
+)
+from libs.utils.common.cache.src import MISSING, InMemoryCacheBackend
 from libs.utils.common.custom_logger.src import CustomLogger
 from libs.utils.config.src.auth import (
     ALGORITHM,
+    AUTH_MODE,
+    REVOCATION_REFRESH_SECONDS,
     SECRET_KEY,
+    VERIFIED_TOKEN_CACHE_SIZE,
 )
-from libs.utils.db.mongodb.operations.src import users_operations
+from libs.utils.db.mongodb.operations.src import (
+    async_revoked_tokens_operations,
+    async_users_operations,
+)
+from libs.utils.enums.src import AuthMode, TokenType
 
 auth_scheme = HTTPBearer()
 
+revocation_list = RevocationList(
+    async_revoked_tokens_operations.get_revocations, REVOCATION_REFRESH_SECONDS
+)
+
+# Claims of already verified tokens keyed by token digest, kept until ``exp``
+verified_tokens = InMemoryCacheBackend(VERIFIED_TOKEN_CACHE_SIZE)
+
 
 log = CustomLogger("AuthHelpers", is_request=False)
 logger, listener = log.get_logger()
 listener.start()
 
 
-def require_user(credentials: HTTPAuthorizationCredentials = Security(auth_scheme)):
-    token = credentials.credentials
+class AuthState:
+    """Outcome of verifying a request's bearer token, computed once per request."""
+
+    def __init__(
+        self,
+        token: Optional[str] = None,
+        claims: Optional[dict] = None,
+        error: Optional[Exception] = None,
+    ):
+        self.token = token
+        self.claims = claims
+        self.error = error
+
+    @property
+    def user_id(self):
+        return self.claims.get("user_id") if self.claims else None
+
+
+def get_bearer_token(authorization: Optional[str]) -> Optional[str]:
+    if not authorization:
+        return None
+    parts = authorization.split()
+    if len(parts) == 2 and parts[0].lower() == TokenType.Bearer.value.lower():
+        return parts[1]
+    return None
+
+
+async def get_auth_state(request: Request) -> AuthState:
+    """Verify the bearer token on first use and keep the result on the request."""
+    auth = getattr(request.state, "auth", None)
+    if auth is not None:
+        return auth
+
+    auth = AuthState(token=get_bearer_token(request.headers.get("authorization")))
+    if auth.token:
+        try:
+            auth.claims = await verify_jwt_token(auth.token)
+        except InvalidTokenError as error:
+            auth.error = error
+    request.state.auth = auth
+    return auth
+
+
+async def require_user(
+    request: Request,
+    credentials: HTTPAuthorizationCredentials = Security(auth_scheme),
+):
+    auth = await get_auth_state(request)
     try:
-        user_id = decode_jwt_token(token)
+        if auth.error is not None:
+            raise auth.error
+        claims = auth.claims
+        user_id = claims.get("user_id")
         if not user_id:
             logger.warning("Token missing user_id")
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Missing token subject",
             )
+        if claims.get("type") == REFRESH_TOKEN_TYPE:
+            logger.warning(f"Refresh token used as access token by: {user_id}")
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid token type",
+            )
         logger.info(f"Token decoded successfully for user_id: {user_id}")
 
     except ExpiredSignatureError:
@@ -44,7 +122,10 @@ def require_user(credentials: HTTPAuthorizationCredentials = Security(auth_schem
             detail="Invalid token",
         )
 
-    user = users_operations.get_user_by_id(user_id)
+    if AUTH_MODE == AuthMode.STATELESS and "is_active" in claims:
+        return await get_principal_from_claims(claims)
+
+    user = await async_users_operations.get_principal(user_id)
 
     if not user:
         logger.warning(f"User not found for user_id: {user_id}")
@@ -58,7 +139,40 @@ def require_user(credentials: HTTPAuthorizationCredentials = Security(auth_schem
     return user
 
 
-def decode_jwt_token(token: str):
-    payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-    user_id = payload.get("user_id")
-    return user_id
+async def get_principal_from_claims(claims: dict):
+    """Build the principal from a stateless access token without a lookup."""
+    user_id = claims.get("user_id")
+    await revocation_list.refresh_if_stale()
+    if revocation_list.is_revoked(claims):
+        logger.warning(f"Revoked token for user_id: {user_id}")
+        raise HTTPException(status_code=401, detail="Token revoked")
+
+    if not claims.get("is_active"):
+        logger.warning(f"Inactive account for user_id: {user_id}")
+        raise HTTPException(status_code=403, detail="Inactive account")
+
+    logger.info(f"User authenticated from token claims: {user_id}")
+    return {
+        "_id": user_id,
+        "email": claims.get("email"),
+        "is_active": True,
+        "role": claims.get("role"),
+    }
+
+
+async def verify_jwt_token(token: str) -> dict:
+    """Return the token's claims, verifying the signature only on first sight."""
+    key = hashlib.sha256(token.encode("utf-8")).hexdigest()
+    claims = await verified_tokens.get(key)
+    if claims is not MISSING:
+        return claims
+
+    claims = decode_jwt_claims(token)
+    ttl_seconds = claims.get("exp", 0) - time.time()
+    if ttl_seconds > 0:
+        await verified_tokens.set(key, claims, ttl_seconds)
+    return claims
+
+
+def decode_jwt_claims(token: str) -> dict:
+    return jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
@@ -2,129 +2,194 @@ import inspect
 from datetime import datetime, timezone
 from json import JSONDecodeError, loads
 
-from starlette.concurrency import iterate_in_threadpool
+from starlette.datastructures import Headers
 from starlette.middleware import Middleware
-from starlette.middleware.base import (
-    BaseHTTPMiddleware,
-    RequestResponseEndpoint,
-)
 from starlette.middleware.cors import CORSMiddleware
 from starlette.requests import Request
 from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from starlette_context import context, plugins
 from starlette_context.middleware import RawContextMiddleware
 from uvicorn.middleware.proxy_headers import ProxyHeadersMiddleware
 
-from apps.fastapi.auth.src.helpers import decode_jwt_token
+from apps.fastapi.auth.src.helpers import get_auth_state
 from libs.utils.common.custom_logger.src import CustomLogger
 from libs.utils.common.custom_logger.src.helper import extra_details_for_req
-from libs.utils.enums.src import TokenType
+from libs.utils.config.src.logger import (
+    LOG_REQUEST_BODY_MAX_BYTES,
+    LOG_RESPONSE_BODY_PREVIEW_BYTES,
+)
 
 log = CustomLogger("AppMiddleware")
 
 logger, listener = log.get_logger()
 listener.start()
 
-
-async def logging_iterator(response, iterator, class_name: str, start_time: datetime):
-    response_body = dict()
-    async for chunk in iterator:
-        if loads(chunk.decode("utf-8")).get("is_final"):
-            response_body = loads(chunk.decode("utf-8"))
-        yield chunk
-    extra = extra_details_for_req(
-        inspect,
-        class_name,
-        response=response,
-        response_body=response_body,
-        start_time=start_time,
-    )
-    logger.info("✅ Streaming request completed successfully: ", extra=extra)
+EXCLUDED_PATHS = {"/"}
+# Requests with these methods carry no body worth capturing
+BODYLESS_METHODS = {"GET", "HEAD", "DELETE", "OPTIONS"}
 
 
-class LoggingMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint):
-        excluded_paths = ["/"]
+def is_json_content_type(content_type: str) -> bool:
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    return media_type == "application/json" or media_type.endswith("+json")
 
-        if request.url.path in excluded_paths:
-            return await call_next(request)
 
-        start_time = datetime.now(timezone.utc)
+class RequestBodyCapture:
+    """Keep the first ``limit`` bytes of the request body as the app reads it.
 
-        try:
-            request_body = await request.json()
-        except JSONDecodeError:
-            request_body = dict()
+    Nothing is read ahead of the app: the body flows to the handler exactly
+    as it arrives, and the copy is parsed only if the log ends up needing it.
+    """
 
-        try:
-            auth = request.headers.get("authorization")
-            token = None
-
-            if auth:
-                parts = auth.split()
-
-                if (
-                    len(parts) == 2
-                    and parts[0].lower() == TokenType.Bearer.value.lower()
-                ):
-                    token = parts[1]
-
-            user_id = None
-            if token:
-                user_id = decode_jwt_token(token)
-
-            context["userId"] = user_id
-        except Exception as error:
-            logger.warning(f"Error in decoding jwt token in middleware - {str(error)}")
-            context["userId"] = None
+    def __init__(self, receive: Receive, limit: int):
+        self._receive = receive
+        self.limit = limit
+        self.size = 0
+        self.body = bytearray()
 
-        extra = extra_details_for_req(
-            inspect, __class__.__name__, request, request_body
-        )
-        logger.info("🚀 Request initiated...", extra=extra)
+    async def receive(self) -> Message:
+        message = await self._receive()
+        if message["type"] == "http.request":
+            chunk = message.get("body", b"")
+            self.size += len(chunk)
+            room = self.limit - len(self.body)
+            if room > 0:
+                self.body += chunk[:room]
+        return message
 
+    def parse(self) -> dict:
+        if self.size > len(self.body):
+            return {"<truncated>": f"{self.size} bytes"}
         try:
-            response = await call_next(request)
-            content_type = response.headers.get("content-type", "")
-            if "text/event-stream" in content_type:
-                response.body_iterator = logging_iterator(
-                    response=response,
-                    iterator=response.body_iterator,
-                    class_name=__class__.__name__,
-                    start_time=start_time,
-                )
+            body = loads(self.body) if self.body else dict()
+        except (JSONDecodeError, UnicodeDecodeError):
+            return dict()
+        return body if isinstance(body, dict) else dict()
+
+
+class ResponseInfo:
+    """What the logging middleware saw of a response while passing it on."""
+
+    def __init__(self, preview_limit: int):
+        self.preview_limit = preview_limit
+        self.status_code = 500
+        self.headers = Headers()
+        self.size = 0
+        self.preview = bytearray()
+        self.started = False
+
+    def observe(self, message: Message):
+        if message["type"] == "http.response.start":
+            self.started = True
+            self.status_code = message["status"]
+            self.headers = Headers(raw=message.get("headers", []))
+        elif message["type"] == "http.response.body":
+            body = message.get("body", b"")
+            self.size += len(body)
+            room = self.preview_limit - len(self.preview)
+            if room > 0:
+                self.preview += body[:room]
+
+    @property
+    def body_preview(self) -> str:
+        preview = self.preview.decode("utf-8", errors="replace")
+        return preview + "…" if self.size > len(self.preview) else preview
+
+
+class LoggingMiddleware:
+    """Log each request and its response without buffering the response.
+
+    ``send`` is wrapped to observe status, headers and byte counts as the
+    response goes out; only the first ``body_preview_bytes`` are kept for the
+    log, so large and streaming responses pass through untouched.
+
+    Request bodies are counted while the handler reads them. JSON bodies are
+    also copied, up to ``request_body_max_bytes``, and parsed for the
+    completion log only when the matched route opted in with
+    ``log_request_body``.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        body_preview_bytes: int = LOG_RESPONSE_BODY_PREVIEW_BYTES,
+        request_body_max_bytes: int = LOG_REQUEST_BODY_MAX_BYTES,
+    ):
+        self.app = app
+        self.body_preview_bytes = body_preview_bytes
+        self.request_body_max_bytes = request_body_max_bytes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope["path"] in EXCLUDED_PATHS:
+            await self.app(scope, receive, send)
+            return
 
-            else:
-                response_body = [chunk async for chunk in response.body_iterator]
-                response.body_iterator = iterate_in_threadpool(iter(response_body))
-                if response_body:
-                    response_body = response_body[0].decode()
-                else:
-                    response_body = ""
+        start_time = datetime.now(timezone.utc)
+        request = Request(scope)
+
+        # Every body is counted as it is read; only JSON bodies are copied
+        capture = None
+        if request.method not in BODYLESS_METHODS:
+            limit = 0
+            if is_json_content_type(request.headers.get("content-type", "")):
+                limit = self.request_body_max_bytes
+            capture = RequestBodyCapture(receive, limit)
+            receive = capture.receive
+
+        auth = await get_auth_state(request)
+        if auth.error is not None:
+            logger.warning(f"Error in decoding jwt token in middleware - {auth.error}")
+        context["userId"] = auth.user_id
+
+        extra = extra_details_for_req(inspect, __class__.__name__, request)
+        logger.info("🚀 Request initiated...", extra=extra)
 
+        response = ResponseInfo(self.body_preview_bytes)
+
+        async def logging_send(message: Message):
+            response.observe(message)
+            await send(message)
+            if message["type"] == "http.response.body" and not message.get(
+                "more_body", False
+            ):
+                # Routing has run by now, so the matched route and params are in
+                # scope and the request details can include them
+                request_body, request_size = None, None
+                if capture:
+                    request_size = capture.size
+                    endpoint = scope.get("endpoint")
+                    if capture.limit and getattr(endpoint, "log_request_body", False):
+                        request_body = capture.parse()
                 extra = extra_details_for_req(
                     inspect,
                     __class__.__name__,
+                    request,
+                    request_body,
                     response=response,
-                    response_body=response_body,
+                    response_body=response.body_preview,
                     start_time=start_time,
+                    response_size=response.size,
+                    request_size=request_size,
                 )
-
                 logger.info("✅ Request completed successfully", extra=extra)
+
+        try:
+            await self.app(scope, receive, logging_send)
         except Exception as error:
-            response = JSONResponse(
+            if response.started:
+                raise
+            error_response = JSONResponse(
                 status_code=500, content={"success": False, "error": str(error)}
             )
-
             extra = extra_details_for_req(
                 inspect,
                 __class__.__name__,
-                response=response,
+                response=error_response,
                 start_time=start_time,
             )
             logger.info("❌ Request failed...", extra=extra)
-
-        return response
+            await error_response(scope, receive, send)
 
 
 middlewares = [
@@ -19,6 +19,10 @@ class UserRegisterDTO(BaseModel):
     password: str = Field(...)
 
 
+class RefreshTokenDTO(BaseModel):
+    refresh_token: str = Field(...)
+
+
 class LoginDataDTO(BaseModel):
     id: str
     access_token: str
@@ -31,6 +35,10 @@ class LoginResponseDTO(BaseResponseDTO[LoginDataDTO]):
     pass
 
 
+class RefreshResponseDTO(BaseResponseDTO[LoginDataDTO]):
+    pass
+
+
 class RegisterDataDTO(BaseModel):
     id: str
     name: str = Field(...)
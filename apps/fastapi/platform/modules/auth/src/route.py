@@ -7,6 +7,8 @@ from starlette.responses import JSONResponse
 
 from apps.fastapi.platform.modules.auth.src.dto import (
     LoginResponseDTO,
+    RefreshResponseDTO,
+    RefreshTokenDTO,
     RegisterResponseDTO,
     UserLoginDTO,
     UserRegisterDTO,
@@ -14,6 +16,7 @@ from apps.fastapi.platform.modules.auth.src.dto import (
 from apps.fastapi.platform.modules.auth.src.service import (
     auth_service,
 )
+from libs.fastapi.platform.modules.auth.src import PasswordHasherBusyError
 from libs.utils.common.custom_logger.src import CustomLogger
 
 log = CustomLogger("AuthRoute")
@@ -33,13 +36,20 @@ async def login(
     """Authenticate a user and return access tokens."""
     try:
         logger.info(f"Login attempt started for email {login_data.email}")
-        return auth_service.login_user(login_data)
+        return await auth_service.login_user(login_data)
 
     except ValueError as error:
         return JSONResponse(
             status_code=400,
             content={"success": False, "message": str(error)},
         )
+    except PasswordHasherBusyError as error:
+        logger.warning(f"Rejected login for email {login_data.email}: {str(error)}")
+        return JSONResponse(
+            status_code=503,
+            content={"success": False, "message": str(error)},
+            headers={"Retry-After": "1"},
+        )
     except Exception as error:
         logger.error(f"Unhandled error during login for email {login_data.email}")
         return JSONResponse(
@@ -51,6 +61,31 @@ async def login(
         )
 
 
+@auth_route.post("/refresh", response_model=RefreshResponseDTO)
+@log.track
+async def refresh(
+    refresh_data: RefreshTokenDTO,
+):
+    """Exchange a refresh token for new tokens; each refresh token works once."""
+    try:
+        return await auth_service.refresh_tokens(refresh_data)
+
+    except ValueError as error:
+        return JSONResponse(
+            status_code=401,
+            content={"success": False, "message": str(error)},
+        )
+    except Exception as error:
+        logger.error("Unhandled error during token refresh")
+        return JSONResponse(
+            status_code=500,
+            content={
+                "success": False,
+                "message": f"Internal Server Error in refreshing tokens - {str(error)}",
+            },
+        )
+
+
 @auth_route.post(
     "/signup", response_model=RegisterResponseDTO, status_code=status.HTTP_201_CREATED
 )
@@ -61,13 +96,20 @@ async def signup(
     """Register a new user account."""
     try:
         logger.info(f"Signup attempt started for email {signup_data.email}")
-        return auth_service.signup_user(signup_data)
+        return await auth_service.signup_user(signup_data)
 
     except ValueError as error:
         return JSONResponse(
             status_code=400,
             content={"success": False, "message": str(error)},
         )
+    except PasswordHasherBusyError as error:
+        logger.warning(f"Rejected signup for email {signup_data.email}: {str(error)}")
+        return JSONResponse(
+            status_code=503,
+            content={"success": False, "message": str(error)},
+            headers={"Retry-After": "1"},
+        )
     except Exception as error:
         logger.error(f"Unhandled error during signup for email {signup_data.email}")
         return JSONResponse(
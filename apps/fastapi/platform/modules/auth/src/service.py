@@ -1,29 +1,46 @@
-from datetime import timedelta
+import uuid
+from datetime import datetime, timedelta, timezone
 
+from jwt.exceptions import InvalidTokenError
+
+from apps.fastapi.auth.src.helpers import decode_jwt_claims
 from apps.fastapi.platform.modules.auth.src.dto import (
+    RefreshTokenDTO,
     UserLoginDTO,
     UserRegisterDTO,
 )
-from libs.fastapi.platform.modules.auth.src import create_token
+from libs.fastapi.platform.modules.auth.src import (
+    ACCESS_TOKEN_TYPE,
+    REFRESH_TOKEN_TYPE,
+    create_token,
+)
 from libs.utils.common.custom_logger.src import CustomLogger
 from libs.utils.common.responses.src import success_response
 from libs.utils.config.src.auth import (
     ACCESS_TOKEN_EXPIRE_MINUTES,
+    AUTH_MODE,
     REFRESH_TOKEN_EXPIRE_DAYS,
+    STATELESS_ACCESS_TOKEN_EXPIRE_MINUTES,
 )
-from libs.utils.db.mongodb.operations.src import users_operations
-from libs.utils.enums.src import TokenType
+from libs.utils.db.mongodb.operations.src import (
+    async_refresh_tokens_operations,
+    async_users_operations,
+)
+from libs.utils.enums.src import AuthMode, TokenType
 
 log = CustomLogger("AuthService")
 logger, listener = log.get_logger()
 listener.start()
 
+# Where outstanding refresh tokens are tracked; tests swap in a memory store
+refresh_token_store = async_refresh_tokens_operations
+
 
 class AuthService:
     @staticmethod
     @log.track
-    def login_user(login_data: UserLoginDTO):
-        user_authenticated = users_operations.authenticate(
+    async def login_user(login_data: UserLoginDTO):
+        user_authenticated = await async_users_operations.authenticate(
             login_data.email, login_data.password
         )
 
@@ -31,42 +48,78 @@ class AuthService:
             logger.warning("Login failed: Incorrect email or password")
             raise ValueError("Incorrect email or password")
 
-        token_data = login_data.model_dump()
-        token_data["user_id"] = str(user_authenticated.get("_id"))
-
-        access_token = create_token(
-            data=token_data,
-            expires_delta=timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES),
+        return success_response(
+            data=await AuthService._issue_tokens(user_authenticated),
+            message="Successfully logged in",
         )
 
-        refresh_token = create_token(
-            data=token_data,
-            expires_delta=timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS),
-        )
+    @staticmethod
+    @log.track
+    async def refresh_tokens(refresh_data: RefreshTokenDTO):
+        try:
+            claims = decode_jwt_claims(refresh_data.refresh_token)
+        except InvalidTokenError:
+            raise ValueError("Invalid refresh token")
+        if claims.get("type") != REFRESH_TOKEN_TYPE:
+            raise ValueError("Invalid refresh token")
+
+        user_id = claims.get("user_id")
+        if not await refresh_token_store.consume(claims.get("jti"), user_id):
+            # A rotated token came back, so it has leaked; end every session
+            logger.warning(f"Refresh token reused for user_id: {user_id}")
+            await refresh_token_store.revoke_user(user_id)
+            raise ValueError("Refresh token is no longer valid")
+
+        user = await async_users_operations.get_principal(user_id)
+        if not user or not user.get("is_active"):
+            raise ValueError("Inactive account")
 
         return success_response(
-            data={
-                "id": str(user_authenticated.get("_id")),
-                "access_token": access_token,
-                "refresh_token": refresh_token,
-                "token_type": TokenType.Bearer,
-                "role": user_authenticated.get("role"),
-                "email": user_authenticated.get("email"),
-            },
-            message="Successfully logged in",
+            data=await AuthService._issue_tokens(user),
+            message="Tokens refreshed",
         )
 
     @staticmethod
-    @log.track
-    def signup_user(signup_data: UserRegisterDTO):
-        user_with_same_email_exists = users_operations.get_user_by_email(
-            signup_data.email
+    async def _issue_tokens(user: dict) -> dict:
+        """Issue an access token and a new single-use refresh token for ``user``."""
+        user_id = str(user.get("_id"))
+        token_data = {"email": user.get("email"), "user_id": user_id}
+
+        access_token_data = {**token_data, "type": ACCESS_TOKEN_TYPE}
+        access_token_expire_minutes = ACCESS_TOKEN_EXPIRE_MINUTES
+        if AUTH_MODE == AuthMode.STATELESS:
+            # Only active users get this far
+            access_token_data.update({"is_active": True, "role": user.get("role")})
+            access_token_expire_minutes = STATELESS_ACCESS_TOKEN_EXPIRE_MINUTES
+
+        access_token = create_token(
+            data=access_token_data,
+            expires_delta=timedelta(minutes=access_token_expire_minutes),
         )
 
-        if user_with_same_email_exists:
-            raise ValueError("Email already exists")
+        refresh_jti = uuid.uuid4().hex
+        refresh_expires_delta = timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
+        refresh_token = create_token(
+            data={**token_data, "type": REFRESH_TOKEN_TYPE, "jti": refresh_jti},
+            expires_delta=refresh_expires_delta,
+        )
+        await refresh_token_store.save(
+            refresh_jti, user_id, datetime.now(timezone.utc) + refresh_expires_delta
+        )
 
-        created_id = users_operations.create_user(
+        return {
+            "id": user_id,
+            "access_token": access_token,
+            "refresh_token": refresh_token,
+            "token_type": TokenType.Bearer,
+            "role": user.get("role"),
+            "email": user.get("email"),
+        }
+
+    @staticmethod
+    @log.track
+    async def signup_user(signup_data: UserRegisterDTO):
+        created_id = await async_users_operations.create_user(
             signup_data.name, signup_data.email, signup_data.password
         )
 
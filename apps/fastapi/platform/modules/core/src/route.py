@@ -2,6 +2,7 @@ from fastapi import APIRouter
 from fastapi.responses import JSONResponse
 from starlette.responses import RedirectResponse
 
+from libs.utils.common.cache.src import get_cache_stats
 from libs.utils.common.custom_logger.src import CustomLogger
 from libs.utils.common.date_time.src import (
     get_current_utc_timestamp,
@@ -36,3 +37,12 @@ def root():
             "uptime": get_execution_time_in_readable_format(start_time=start_time),
         },
     )
+
+
+@core_route.get("/metrics")
+def metrics():
+    """Return cache hit and miss counters for this worker process."""
+    return JSONResponse(
+        status_code=200,
+        content={"success": True, "caches": get_cache_stats()},
+    )
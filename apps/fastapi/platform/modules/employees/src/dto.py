@@ -1,11 +1,18 @@
 from datetime import datetime
+from typing import Dict, List, Optional
 
 from pydantic import (
     BaseModel,
     EmailStr,
+    Field,
 )
 
-from libs.utils.common.dto.src import BaseListResponseDataDTO, BaseResponseDTO
+from libs.utils.common.constants.src import EMPLOYEE_BULK_CHUNK_SIZE
+from libs.utils.common.dto.src import (
+    BaseListResponseDataDTO,
+    BaseListResponseDataWithoutPaginationDTO,
+    BaseResponseDTO,
+)
 from libs.utils.enums.src import DepartmentType, RoleType
 
 
@@ -23,6 +30,20 @@ class UpdateEmployeeDTO(BaseModel):
     role: RoleType | None = None
 
 
+class BulkUpdateEmployeeDTO(UpdateEmployeeDTO):
+    id: str
+
+
+class BulkUpdateEmployeesDTO(BaseModel):
+    items: List[BulkUpdateEmployeeDTO] = Field(
+        ..., min_length=1, max_length=EMPLOYEE_BULK_CHUNK_SIZE
+    )
+
+
+class BulkDeleteEmployeesDTO(BaseModel):
+    ids: List[str] = Field(..., min_length=1, max_length=EMPLOYEE_BULK_CHUNK_SIZE)
+
+
 class EmployeeDataDTO(CreateEmployeeDTO):
     id: str
     date_joined: datetime
@@ -33,8 +54,53 @@ class EmployeeResponseDTO(BaseResponseDTO[EmployeeDataDTO]):
 
 
 class EmployeeListDataDTO(BaseListResponseDataDTO[EmployeeDataDTO]):
-    pass
+    total: Optional[int] = None
+    page: Optional[int] = None
+    total_pages: Optional[int] = Field(None, alias="totalPages")
+    next_cursor: Optional[str] = Field(None, alias="nextCursor")
 
 
 class EmployeesListResponseDTO(BaseResponseDTO[EmployeeListDataDTO]):
     pass
+
+
+class HeadcountItemDTO(BaseModel):
+    department: str
+    role: str
+    count: int
+
+
+class HeadcountsDataDTO(BaseModel):
+    total: int
+    by_department: Dict[str, int]
+    by_role: Dict[str, int]
+    items: List[HeadcountItemDTO]
+
+
+class HeadcountsResponseDTO(BaseResponseDTO[HeadcountsDataDTO]):
+    pass
+
+
+class EmployeeSearchResponseDTO(
+    BaseResponseDTO[BaseListResponseDataWithoutPaginationDTO[EmployeeDataDTO]]
+):
+    pass
+
+
+class BulkResultItemDTO(BaseModel):
+    row: Optional[int] = None
+    id: Optional[str] = None
+    email: Optional[str] = None
+    status: str
+    error: Optional[str] = None
+
+
+class BulkResultDataDTO(BaseModel):
+    total: int
+    succeeded: int
+    failed: int
+    items: List[BulkResultItemDTO]
+
+
+class BulkResultResponseDTO(BaseResponseDTO[BulkResultDataDTO]):
+    pass
@@ -1,16 +1,26 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request
 from starlette import status
-from starlette.responses import JSONResponse
+from starlette.responses import JSONResponse, Response
 
 from apps.fastapi.auth.src import require_user
 from apps.fastapi.platform.modules.employees.src.dto import (
+    BulkDeleteEmployeesDTO,
+    BulkResultResponseDTO,
+    BulkUpdateEmployeesDTO,
     CreateEmployeeDTO,
     EmployeeResponseDTO,
+    EmployeeSearchResponseDTO,
     EmployeesListResponseDTO,
+    HeadcountsResponseDTO,
     UpdateEmployeeDTO,
 )
 from apps.fastapi.platform.modules.employees.src.service import employee_service
+from libs.fastapi.platform.modules.employees.src import (
+    EmployeeNotFoundError,
+    iter_import_rows,
+)
 from libs.utils.common.custom_logger.src import CustomLogger
+from libs.utils.common.custom_logger.src.helper import log_request_body
 from libs.utils.enums.src import DepartmentType, RoleType
 
 log = CustomLogger("EmployeesRoute")
@@ -25,6 +35,7 @@ employees_route = APIRouter(prefix="/employees", tags=["Employees"])
     response_model=EmployeeResponseDTO,
     status_code=status.HTTP_201_CREATED,
 )
+@log_request_body
 @log.track
 async def create_employee(
     employee_data: CreateEmployeeDTO, current_user=Depends(require_user)
@@ -32,7 +43,7 @@ async def create_employee(
     """Create a new employee record."""
     try:
         logger.info(f"Employee creation request by : {current_user.get('email')}")
-        return employee_service.create_employee(employee_data)
+        return await employee_service.create_employee(employee_data)
 
     except ValueError as error:
         return JSONResponse(
@@ -52,6 +63,90 @@ async def create_employee(
         )
 
 
+@employees_route.post("/bulk", response_model=BulkResultResponseDTO)
+@log.track
+async def bulk_import_employees(request: Request, current_user=Depends(require_user)):
+    """Import employees from a streamed NDJSON or CSV body.
+
+    Rows are validated and inserted in chunks; the response reports the
+    outcome of every row.
+    """
+    try:
+        logger.info(f"Employee bulk import request by : {current_user.get('email')}")
+        rows = iter_import_rows(
+            request.stream(), request.headers.get("content-type", "")
+        )
+        return await employee_service.bulk_import_employees(rows)
+    except ValueError as error:
+        return JSONResponse(
+            status_code=400,
+            content={"success": False, "message": str(error)},
+        )
+    except Exception as error:
+        logger.error("Unhandled error during employee bulk import request")
+        return JSONResponse(
+            status_code=500,
+            content={
+                "success": False,
+                "message": f"Internal Server Error in employee bulk import - {str(error)}",
+            },
+        )
+
+
+@employees_route.put("/bulk", response_model=BulkResultResponseDTO)
+@log_request_body
+@log.track
+async def bulk_update_employees(
+    updates: BulkUpdateEmployeesDTO, current_user=Depends(require_user)
+):
+    """Update many employees in one batch and report the outcome per id."""
+    try:
+        logger.info(f"Employee bulk update request by : {current_user.get('email')}")
+        return await employee_service.bulk_update_employees(
+            [item.model_dump(exclude_unset=True) for item in updates.items]
+        )
+    except ValueError as error:
+        return JSONResponse(
+            status_code=400,
+            content={"success": False, "message": str(error)},
+        )
+    except Exception as error:
+        logger.error("Unhandled error during employee bulk update request")
+        return JSONResponse(
+            status_code=500,
+            content={
+                "success": False,
+                "message": f"Internal Server Error in employee bulk update - {str(error)}",
+            },
+        )
+
+
+@employees_route.post("/bulk/delete", response_model=BulkResultResponseDTO)
+@log_request_body
+@log.track
+async def bulk_delete_employees(
+    payload: BulkDeleteEmployeesDTO, current_user=Depends(require_user)
+):
+    """Soft delete many employees in one batch and report the outcome per id."""
+    try:
+        logger.info(f"Employee bulk delete request by : {current_user.get('email')}")
+        return await employee_service.bulk_delete_employees(payload.ids)
+    except ValueError as error:
+        return JSONResponse(
+            status_code=400,
+            content={"success": False, "message": str(error)},
+        )
+    except Exception as error:
+        logger.error("Unhandled error during employee bulk delete request")
+        return JSONResponse(
+            status_code=500,
+            content={
+                "success": False,
+                "message": f"Internal Server Error in employee bulk delete - {str(error)}",
+            },
+        )
+
+
 @employees_route.get("/", response_model=EmployeesListResponseDTO)
 @log.track
 async def get_employees(
@@ -60,11 +155,21 @@ async def get_employees(
     role: RoleType | None = None,
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(10, ge=1, le=100, description="Items per page"),
+    cursor: str | None = Query(
+        None, description="Opaque nextCursor from a previous page; overrides page"
+    ),
+    include_total: bool | None = Query(
+        None,
+        description="Count total and totalPages; by default only pages "
+        "without a cursor are counted",
+    ),
 ):
-    """List employees with optional filters and pagination."""
+    """List employees with optional filters and page or cursor pagination."""
     try:
         logger.info(f"Employee list request by : {current_user.get('email')}")
-        return employee_service.list_employees(department, role, page, page_size)
+        return await employee_service.list_employees(
+            department, role, page, page_size, cursor, include_total
+        )
     except ValueError as error:
         return JSONResponse(
             status_code=400,
@@ -81,6 +186,52 @@ async def get_employees(
         )
 
 
+# Declared before "/{employee_id}" so "stats" is not taken for an id
+@employees_route.get("/stats", response_model=HeadcountsResponseDTO)
+@log.track
+async def get_employee_headcounts(current_user=Depends(require_user)):
+    """Active employee headcount per department and role."""
+    try:
+        logger.info(f"Employee stats request by : {current_user.get('email')}")
+        return await employee_service.get_headcounts()
+    except Exception as error:
+        logger.error("Unhandled error during employee stats request")
+        return JSONResponse(
+            status_code=500,
+            content={
+                "success": False,
+                "message": f"Internal Server Error in employee stats - {str(error)}",
+            },
+        )
+
+
+# Declared before "/{employee_id}" so "search" is not taken for an id
+@employees_route.get("/search", response_model=EmployeeSearchResponseDTO)
+@log.track
+async def search_employees(
+    current_user=Depends(require_user),
+    q: str = Query(..., min_length=1, max_length=100, description="Name or email"),
+):
+    """Fuzzy and prefix search on employee name and email, best match first."""
+    try:
+        logger.info(f"Employee search request by : {current_user.get('email')}")
+        return await employee_service.search_employees(q)
+    except ValueError as error:
+        return JSONResponse(
+            status_code=400,
+            content={"success": False, "message": str(error)},
+        )
+    except Exception as error:
+        logger.error("Unhandled error during employee search request")
+        return JSONResponse(
+            status_code=500,
+            content={
+                "success": False,
+                "message": f"Internal Server Error in employee search - {str(error)}",
+            },
+        )
+
+
 @employees_route.get("/{employee_id}", response_model=EmployeeResponseDTO)
 @log.track
 async def get_employee(
@@ -90,7 +241,7 @@ async def get_employee(
     """Fetch a single employee by ID."""
     try:
         logger.info(f"Employee fetch request by : {current_user.get('email')}")
-        return employee_service.get_employee(employee_id)
+        return await employee_service.get_employee(employee_id)
     except ValueError as error:
         return JSONResponse(
             status_code=400,
@@ -108,6 +259,7 @@ async def get_employee(
 
 
 @employees_route.put("/{employee_id}", response_model=EmployeeResponseDTO)
+@log_request_body
 @log.track
 async def update_employee(
     employee_id: str,
@@ -117,7 +269,7 @@ async def update_employee(
     """Update an existing employee by ID."""
     try:
         logger.info(f"Employee update request by : {current_user.get('email')}")
-        return employee_service.update_employee(
+        return await employee_service.update_employee(
             employee_id, updated_data.model_dump(exclude_unset=True)
         )
     except ValueError as error:
@@ -142,10 +294,22 @@ async def delete_employee(
     employee_id: str,
     current_user=Depends(require_user),
 ):
-    """Delete an employee by ID."""
+    """Soft delete an employee by ID.
+
+    The deactivation time is returned in the ``X-Deactivated-At`` header.
+    """
     try:
         logger.info(f"Employee delete request by : {current_user.get('email')}")
-        return employee_service.delete_employee(employee_id)
+        deactivated_at = await employee_service.delete_employee(employee_id)
+        return Response(
+            status_code=status.HTTP_204_NO_CONTENT,
+            headers={"X-Deactivated-At": deactivated_at.isoformat()},
+        )
+    except EmployeeNotFoundError as error:
+        return JSONResponse(
+            status_code=status.HTTP_404_NOT_FOUND,
+            content={"success": False, "message": str(error)},
+        )
     except ValueError as error:
         return JSONResponse(
             status_code=400,
@@ -1,14 +1,30 @@
 from datetime import datetime, timezone
+from typing import AsyncIterator
+
+from bson import ObjectId
+from pydantic import ValidationError
 
 from apps.fastapi.platform.modules.employees.src.dto import CreateEmployeeDTO
-from libs.fastapi.platform.modules.employees.src import format_employee_record
+from libs.fastapi.platform.modules.employees.src import (
+    EMPLOYEE_RECORD_PROJECTION,
+    EmployeeNotFoundError,
+    format_employee_record,
+)
+from libs.fastapi.platform.modules.employees.src.bulk_import import ImportRow
 from libs.fastapi.platform.modules.employees.src.helpers import (
+    format_bulk_result_report,
     format_employee_list_record,
+    format_headcount_report,
+)
+from libs.utils.common.constants.src import (
+    EMPLOYEE_BULK_CHUNK_SIZE,
+    FUZZY_SEARCH_TOP_N,
 )
 from libs.utils.common.custom_logger.src import CustomLogger
 from libs.utils.common.responses.src import success_response
 from libs.utils.db.mongodb.operations.src import (
-    employees_operations,
+    async_employee_headcounts_operations,
+    async_employees_operations,
 )
 from libs.utils.enums.src import DepartmentType, RoleType
 
@@ -17,20 +33,20 @@ logger, listener = log.get_logger()
 listener.start()
 
 
+def _validation_error_message(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in detail['loc'])}: {detail['msg']}"
+        for detail in error.errors()
+    )
+
+
 class EmployeeService:
     @staticmethod
     @log.track
-    def create_employee(employee_data: CreateEmployeeDTO):
-        existing_employee = employees_operations.get_employee_by_email(
-            employee_data.email
-        )
-
-        if existing_employee:
-            raise ValueError("Employee with email already exists")
-
+    async def create_employee(employee_data: CreateEmployeeDTO):
         employee_dict = employee_data.model_dump()
         employee_dict["date_joined"] = datetime.now(timezone.utc)
-        employee_id = employees_operations.create_employee(employee_dict)
+        employee_id = await async_employees_operations.create_employee(employee_dict)
 
         return success_response(
             data=format_employee_record(employee_dict, employee_id),
@@ -39,45 +55,97 @@ class EmployeeService:
 
     @staticmethod
     @log.track
-    def list_employees(
-        department: DepartmentType, role: RoleType, page: int, page_size: int
+    async def list_employees(
+        department: DepartmentType,
+        role: RoleType,
+        page: int,
+        page_size: int,
+        cursor: str | None = None,
+        include_total: bool | None = None,
     ):
-        employees_list, total = employees_operations.list_employees(
-            department, role, page, page_size
-        )
+        # Counting costs O(matches) on every page; cursor pages exist to avoid
+        # exactly that, so they skip it unless asked
+        if include_total is None:
+            include_total = not cursor
+        if cursor:
+            result = await async_employees_operations.list_employees_after_cursor(
+                department,
+                role,
+                cursor,
+                page_size,
+                include_total,
+                EMPLOYEE_RECORD_PROJECTION,
+            )
+            page = None
+        else:
+            result = await async_employees_operations.list_employees(
+                department,
+                role,
+                page,
+                page_size,
+                include_total,
+                EMPLOYEE_RECORD_PROJECTION,
+            )
+        employees_list, total, next_cursor = result
 
         return success_response(
-            data=format_employee_list_record(employees_list, total, page, page_size),
+            data=format_employee_list_record(
+                employees_list, total, page, page_size, next_cursor
+            ),
             message="Employees list fetched successfully",
         )
 
     @staticmethod
     @log.track
-    def get_employee(employee_id: str):
-        employee = employees_operations.get_employee_by_id(employee_id)
+    async def search_employees(query: str):
+        employees = await async_employees_operations.search_employees(
+            query, FUZZY_SEARCH_TOP_N, EMPLOYEE_RECORD_PROJECTION
+        )
 
-        if not employee:
-            raise ValueError("Employee not found")
+        return success_response(
+            data={
+                "items": [
+                    format_employee_record(employee, employee.get("_id"))
+                    for employee in employees
+                ]
+            },
+            message="Employees search completed successfully",
+        )
+
+    @staticmethod
+    @log.track
+    async def get_headcounts():
+        headcounts = await async_employee_headcounts_operations.get_headcounts()
 
         return success_response(
-            data=format_employee_record(employee, employee_id),
-            message="Employee fetched successfully",
+            data=format_headcount_report(headcounts),
+            message="Employee headcounts fetched successfully",
         )
 
     @staticmethod
     @log.track
-    def update_employee(employee_id: str, updated_data: dict):
-        employee = employees_operations.get_employee_by_id(employee_id)
+    async def get_employee(employee_id: str):
+        employee = await async_employees_operations.get_employee_by_id(
+            employee_id, EMPLOYEE_RECORD_PROJECTION
+        )
 
         if not employee:
             raise ValueError("Employee not found")
 
-        employee_updated = employees_operations.update_employee(
-            employee_id, updated_data
+        return success_response(
+            data=format_employee_record(employee, employee_id),
+            message="Employee fetched successfully",
+        )
+
+    @staticmethod
+    @log.track
+    async def update_employee(employee_id: str, updated_data: dict):
+        employee_updated = await async_employees_operations.update_employee(
+            employee_id, updated_data, EMPLOYEE_RECORD_PROJECTION
         )
 
         if not employee_updated:
-            raise ValueError("Error occurred in updating employee")
+            raise ValueError("Employee not found")
 
         return success_response(
             data=format_employee_record(employee_updated, employee_id),
@@ -86,14 +154,188 @@ class EmployeeService:
 
     @staticmethod
     @log.track
-    def delete_employee(employee_id: str):
-        employee = employees_operations.get_employee_by_id(employee_id)
+    async def delete_employee(employee_id: str):
+        deactivated_at = await async_employees_operations.delete_employee(employee_id)
 
-        if not employee:
-            raise ValueError("Employee not found")
+        if deactivated_at is None:
+            raise EmployeeNotFoundError("Employee not found")
+
+        return deactivated_at
 
-        employees_operations.delete_employee(employee_id)
-        return None
+    @staticmethod
+    @log.track
+    async def bulk_import_employees(rows: AsyncIterator[ImportRow]):
+        results = []
+        seen_emails = set()
+        chunk = []
+        async for row in rows:
+            chunk.append(row)
+            if len(chunk) >= EMPLOYEE_BULK_CHUNK_SIZE:
+                results.extend(await EmployeeService._import_chunk(chunk, seen_emails))
+                chunk = []
+        if chunk:
+            results.extend(await EmployeeService._import_chunk(chunk, seen_emails))
+
+        report = format_bulk_result_report(results)
+        logger.info(
+            f"Bulk import finished: {report['succeeded']} created, "
+            f"{report['failed']} failed"
+        )
+        return success_response(data=report, message="Employees imported")
+
+    @staticmethod
+    async def _import_chunk(chunk: list[ImportRow], seen_emails: set[str]):
+        """Validate a chunk of rows and insert the valid ones in one batch."""
+        results = []
+        pending = []
+        date_joined = datetime.now(timezone.utc)
+
+        for row, record, error in chunk:
+            result = {
+                "row": row,
+                "email": record.get("email") if record else None,
+                "status": "failed",
+                "error": error,
+            }
+            results.append(result)
+            if error:
+                continue
+
+            try:
+                employee = CreateEmployeeDTO.model_validate(record)
+            except ValidationError as validation_error:
+                result["error"] = _validation_error_message(validation_error)
+                continue
+
+            if employee.email in seen_emails:
+                result["error"] = "Duplicate email in import"
+                continue
+            seen_emails.add(employee.email)
+
+            employee_dict = employee.model_dump()
+            employee_dict["date_joined"] = date_joined
+            pending.append((result, employee_dict))
+
+        if not pending:
+            return results
+
+        existing_emails = await async_employees_operations.get_active_employee_emails(
+            [employee_dict["email"] for _, employee_dict in pending]
+        )
+        to_insert = []
+        for result, employee_dict in pending:
+            if employee_dict["email"] in existing_emails:
+                result["error"] = "Employee with email already exists"
+            else:
+                to_insert.append((result, employee_dict))
+
+        if not to_insert:
+            return results
+
+        failures = await async_employees_operations.create_employees(
+            [employee_dict for _, employee_dict in to_insert]
+        )
+        for index, (result, employee_dict) in enumerate(to_insert):
+            if index in failures:
+                result["error"] = failures[index]
+            else:
+                result.update(
+                    status="created", id=str(employee_dict["_id"]), error=None
+                )
+        return results
+
+    @staticmethod
+    async def _find_bulk_targets(employee_ids: list[str]):
+        """Build a result per id and return the ones that are active employees."""
+        results = []
+        candidates = {}
+        for employee_id in employee_ids:
+            result = {"id": employee_id, "status": "failed", "error": None}
+            results.append(result)
+            if employee_id in candidates:
+                result["error"] = "Duplicate employee id in request"
+            elif not ObjectId.is_valid(employee_id):
+                result["error"] = "Invalid employee id"
+            else:
+                candidates[employee_id] = result
+
+        active_ids = set()
+        if candidates:
+            active_ids = await async_employees_operations.get_active_employee_ids(
+                list(candidates)
+            )
+
+        targets = {}
+        for employee_id, result in candidates.items():
+            if employee_id in active_ids:
+                targets[employee_id] = result
+            else:
+                result["error"] = "Employee not found"
+        return results, targets
+
+    @staticmethod
+    def _apply_bulk_outcome(targets: dict, matched: int, status: str):
+        for result in targets.values():
+            result["status"] = status
+        if matched < len(targets):
+            # Another request deactivated some of them between lookup and write
+            logger.warning(
+                f"Bulk {status}: matched {matched} of {len(targets)} employees"
+            )
+
+    @staticmethod
+    @log.track
+    async def bulk_update_employees(updates: list[dict]):
+        results, targets = await EmployeeService._find_bulk_targets(
+            [update["id"] for update in updates]
+        )
+        employee_updates = {}
+        for update in updates:
+            employee_data = {key: value for key, value in update.items() if key != "id"}
+            if update["id"] in targets and employee_data:
+                employee_updates[update["id"]] = employee_data
+
+        matched, failures = 0, {}
+        if employee_updates:
+            matched, failures = await async_employees_operations.bulk_update_employees(
+                employee_updates
+            )
+        for employee_id, error in failures.items():
+            targets[employee_id]["error"] = error
+        EmployeeService._apply_bulk_outcome(
+            {
+                employee_id: targets[employee_id]
+                for employee_id in employee_updates
+                if employee_id not in failures
+            },
+            matched,
+            "updated",
+        )
+        for employee_id, result in targets.items():
+            if employee_id not in employee_updates:
+                result["status"] = "unchanged"
+
+        return success_response(
+            data=format_bulk_result_report(results),
+            message="Employees updated successfully",
+        )
+
+    @staticmethod
+    @log.track
+    async def bulk_delete_employees(employee_ids: list[str]):
+        results, targets = await EmployeeService._find_bulk_targets(employee_ids)
+
+        matched = 0
+        if targets:
+            matched = await async_employees_operations.bulk_delete_employees(
+                list(targets)
+            )
+        EmployeeService._apply_bulk_outcome(targets, matched, "deleted")
+
+        return success_response(
+            data=format_bulk_result_report(results),
+            message="Employees deleted successfully",
+        )
 
 
 employee_service = EmployeeService()
@@ -1,4 +1,6 @@
+import asyncio
 import os
+from contextlib import asynccontextmanager
 
 import uvicorn
 from dotenv import load_dotenv
@@ -18,6 +20,14 @@ from libs.utils.common.custom_logger.src import (
 )
 from libs.utils.common.os_helpers.src import BASE_DIR
 from libs.utils.config.src.fastapi import GUNICORN_CONFIG_PATH
+from libs.utils.db.mongodb.operations.src import (
+    async_employee_headcounts_operations,
+)
+from libs.utils.db.mongodb.operations.src.employees import employee_search_index
+from libs.utils.db.mongodb.src.repository import (
+    UniqueIndexError,
+    ensure_indexes,
+)
 
 load_dotenv()
 
@@ -25,12 +35,35 @@ log = CustomLogger("HabbotConnect Backend App", queue_logger=True, is_request=Fa
 logger, listener = log.get_logger()
 listener.start()
 
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    # Emails are only kept unique by an index, so do not serve without one
+    try:
+        failures = await ensure_indexes()
+    except UniqueIndexError as error:
+        logger.error(f"Failed to ensure unique database indexes: {error}")
+        raise
+    for collection_name, error in failures.items():
+        logger.error(f"Failed to ensure {collection_name} indexes: {error}")
+    try:
+        await async_employee_headcounts_operations.ensure_headcounts()
+    except Exception as error:
+        logger.error(f"Failed to build employee headcounts: {error}")
+    # Build the employee search index in the background; it is ready a few
+    # seconds after startup instead of on the first search
+    warm_search_index = asyncio.create_task(employee_search_index.refresh_if_stale())
+    yield
+    warm_search_index.cancel()
+
+
 app = FastAPI(
     title="HabbotConnect Backend App",
     version="0.3.1",
     docs_url="/docs",
     redoc_url="/redoc",
     middleware=middlewares,
+    lifespan=lifespan,
 )
 
 
@@ -1,7 +1,33 @@
 from libs.fastapi.platform.modules.auth.src.helpers import (
+    ACCESS_TOKEN_TYPE,
+    REFRESH_TOKEN_TYPE,
+    PasswordHasherBusyError,
+    async_get_password_hash,
+    async_verify_and_update_password,
+    async_verify_password,
+    build_password_context,
     create_token,
     get_password_hash,
+    verify_and_update_password,
     verify_password,
 )
+from libs.fastapi.platform.modules.auth.src.refresh_tokens import (
+    InMemoryRefreshTokenStore,
+)
+from libs.fastapi.platform.modules.auth.src.revocation import RevocationList
 
-__all__ = ["create_token", "get_password_hash", "verify_password"]
+__all__ = [
+    "ACCESS_TOKEN_TYPE",
+    "REFRESH_TOKEN_TYPE",
+    "InMemoryRefreshTokenStore",
+    "PasswordHasherBusyError",
+    "RevocationList",
+    "async_get_password_hash",
+    "async_verify_and_update_password",
+    "async_verify_password",
+    "build_password_context",
+    "create_token",
+    "get_password_hash",
+    "verify_and_update_password",
+    "verify_password",
+]
@@ -0,0 +1,57 @@
+"""Measure bcrypt verify cost on this machine to pick ``BCRYPT_ROUNDS``.
+
+Usage: python -m libs.fastapi.platform.modules.auth.src.benchmark --rounds 10 11 12
+"""
+
+import argparse
+import statistics
+import time
+
+from libs.fastapi.platform.modules.auth.src.helpers import (
+    build_password_context,
+)
+from libs.utils.config.src.auth import BCRYPT_ROUNDS
+
+
+def benchmark_rounds(rounds: int, iterations: int) -> dict:
+    context = build_password_context(rounds)
+    hashed_password = context.hash("benchmark-password")
+
+    latencies = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        context.verify("benchmark-password", hashed_password)
+        latencies.append(time.perf_counter() - started)
+
+    latencies.sort()
+    mean = statistics.fmean(latencies)
+    p99_index = min(len(latencies) - 1, round(0.99 * (len(latencies) - 1)))
+    return {
+        "rounds": rounds,
+        "mean_ms": mean * 1000,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": latencies[p99_index] * 1000,
+        # One verify holds one core for its whole duration
+        "verifies_per_core_per_second": 1 / mean,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, nargs="+", default=[BCRYPT_ROUNDS])
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+
+    print(
+        f"{'rounds':>6} {'mean ms':>9} {'p50 ms':>9} {'p99 ms':>9} {'verify/s/core':>14}"
+    )
+    for rounds in args.rounds:
+        result = benchmark_rounds(rounds, args.iterations)
+        print(
+            f"{result['rounds']:>6} {result['mean_ms']:>9.1f} {result['p50_ms']:>9.1f} "
+            f"{result['p99_ms']:>9.1f} {result['verifies_per_core_per_second']:>14.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
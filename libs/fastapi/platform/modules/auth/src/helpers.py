@@ -1,12 +1,49 @@
+import asyncio
+import os
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 import jwt
 from passlib.context import CryptContext
 
-from libs.utils.config.src.auth import ALGORITHM, SECRET_KEY
+from libs.utils.config.src.auth import (
+    ALGORITHM,
+    BCRYPT_ROUNDS,
+    PASSWORD_HASH_MAX_PENDING,
+    PASSWORD_HASH_WORKERS,
+    SECRET_KEY,
+)
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+def build_password_context(rounds: int = BCRYPT_ROUNDS) -> CryptContext:
+    """bcrypt context hashing at ``rounds``; hashes at any other cost need update."""
+    return CryptContext(
+        schemes=["bcrypt"],
+        deprecated="auto",
+        bcrypt__default_rounds=rounds,
+        bcrypt__min_rounds=rounds,
+        bcrypt__max_rounds=rounds,
+    )
+
+
+pwd_context = build_password_context()
+
+# Value of the ``type`` claim; refresh tokens are never accepted as access tokens
+ACCESS_TOKEN_TYPE = "access"
+REFRESH_TOKEN_TYPE = "refresh"
+
+_password_executor = None
+_password_executor_pid = None
+_password_executor_lock = threading.Lock()
+_pending_password_jobs = 0
+_pending_password_jobs_lock = threading.Lock()
+
+
+class PasswordHasherBusyError(Exception):
+    """Raised when the password hashing queue is full; callers answer 503."""
 
 
 def create_token(
@@ -14,12 +51,15 @@ def create_token(
 ) -> str:
     to_encode = data.copy()
 
+    issued_at = datetime.now(timezone.utc)
     if expires_delta:
-        expire = datetime.now(timezone.utc) + expires_delta
+        expire = issued_at + expires_delta
     else:
-        expire = datetime.now(timezone.utc) + timedelta(hours=1)
+        expire = issued_at + timedelta(hours=1)
 
-    to_encode.update({"exp": expire})
+    # ``iat`` and ``jti`` let the revocation list deny a user's or a single token
+    to_encode.update({"exp": expire, "iat": issued_at})
+    to_encode.setdefault("jti", uuid.uuid4().hex)
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
@@ -30,3 +70,65 @@ def get_password_hash(password: str) -> str:
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
+
+
+def verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> Tuple[bool, Optional[str]]:
+    """Verify a password and, if its hash is outdated, return a replacement hash."""
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+
+def _get_password_executor() -> ThreadPoolExecutor:
+    """Return this process's hashing pool; bcrypt releases the GIL while it runs."""
+    global _password_executor, _password_executor_pid
+    pid = os.getpid()
+    if _password_executor_pid != pid:
+        with _password_executor_lock:
+            if _password_executor_pid != pid:
+                _password_executor = ThreadPoolExecutor(
+                    max_workers=PASSWORD_HASH_WORKERS,
+                    thread_name_prefix="password-hash",
+                )
+                _password_executor_pid = pid
+    return _password_executor
+
+
+def _release_password_job(_future):
+    global _pending_password_jobs
+    with _pending_password_jobs_lock:
+        _pending_password_jobs -= 1
+
+
+async def _run_password_job(function, *args):
+    global _pending_password_jobs
+    with _pending_password_jobs_lock:
+        if _pending_password_jobs >= PASSWORD_HASH_MAX_PENDING:
+            raise PasswordHasherBusyError("Too many password operations in progress")
+        _pending_password_jobs += 1
+
+    try:
+        future = _get_password_executor().submit(function, *args)
+    except BaseException:
+        _release_password_job(None)
+        raise
+    # The slot is freed when the job itself finishes: a caller that goes away
+    # (e.g. the client disconnected) does not stop bcrypt running in the pool
+    future.add_done_callback(_release_password_job)
+    return await asyncio.wrap_future(future)
+
+
+async def async_get_password_hash(password: str) -> str:
+    return await _run_password_job(get_password_hash, password)
+
+
+async def async_verify_password(plain_password: str, hashed_password: str) -> bool:
+    return await _run_password_job(verify_password, plain_password, hashed_password)
+
+
+async def async_verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> Tuple[bool, Optional[str]]:
+    return await _run_password_job(
+        verify_and_update_password, plain_password, hashed_password
+    )
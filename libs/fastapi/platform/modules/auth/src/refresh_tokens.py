@@ -0,0 +1,24 @@
+from datetime import datetime, timezone
+
+
+class InMemoryRefreshTokenStore:
+    """Process-local stand-in for ``AsyncRefreshTokensOperations``."""
+
+    def __init__(self):
+        self._tokens: dict[str, tuple[str, datetime]] = {}
+
+    async def save(self, jti: str, user_id: str, expires_at: datetime):
+        self._tokens[jti] = (str(user_id), expires_at)
+
+    async def consume(self, jti: str, user_id: str) -> bool:
+        entry = self._tokens.get(jti)
+        if entry is None or entry[0] != str(user_id):
+            return False
+        del self._tokens[jti]
+        return entry[1] > datetime.now(timezone.utc)
+
+    async def revoke_user(self, user_id: str) -> int:
+        jtis = [jti for jti, entry in self._tokens.items() if entry[0] == str(user_id)]
+        for jti in jtis:
+            del self._tokens[jti]
+        return len(jtis)
@@ -0,0 +1,45 @@
+import time
+from typing import Awaitable, Callable
+
+from libs.utils.common.custom_logger.src import CustomLogger
+
+log = CustomLogger("RevocationList", is_request=False)
+logger, listener = log.get_logger()
+listener.start()
+
+RevocationsLoader = Callable[[], Awaitable[tuple[dict[str, float], set[str]]]]
+
+
+class RevocationList:
+    """Per-process snapshot of revoked users and token ids.
+
+    The snapshot is reloaded at most once every ``refresh_seconds``, so
+    checking a token never waits on the database except for that reload.
+    """
+
+    def __init__(self, loader: RevocationsLoader, refresh_seconds: float):
+        self._loader = loader
+        self.refresh_seconds = refresh_seconds
+        self._users: dict[str, float] = {}
+        self._tokens: set[str] = set()
+        self._refreshed_at = None
+
+    async def refresh_if_stale(self):
+        now = time.monotonic()
+        if (
+            self._refreshed_at is not None
+            and now - self._refreshed_at < self.refresh_seconds
+        ):
+            return
+        # Claim the refresh first so concurrent requests keep the old snapshot
+        self._refreshed_at = now
+        try:
+            self._users, self._tokens = await self._loader()
+        except Exception as error:
+            logger.error(f"Failed to refresh the revocation list: {error}")
+
+    def is_revoked(self, claims: dict) -> bool:
+        if claims.get("jti") in self._tokens:
+            return True
+        revoked_at = self._users.get(str(claims.get("user_id")))
+        return revoked_at is not None and claims.get("iat", 0) <= revoked_at
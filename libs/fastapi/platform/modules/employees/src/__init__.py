@@ -1,5 +1,15 @@
+from libs.fastapi.platform.modules.employees.src.bulk_import import (
+    iter_import_rows,
+)
 from libs.fastapi.platform.modules.employees.src.helpers import (
+    EMPLOYEE_RECORD_PROJECTION,
+    EmployeeNotFoundError,
     format_employee_record,
 )
 
-__all__ = ["format_employee_record"]
+__all__ = [
+    "EMPLOYEE_RECORD_PROJECTION",
+    "EmployeeNotFoundError",
+    "format_employee_record",
+    "iter_import_rows",
+]
@@ -0,0 +1,67 @@
+import csv
+import json
+from typing import AsyncIterator, Optional, Tuple
+
+NDJSON_CONTENT_TYPES = {"application/x-ndjson", "application/ndjson"}
+CSV_CONTENT_TYPES = {"text/csv", "application/csv"}
+
+# (row number, parsed record, parse error)
+ImportRow = Tuple[int, Optional[dict], Optional[str]]
+
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """Split a byte stream into decoded lines without buffering the whole body."""
+    buffer = b""
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            yield line.decode("utf-8", errors="replace").rstrip("\r")
+    if buffer:
+        yield buffer.decode("utf-8", errors="replace").rstrip("\r")
+
+
+async def iter_ndjson_rows(chunks: AsyncIterator[bytes]) -> AsyncIterator[ImportRow]:
+    row = 0
+    async for line in iter_lines(chunks):
+        if not line.strip():
+            continue
+        row += 1
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as error:
+            yield row, None, f"Invalid JSON: {error.msg}"
+            continue
+        if not isinstance(record, dict):
+            yield row, None, "Expected a JSON object"
+            continue
+        yield row, record, None
+
+
+async def iter_csv_rows(chunks: AsyncIterator[bytes]) -> AsyncIterator[ImportRow]:
+    """Parse CSV with a header row; quoted fields may not contain newlines."""
+    header = None
+    row = 0
+    async for line in iter_lines(chunks):
+        if not line.strip():
+            continue
+        values = next(csv.reader([line]))
+        if header is None:
+            header = [column.strip().lstrip("\ufeff") for column in values]
+            continue
+        row += 1
+        if len(values) != len(header):
+            yield row, None, f"Expected {len(header)} columns, got {len(values)}"
+            continue
+        yield row, dict(zip(header, values)), None
+
+
+def iter_import_rows(
+    chunks: AsyncIterator[bytes], content_type: str
+) -> AsyncIterator[ImportRow]:
+    media_type = content_type.split(";")[0].strip().lower()
+    if media_type in NDJSON_CONTENT_TYPES:
+        return iter_ndjson_rows(chunks)
+    if media_type in CSV_CONTENT_TYPES:
+        return iter_csv_rows(chunks)
+    raise ValueError(f"Unsupported content type '{media_type}', expected NDJSON or CSV")
@@ -1,3 +1,14 @@
+from libs.utils.enums.src import DepartmentType, RoleType
+
+# Fields read by ``format_employee_record``; also what list cursors need
+EMPLOYEE_RECORD_FIELDS = ("name", "email", "department", "role", "date_joined")
+EMPLOYEE_RECORD_PROJECTION = {field: 1 for field in EMPLOYEE_RECORD_FIELDS}
+
+
+class EmployeeNotFoundError(ValueError):
+    """No active employee matched the requested id."""
+
+
 def format_employee_record(employee_data, employee_id):
     return {
         "id": str(employee_id),
@@ -9,10 +20,14 @@ def format_employee_record(employee_data, employee_id):
     }
 
 
-def format_employee_list_record(employee_list, total, page, page_size):
+def format_employee_list_record(
+    employee_list, total, page, page_size, next_cursor=None
+):
     employees = []
 
-    total_pages = (total + page_size - 1) // page_size if page_size > 0 else 0
+    total_pages = None
+    if page is not None and total is not None:
+        total_pages = (total + page_size - 1) // page_size if page_size > 0 else 0
     for employee in employee_list:
         employees.append(format_employee_record(employee, employee.get("_id")))
 
@@ -22,4 +37,38 @@ def format_employee_list_record(employee_list, total, page, page_size):
         "page": page,
         "page_size": page_size,
         "total_pages": total_pages,
+        "next_cursor": next_cursor,
+    }
+
+
+def format_headcount_report(headcounts):
+    """Totals per department and per role from (department, role) counters."""
+    by_department = {department.value: 0 for department in DepartmentType}
+    by_role = {role.value: 0 for role in RoleType}
+    items = []
+    for headcount in headcounts:
+        department, role, count = (
+            headcount.get("department"),
+            headcount.get("role"),
+            headcount.get("count", 0),
+        )
+        by_department[department] = by_department.get(department, 0) + count
+        by_role[role] = by_role.get(role, 0) + count
+        items.append({"department": department, "role": role, "count": count})
+
+    return {
+        "total": sum(by_department.values()),
+        "by_department": by_department,
+        "by_role": by_role,
+        "items": items,
+    }
+
+
+def format_bulk_result_report(results):
+    succeeded = sum(1 for result in results if result.get("status") != "failed")
+    return {
+        "total": len(results),
+        "succeeded": succeeded,
+        "failed": len(results) - succeeded,
+        "items": results,
     }
@@ -0,0 +1,22 @@
+"""Rebuild the employee headcount counters from the employees collection.
+
+Usage: python -m libs.fastapi.platform.modules.employees.src.reconcile_headcounts
+"""
+
+import asyncio
+
+from libs.utils.db.mongodb.operations.src import (
+    async_employee_headcounts_operations,
+)
+
+
+def main():
+    headcounts = asyncio.run(async_employee_headcounts_operations.reconcile())
+    for headcount in headcounts:
+        print(
+            f"{headcount['department']:>12} {headcount['role']:>10} {headcount['count']:>8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
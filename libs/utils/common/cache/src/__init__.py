@@ -0,0 +1,203 @@
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Optional
+
+import bson
+
+from libs.utils.config.src.cache import CACHE_BACKEND, REDIS_URL
+
+# Returned by a backend when it holds nothing for the key; ``None`` itself
+# is a valid cached value and marks a negative (not found) entry.
+MISSING = object()
+
+# Named caches whose counters are reported by ``get_cache_stats``
+_caches = {}
+
+
+class InMemoryCacheBackend:
+    """Bounded LRU with a per-entry expiry, local to the current process."""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries: OrderedDict = OrderedDict()
+        self._invalidations = 0
+
+    async def get(self, key: str) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return MISSING
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return MISSING
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: Any, ttl_seconds: float) -> None:
+        self._entries[key] = (time.monotonic() + ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    async def delete(self, *keys: str) -> None:
+        self._invalidations += 1
+        for key in keys:
+            self._entries.pop(key, None)
+
+    async def fill_token(self, key: str) -> int:
+        return self._invalidations
+
+    async def fill(self, key: str, value: Any, ttl_seconds: float, token: int) -> bool:
+        """``set`` unless anything was deleted since ``fill_token`` was taken."""
+        if token != self._invalidations:
+            return False
+        await self.set(key, value, ttl_seconds)
+        return True
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class RedisCacheBackend:
+    """Shared backend so every worker sees the same entries and invalidations.
+
+    Values are BSON encoded, which keeps ``ObjectId`` and ``datetime`` intact.
+    Deleting a key also bumps its version; ``fill`` writes only if the version
+    is unchanged, so a load that started before another worker's write can
+    not put the old document back.
+    """
+
+    # Versions must outlive any load in flight when they are bumped
+    VERSION_TTL_MS = 10 * 60 * 1000
+    DELETE_SCRIPT = """
+    for _, key in ipairs(KEYS) do
+        redis.call("DEL", key)
+        redis.call("INCR", key .. "#version")
+        redis.call("PEXPIRE", key .. "#version", ARGV[1])
+    end
+    """
+    FILL_SCRIPT = """
+    if (redis.call("GET", KEYS[1] .. "#version") or "") ~= ARGV[1] then
+        return 0
+    end
+    redis.call("SET", KEYS[1], ARGV[2], "PX", ARGV[3])
+    return 1
+    """
+
+    def __init__(self, client, namespace: str):
+        self.client = client
+        self.namespace = namespace
+
+    def _key(self, key: str) -> str:
+        return f"{self.namespace}:{key}"
+
+    @staticmethod
+    def _ttl_ms(ttl_seconds: float) -> int:
+        return max(1, int(ttl_seconds * 1000))
+
+    async def get(self, key: str) -> Any:
+        data = await self.client.get(self._key(key))
+        if data is None:
+            return MISSING
+        return bson.decode(data)["value"]
+
+    async def set(self, key: str, value: Any, ttl_seconds: float) -> None:
+        await self.client.set(
+            self._key(key),
+            bson.encode({"value": value}),
+            px=self._ttl_ms(ttl_seconds),
+        )
+
+    async def delete(self, *keys: str) -> None:
+        if keys:
+            await self.client.eval(
+                self.DELETE_SCRIPT,
+                len(keys),
+                *(self._key(key) for key in keys),
+                self.VERSION_TTL_MS,
+            )
+
+    async def fill_token(self, key: str) -> str:
+        version = await self.client.get(f"{self._key(key)}#version")
+        return version.decode() if version is not None else ""
+
+    async def fill(self, key: str, value: Any, ttl_seconds: float, token: str) -> bool:
+        """``set`` unless the key was deleted since ``fill_token`` was taken."""
+        filled = await self.client.eval(
+            self.FILL_SCRIPT,
+            1,
+            self._key(key),
+            token,
+            bson.encode({"value": value}),
+            self._ttl_ms(ttl_seconds),
+        )
+        return bool(filled)
+
+
+class ReadThroughCache:
+    """Serve reads from ``backend`` and fall back to ``loader`` on a miss.
+
+    Loaders returning ``None`` are cached for ``negative_ttl_seconds`` so that
+    repeated lookups of missing ids do not reach the database either.
+    """
+
+    def __init__(
+        self,
+        backend,
+        ttl_seconds: float,
+        negative_ttl_seconds: float,
+        name: Optional[str] = None,
+    ):
+        self.name = name
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        if name is not None:
+            _caches[name] = self
+
+    async def get_or_load(
+        self, key: str, loader: Callable[[], Awaitable[Optional[Any]]]
+    ) -> Optional[Any]:
+        value = await self.backend.get(key)
+        if value is not MISSING:
+            self.hits += 1
+            return value
+
+        self.misses += 1
+        # If a write invalidates the key while we load, what we read may be
+        # stale; the backend then skips the fill
+        token = await self.backend.fill_token(key)
+        value = await loader()
+        ttl_seconds = (
+            self.ttl_seconds if value is not None else self.negative_ttl_seconds
+        )
+        if ttl_seconds > 0:
+            await self.backend.fill(key, value, ttl_seconds, token)
+        return value
+
+    async def invalidate(self, *keys: str) -> None:
+        await self.backend.delete(*keys)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
+
+
+def get_cache_stats() -> dict:
+    """Hit and miss counters of every named cache in this process."""
+    return {name: cache.stats() for name, cache in _caches.items()}
+
+
+def create_cache_backend(namespace: str, max_size: int):
+    """Build the backend selected by ``CACHE_BACKEND``."""
+    if CACHE_BACKEND == "redis":
+        from redis.asyncio import Redis
+
+        return RedisCacheBackend(Redis.from_url(REDIS_URL), namespace)
+    return InMemoryCacheBackend(max_size)
@@ -6,6 +6,7 @@ from libs.utils.config.src.fastapi import FRONTEND_APP_URL
 CHILD_SUPPORT_PAYER_WALLET_NAME = "Child Support Wallet - Payer"
 CHILD_SUPPORT_RECIPIENT_WALLET_NAME = "Child Support Wallet - Recipient"
 FUZZY_SEARCH_TOP_N = 10
+EMPLOYEE_BULK_CHUNK_SIZE = 1000
 
 FRONTEND_SIGNUP_URL = f"{FRONTEND_APP_URL}/signup/user"
 FRONTEND_FORGET_PASSWORD_URL = f"{FRONTEND_APP_URL}/forgot-password"
@@ -2,27 +2,29 @@ import inspect
 import logging
 import logging.config
 import queue
+import sys
 import traceback
 from datetime import datetime, timezone
 from functools import wraps
-from logging.handlers import QueueListener
 from os import getcwd, path
 
 from libs.utils.common.custom_logger.src.constants import Colors
 from libs.utils.common.custom_logger.src.enums import LogType
 from libs.utils.common.custom_logger.src.handlers import (
+    ForkSafeQueueListener,
     RequestDetailsFilter,
     console_handler,
     dynamic_file_handler,
     teams_handler,
 )
 from libs.utils.common.custom_logger.src.helper import (
+    CallSite,
     color_string,
+    get_call_site,
     get_callee_class_name,
-    get_frame_info,
     get_serialized_args,
     get_serialized_kwargs,
-    get_serialized_result,
+    log_serializer,
     serialize_args_kwargs,
 )
 from libs.utils.common.date_time.src import (
@@ -30,6 +32,7 @@ from libs.utils.common.date_time.src import (
     get_execution_time_in_seconds,
 )
 from libs.utils.config.src.logger import (
+    LOG_LEVEL,
     MS_TEAMS_WEBHOOK_ENABLED,
 )
 
@@ -58,7 +61,7 @@ class CustomLogger:
     ):
         logger = logging.getLogger(self.logger_name)
 
-        logger.setLevel(logging.DEBUG)
+        logger.setLevel(LOG_LEVEL)
 
         request_id_filter = RequestDetailsFilter(is_request=self.is_request)
         logger.addFilter(request_id_filter)
@@ -78,7 +81,9 @@ class CustomLogger:
             queue_handler = logging.handlers.QueueHandler(log_queue)
             logger.addHandler(queue_handler)
 
-            listener = QueueListener(log_queue, *_handlers, respect_handler_level=True)
+            listener = ForkSafeQueueListener(
+                queue_handler, *_handlers, respect_handler_level=True
+            )
             return logger, listener
 
         for _handler in _handlers:
@@ -88,26 +93,23 @@ class CustomLogger:
 
     def log_function_call(
         self,
-        frame_info: traceback,
+        call_site: CallSite,
         function,
+        class_name: str,
         args: dict,
         kwargs: dict,
         callee_class_name: str,
     ):
-        class_name = None
-        qual_name = function.__qualname__.split(".")
-        if len(qual_name) > 1:
-            class_name = qual_name[0]
         extra = {
             "logType": LogType.FUNCTION_INVOKE.value,
-            "calleeFunctionName": frame_info.function,
+            "calleeFunctionName": call_site.function,
             "calleeClassName": callee_class_name,
             "arguments": args,
             "kwargs": kwargs,
-            "fileName": frame_info.filename.split("/")[-1],
-            "filePath": path.relpath(frame_info.filename, getcwd()),
-            "line": frame_info.lineno,
-            "column": frame_info.positions.col_offset,
+            "fileName": call_site.filename.split("/")[-1],
+            "filePath": path.relpath(call_site.filename, getcwd()),
+            "line": call_site.lineno,
+            "column": call_site.col_offset,
             "className": class_name,
             "functionName": function.__name__,
             "qualname": function.__qualname__,
@@ -118,8 +120,9 @@ class CustomLogger:
 
     def log_function_error(
         self,
-        frame_info: traceback,
+        call_site: CallSite,
         function,
+        class_name: str,
         start_time: datetime,
         error: Exception,
         callee_class_name: str,
@@ -129,18 +132,14 @@ class CustomLogger:
             f"({convert_ms_to_readable_format(execution_time_ms)})",
             Colors.BOLD_GOLD,
         )
-        class_name = None
-        qual_name = function.__qualname__.split(".")
-        if len(qual_name) > 1:
-            class_name = qual_name[0]
         extra = {
             "logType": LogType.FUNCTION_RETURN.value,
-            "calleeFunctionName": frame_info.function,
+            "calleeFunctionName": call_site.function,
             "calleeClassName": callee_class_name,
-            "fileName": frame_info.filename.split("/")[-1],
-            "filePath": path.relpath(frame_info.filename, getcwd()),
-            "line": frame_info.lineno,
-            "column": frame_info.positions.col_offset,
+            "fileName": call_site.filename.split("/")[-1],
+            "filePath": path.relpath(call_site.filename, getcwd()),
+            "line": call_site.lineno,
+            "column": call_site.col_offset,
             "className": class_name,
             "functionName": function.__name__,
             "qualname": function.__qualname__,
@@ -152,29 +151,31 @@ class CustomLogger:
         self.root_logger.error(f"{error}", extra=extra)
 
     def log_function_return(
-        self, frame_info: traceback, function, start_time: datetime, result: any
+        self,
+        call_site: CallSite,
+        function,
+        class_name: str,
+        start_time: datetime,
+        result: any,
     ):
         execution_time_ms = get_execution_time_in_seconds(start_time) * 1000
         execution_time = color_string(
             f"({convert_ms_to_readable_format(execution_time_ms)})",
             Colors.BOLD_GOLD,
         )
-        class_name = None
-        qual_name = function.__qualname__.split(".")
-        if len(qual_name) > 1:
-            class_name = qual_name[0]
 
-        serialized_result = get_serialized_result(result)
+        returns = log_serializer.to_json_safe(result)
+        serialized_result = log_serializer.encode(returns)
 
         extra = {
             "logType": LogType.FUNCTION_RETURN.value,
-            "fileName": frame_info.filename.split("/")[-1],
-            "filePath": path.relpath(frame_info.filename, getcwd()),
-            "line": frame_info.lineno,
-            "column": frame_info.positions.col_offset,
+            "fileName": call_site.filename.split("/")[-1],
+            "filePath": path.relpath(call_site.filename, getcwd()),
+            "line": call_site.lineno,
+            "column": call_site.col_offset,
             "className": class_name,
             "functionName": function.__name__,
-            "returns": result,
+            "returns": returns,
             "executionTimeMs": execution_time_ms,
             "executionTime": execution_time,
             "qualname": function.__qualname__,
@@ -183,37 +184,59 @@ class CustomLogger:
         self.root_logger.debug("Function returned", extra=extra)
 
     def track(self, func):
+        """Log calls to ``func`` with their arguments, result and duration.
+
+        Everything that does not change between calls is worked out here,
+        once. Per call, the caller's frame is taken with ``sys._getframe`` and
+        only inspected when a record is actually emitted; with DEBUG disabled
+        the wrapper only times the call, so that failures are still logged.
+        """
+        params = tuple(inspect.signature(func).parameters)
+        qual_name = func.__qualname__.split(".")
+        class_name = qual_name[0] if len(qual_name) > 1 else None
+
+        def log_call(caller, args, kwargs):
+            args_dict, kwargs_dict = serialize_args_kwargs(args, kwargs, params)
+            self.log_function_call(
+                get_call_site(caller),
+                func,
+                class_name,
+                args_dict,
+                kwargs_dict,
+                get_callee_class_name(caller),
+            )
+
+        def log_error(caller, start_time, error):
+            print(color_string(traceback.format_exc(), Colors.BRIGHT_RED))
+            self.log_function_error(
+                get_call_site(caller),
+                func,
+                class_name,
+                start_time,
+                error,
+                get_callee_class_name(caller),
+            )
+
         if inspect.iscoroutinefunction(func):
 
             @wraps(func)
             async def async_wrapper(*args, **kwargs):
                 start_time = datetime.now(timezone.utc)
+                caller = sys._getframe(1)
+                debug = self.root_logger.isEnabledFor(logging.DEBUG)
+                if debug:
+                    log_call(caller, args, kwargs)
 
-                params = inspect.signature(func).parameters
-
-                args_dict, kwargs_dict = serialize_args_kwargs(args, kwargs, params)
-
-                callee_class_name = get_callee_class_name(inspect)
-
-                self.log_function_call(
-                    get_frame_info(inspect),
-                    func,
-                    args_dict,
-                    kwargs_dict,
-                    callee_class_name,
-                )
-
-                frame_info = get_frame_info(inspect)
                 try:
                     result = await func(*args, **kwargs)
                 except Exception as error:
-                    print(color_string(traceback.format_exc(), Colors.BRIGHT_RED))
-                    self.log_function_error(
-                        frame_info, func, start_time, error, callee_class_name
-                    )
+                    log_error(caller, start_time, error)
                     raise
 
-                self.log_function_return(frame_info, func, start_time, result)
+                if debug:
+                    self.log_function_return(
+                        get_call_site(caller), func, class_name, start_time, result
+                    )
                 return result
 
             return async_wrapper
@@ -223,33 +246,21 @@ class CustomLogger:
             @wraps(func)
             def sync_wrapper(*args, **kwargs):
                 start_time = datetime.now(timezone.utc)
-
-                params = inspect.signature(func).parameters
-
-                args_dict, kwargs_dict = serialize_args_kwargs(args, kwargs, params)
-
-                callee_class_name = get_callee_class_name(inspect)
-
-                self.log_function_call(
-                    get_frame_info(inspect),
-                    func,
-                    args_dict,
-                    kwargs_dict,
-                    callee_class_name,
-                )
-
-                frame_info = get_frame_info(inspect)
+                caller = sys._getframe(1)
+                debug = self.root_logger.isEnabledFor(logging.DEBUG)
+                if debug:
+                    log_call(caller, args, kwargs)
 
                 try:
                     result = func(*args, **kwargs)
                 except Exception as error:
-                    print(color_string(traceback.format_exc(), Colors.BRIGHT_RED))
-                    self.log_function_error(
-                        frame_info, func, start_time, error, callee_class_name
-                    )
+                    log_error(caller, start_time, error)
                     raise
 
-                self.log_function_return(frame_info, func, start_time, result)
+                if debug:
+                    self.log_function_return(
+                        get_call_site(caller), func, class_name, start_time, result
+                    )
                 return result
 
             return sync_wrapper
@@ -0,0 +1,120 @@
+"""Measure the per-call overhead that ``@log.track`` adds to a function.
+
+Usage: python -m libs.utils.common.custom_logger.src.benchmark --page-size 1 100 10000
+
+``legacy`` repeats the per-call inspection the decorator used to do (a fresh
+``inspect.signature``, ``inspect.stack()`` and two ``inspect.getframeinfo``
+calls) in front of the same log records, for comparison.
+"""
+
+import argparse
+import inspect
+import logging
+import time
+from datetime import datetime, timezone
+from functools import wraps
+
+from libs.utils.common.custom_logger.src import CustomLogger
+from libs.utils.common.custom_logger.src.helper import (
+    CallSite,
+    serialize_args_kwargs,
+)
+
+
+def legacy_track(log: CustomLogger, func):
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        start_time = datetime.now(timezone.utc)
+        params = inspect.signature(func).parameters
+        args_dict, kwargs_dict = serialize_args_kwargs(args, kwargs, params)
+        stack = inspect.stack()
+        callee_class_name = (
+            stack[1][0].f_locals["self"].__class__.__name__
+            if "self" in stack[1][0].f_locals
+            else None
+        )
+        inspect.getframeinfo(inspect.currentframe().f_back)
+        frame_info = inspect.getframeinfo(inspect.currentframe().f_back)
+        call_site = CallSite(
+            frame_info.function,
+            frame_info.filename,
+            frame_info.lineno,
+            frame_info.positions.col_offset,
+        )
+        log.log_function_call(
+            call_site, func, None, args_dict, kwargs_dict, callee_class_name
+        )
+        result = func(*args, **kwargs)
+        log.log_function_return(call_site, func, None, start_time, result)
+        return result
+
+    return wrapper
+
+
+def make_list_employees(page_size: int):
+    page = [
+        {"_id": str(number), "name": "Alice Johnson", "department": "HR"}
+        for number in range(page_size)
+    ]
+
+    def list_employees(employee_id: str, projection: dict = None):
+        return page
+
+    return list_employees
+
+
+def measure(func, iterations: int) -> float:
+    """Mean seconds per call over ``iterations`` calls, best of five runs."""
+    runs = []
+    for _ in range(5):
+        started = time.perf_counter()
+        for _ in range(iterations):
+            func("65f1c0ffee", projection={"name": 1})
+        runs.append((time.perf_counter() - started) / iterations)
+    return min(runs)
+
+
+def benchmark_track(iterations: int, page_size: int) -> list[dict]:
+    log = CustomLogger("TrackBenchmark", is_request=False)
+    # Records are built as in production but dropped instead of written out
+    log.root_logger.handlers = [logging.NullHandler()]
+
+    list_employees = make_list_employees(page_size)
+    baseline = measure(list_employees, iterations)
+    results = []
+    for name, level, func in (
+        ("legacy", logging.DEBUG, legacy_track(log, list_employees)),
+        ("debug", logging.DEBUG, log.track(list_employees)),
+        ("info", logging.INFO, log.track(list_employees)),
+    ):
+        log.root_logger.setLevel(level)
+        per_call = measure(func, iterations)
+        results.append(
+            {
+                "mode": name,
+                "per_call_us": per_call * 1e6,
+                "overhead_us": (per_call - baseline) * 1e6,
+            }
+        )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=2000)
+    # Logged results are cut short at LOG_SERIALIZE_MAX_ITEMS/_BYTES, so the
+    # overhead should stop growing with the page size
+    parser.add_argument("--page-size", type=int, nargs="+", default=[1])
+    args = parser.parse_args()
+
+    print(f"{'page':>6} {'mode':>8} {'per call us':>12} {'overhead us':>12}")
+    for page_size in args.page_size:
+        for result in benchmark_track(args.iterations, page_size):
+            print(
+                f"{page_size:>6} {result['mode']:>8} {result['per_call_us']:>12.2f} "
+                f"{result['overhead_us']:>12.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
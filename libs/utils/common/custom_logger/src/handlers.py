@@ -1,9 +1,11 @@
 import json
 import logging
 import os
+import queue
 import sys
+import weakref
 from datetime import datetime, timezone
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from time import sleep
 
 from pymsteams import connectorcard
@@ -162,11 +164,65 @@ class DynamicFileHandler(RotatingFileHandler):
     def __init__(self, *args, **kwargs):
         self.base_directory = os.path.join(BASE_DIR, "logs")
         os.makedirs(self.base_directory, exist_ok=True)
-        log_filename = f"history.{os.getpid()}.log"
         # Initialize with a default file
-        super().__init__(
-            os.path.join(self.base_directory, log_filename), *args, **kwargs
-        )
+        super().__init__(self.path_for_current_process(), *args, **kwargs)
+
+    def path_for_current_process(self) -> str:
+        return os.path.join(self.base_directory, f"history.{os.getpid()}.log")
+
+    def reopen_for_current_process(self):
+        """Write to this process's own file instead of the one inherited on fork."""
+        self.acquire()
+        try:
+            if self.stream:
+                self.stream.close()
+            # Reopened on the next emit
+            self.stream = None
+            self.baseFilename = self.path_for_current_process()
+        finally:
+            self.release()
+
+
+_started_listeners = weakref.WeakSet()
+
+
+class ForkSafeQueueListener(QueueListener):
+    """QueueListener that can be started again in a forked child process.
+
+    Its thread is not copied into a child, so records queued there would never
+    be written; ``restart_after_fork`` gives the child a new queue and thread.
+    """
+
+    def __init__(self, queue_handler: QueueHandler, *handlers, **kwargs):
+        super().__init__(queue_handler.queue, *handlers, **kwargs)
+        self.queue_handler = queue_handler
+
+    def start(self):
+        super().start()
+        _started_listeners.add(self)
+
+    def stop(self):
+        super().stop()
+        _started_listeners.discard(self)
+
+    def restart_after_fork(self):
+        # The parent's thread may have held the old queue's lock when it forked
+        self.queue = self.queue_handler.queue = queue.Queue()
+        # Nothing to join: the thread this refers to only exists in the parent
+        self._thread = None
+        self.start()
+
+
+def reinit_logging_after_fork():
+    """Give a forked process its own log file and queue listener threads.
+
+    Call it in the child right after forking, e.g. from gunicorn's
+    ``post_fork`` hook when the app is preloaded in the master.
+    """
+    if isinstance(dynamic_file_handler, DynamicFileHandler):
+        dynamic_file_handler.reopen_for_current_process()
+    for listener in list(_started_listeners):
+        listener.restart_after_fork()
 
 
 class CustomJsonFormatter(logging.Formatter):
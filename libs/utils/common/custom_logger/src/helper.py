@@ -1,18 +1,19 @@
 import json
 import os
-from collections.abc import Iterable, Mapping
+from collections.abc import Callable, Iterable, Mapping, Sized
 from datetime import date, datetime
 from decimal import Decimal
 from enum import Enum
-from json import dumps
+from itertools import islice
 from os import getcwd, path
 from pathlib import Path
+from typing import NamedTuple
 from uuid import UUID
 
 from pydantic import BaseModel
-from starlette.requests import Request
+from starlette.datastructures import Headers, ImmutableMultiDict
+from starlette.requests import HTTPConnection, Request
 from starlette.responses import JSONResponse, Response
-from starlette.routing import Match
 
 from libs.utils.common.custom_logger.src.constants import Colors
 from libs.utils.common.custom_logger.src.enums import LogType
@@ -20,6 +21,15 @@ from libs.utils.common.date_time.src import (
     convert_ms_to_readable_format,
     get_execution_time_in_seconds,
 )
+from libs.utils.config.src.logger import (
+    LOG_SERIALIZE_MAX_BYTES,
+    LOG_SERIALIZE_MAX_ITEMS,
+)
+
+try:
+    import orjson
+except ImportError:  # optional; the standard json module is used instead
+    orjson = None
 
 
 def color_string(message, color: Colors = Colors.CYAN):
@@ -35,6 +45,8 @@ def extra_details_for_req(
     response_body=None,
     start_time: datetime = None,
     sendInTeams: bool = False,
+    response_size: int = None,
+    request_size: int = None,
 ):
     frame = inspect.currentframe().f_back
     frame_info = inspect.getframeinfo(frame)
@@ -50,20 +62,16 @@ def extra_details_for_req(
         "sendInTeams": sendInTeams,
     }
     if request:
-        routes = request.app.router.routes
-        path_params = dict()
-        query_params = dict()
-        for route in routes:
-            match, scope = route.matches(request)
-            if match == Match.FULL:
-                path_params = scope.get("path_params")
-                query_params = scope.get("query_params")
-
-        args = request_body.copy()
-        if "assistant_name" in args:
-            args.pop("assistant_name")
-        if "user_id" in args:
-            args.pop("user_id")
+        # The router records its match in the scope; before routing (when the
+        # request starts) there are no path params or route yet
+        route = request.scope.get("route")
+
+        # One filtered copy serves both the summary line and the body field
+        args = {
+            key: _redact_key(key, value)
+            for key, value in (request_body or {}).items()
+            if key not in {"assistant_name", "user_id"}
+        }
 
         req_data = {
             "logType": LogType.REQUEST_INIT.value,
@@ -72,9 +80,11 @@ def extra_details_for_req(
                 "method": request.method,
                 "path": request.url.path,
                 "headers": dict(request.headers),
-                "body": dict(request_body),
-                "params": path_params,
-                "query": query_params,
+                "body": args,
+                "bodySize": request_size,
+                "route": getattr(route, "path", None),
+                "params": request.scope.get("path_params", {}),
+                "query": dict(request.query_params),
                 "calleeDetails": {
                     "host": request.client.host,
                     "port": request.client.port,
@@ -96,6 +106,7 @@ def extra_details_for_req(
                 "statusCode": response.status_code,
                 "headers": dict(response.headers),
                 "body": response_body,
+                "bodySize": response_size,
                 "executionTimeMs": execution_time_ms,
                 "executionTime": execution_time,
             },
@@ -105,62 +116,34 @@ def extra_details_for_req(
     return extra
 
 
-def get_serialized_args(args: any):
-    try:
-        if isinstance(args, dict):
-            return {
-                key: (
-                    {
-                        k: v.value
-                        for k, v in value.model_dump().items()
-                        if isinstance(v, Enum)
-                    }
-                    if isinstance(value, BaseModel)
-                    else value
-                )
-                for key, value in args.items()
-                if key not in {"assistant_name", "user_id"}
-            }
-        elif isinstance(args, list):
-            return dumps(args)
-    except Exception as e:
-        print(f"Error while serializing args: {e}")
-        return str(args)
-
-
-def get_serialized_kwargs(kwargs: any):
-    def remove_sensitive_keys(data):
-        if isinstance(data, dict):
-            return {
-                key: remove_sensitive_keys(value)
-                for key, value in data.items()
-                if key not in {"assistant_name", "user_id"}
-            }
-        return data
-
-    try:
-        if isinstance(kwargs, dict):
-            return {
-                key: (
-                    value.model_dump()
-                    if isinstance(value, BaseModel)
-                    else remove_sensitive_keys(value)
-                )
-                for key, value in kwargs.items()
-                if key not in ["assistant_name", "user_id"]
-            }
-        elif isinstance(kwargs, list):
-            return dumps(kwargs)
-    except Exception as e:
-        print(f"Error while serializing kwargs: {e}")
-        return str(kwargs)
+def log_request_body(endpoint):
+    """Opt a route in to having its JSON request body parsed for the request log.
+
+    Other routes only log the body's size; their bodies are never parsed by
+    the logging middleware.
+    """
+    endpoint.log_request_body = True
+    return endpoint
+
+
+def get_serialized_args(args: dict) -> str:
+    """Encode arguments already made safe by ``serialize_args_kwargs``."""
+    return log_serializer.encode(args)
+
+
+def get_serialized_kwargs(kwargs: dict) -> str:
+    """Encode keyword arguments already made safe by ``serialize_args_kwargs``."""
+    return log_serializer.encode(kwargs)
 
 
 # --- knobs you can tune ---
 _MAX_DEPTH = 4
-_MAX_ITEMS_PER_CONTAINER = 200
 _MAX_STRING_LENGTH = 5000
 _SAMPLE_ITEMS = 3
+# rough encoded size charged for numbers, booleans and null
+_SCALAR_BYTES = 8
+# never logged, at any depth
+_OMIT_KEYS = {"assistant_name", "user_id"}
 # redact these keys anywhere they appear
 _REDACT_KEYS = {
     "password",
@@ -169,6 +152,12 @@ _REDACT_KEYS = {
     "refresh_token",
     "secret",
     "token",
+    # credential headers
+    "authorization",
+    "proxy-authorization",
+    "cookie",
+    "set-cookie",
+    "x-api-key",
 }
 # keys we’ll auto-summarize (count + sample) when they’re large lists
 _SUMMARIZE_KEYS = {"user_details", "wallets", "rules", "transactions"}
@@ -190,240 +179,313 @@ _SAFE_ORM_FIELDS = {
 }
 
 
-def _is_sa_model(obj) -> bool:
-    # cheap check; avoids importing sqlalchemy in your logger
-    return hasattr(obj, "_sa_instance_state") or hasattr(obj, "__mapper__")
-
-
-def _orm_minimal(obj):
-    """Return a small, safe snapshot for a SQLAlchemy model."""
-    out = {"<type>": obj.__class__.__name__}
-    # try to read common fields without triggering lazy loads
-    for k in _SAFE_ORM_FIELDS:
-        if hasattr(obj, k):
-            try:
-                v = getattr(obj, k)
-            except Exception:
-                continue
-            out[k] = _to_json_safe(v, _depth=1)  # shallow
-    # always include primary key-ish if available
-    if "id" not in out:
-        # best-effort string repr as last resort
-        out["id"] = getattr(obj, "id", repr(obj))
-    return out
-
-
 def _redact_key(k: str, v):
     if k.lower() in _REDACT_KEYS:
         return "***redacted***"
     return v
 
 
-def _truncate_str(s: str) -> str:
-    return s if len(s) <= _MAX_STRING_LENGTH else s[:_MAX_STRING_LENGTH] + "…"
+class SerializationBudget:
+    """Items and bytes one log payload may still spend; shared across values."""
+
+    __slots__ = ("items", "bytes")
 
+    def __init__(self, items: int, bytes: int):
+        self.items = items
+        self.bytes = bytes
 
-def _to_json_safe(obj, *, _seen=None, _path="$", _depth=0):
-    if _seen is None:
-        _seen = {}
+    @property
+    def exhausted(self) -> bool:
+        return self.items <= 0 or self.bytes <= 0
 
-    # depth cap
-    if _depth > _MAX_DEPTH:
-        return f"<max_depth at {_path}>"
 
-    # primitives
-    if obj is None or isinstance(obj, (bool, int, float)):
+class LogSerializer:
+    """Turn arbitrary values into JSON-safe data for log records, within a budget.
+
+    Every value visited spends one item and roughly its encoded size in bytes;
+    once either runs out the walk stops and leaves a ``<truncated>`` marker, so
+    logging a large result costs about the same as logging a small one. How
+    each type is encoded is worked out once per type and cached.
+    """
+
+    def __init__(
+        self,
+        max_items: int = LOG_SERIALIZE_MAX_ITEMS,
+        max_bytes: int = LOG_SERIALIZE_MAX_BYTES,
+    ):
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self._encoders: dict[type, Callable] = {}
+
+    def budget(self) -> SerializationBudget:
+        return SerializationBudget(self.max_items, self.max_bytes)
+
+    def to_json_safe(self, obj, budget: SerializationBudget = None):
+        """JSON-safe copy of ``obj``; pass one ``budget`` to share it across calls."""
+        return self._walk(obj, budget or self.budget(), 0, set())
+
+    def encode(self, safe_obj) -> str:
+        """Encode data from ``to_json_safe``, cut to ``max_bytes`` characters."""
+        try:
+            if orjson is None:
+                raise TypeError("orjson is not installed")
+            text = orjson.dumps(safe_obj, default=str).decode("utf-8")
+        except TypeError:
+            # e.g. integers beyond 64 bits, which orjson refuses
+            text = json.dumps(safe_obj, ensure_ascii=False, default=str)
+        if len(text) > self.max_bytes:
+            return text[: self.max_bytes] + "…"
+        return text
+
+    def dumps(self, obj) -> str:
+        try:
+            return self.encode(self.to_json_safe(obj))
+        except Exception as e:
+            return f"<unserializable: {e!r}>"
+
+    def _walk(self, obj, budget, depth, parents):
+        if budget.exhausted:
+            return "<truncated>"
+        budget.items -= 1
+        encoder = self._encoders.get(obj.__class__)
+        if encoder is None:
+            encoder = self._encoders[obj.__class__] = self._resolve(obj.__class__)
+        return encoder(obj, budget, depth, parents)
+
+    def _resolve(self, cls: type) -> Callable:
+        # Enums first: str and int enums would otherwise match below
+        if issubclass(cls, Enum):
+            return self._encode_enum
+        if cls is type(None) or issubclass(cls, (bool, int, float)):
+            return self._encode_scalar
+        if issubclass(cls, str):
+            return self._encode_str
+        if issubclass(cls, (UUID, Path)):
+            return self._encode_as_str
+        if issubclass(cls, (datetime, date)):
+            return self._encode_datetime
+        if issubclass(cls, Decimal):
+            return self._encode_decimal
+        if issubclass(cls, (bytes, bytearray)):
+            return self._encode_bytes
+        if issubclass(cls, BaseModel):
+            return self._encode_model
+        if issubclass(cls, JSONResponse):
+            return self._encode_response
+        # cheap check; avoids importing sqlalchemy in your logger
+        if hasattr(cls, "__mapper__") or hasattr(cls, "_sa_class_manager"):
+            return self._encode_orm
+        if issubclass(cls, HTTPConnection):
+            return self._encode_connection
+        if issubclass(cls, Mapping):
+            if issubclass(cls, (dict, Headers, ImmutableMultiDict)):
+                return self._encode_mapping
+            # Other mappings may be views over far more than their data
+            return self._encode_opaque_mapping
+        if issubclass(cls, Iterable):
+            return self._encode_iterable
+        return self._encode_object
+
+    def _encode_scalar(self, obj, budget, depth, parents):
+        budget.bytes -= _SCALAR_BYTES
         return obj
-    if isinstance(obj, str):
-        return _truncate_str(obj)
-
-    oid = id(obj)
-    if oid in _seen:
-        return {"$ref": _seen[oid]}
-    _seen[oid] = _path
-
-    # common coercions
-    if isinstance(obj, UUID):
-        return str(obj)
-    if isinstance(obj, Enum):
-        return obj.value
-    if isinstance(obj, (datetime, date)):
-        return obj.isoformat()
-    if isinstance(obj, Decimal):
+
+    def _encode_str(self, obj, budget, depth, parents):
+        limit = max(min(_MAX_STRING_LENGTH, budget.bytes), 0)
+        value = obj if len(obj) <= limit else obj[:limit] + "…"
+        budget.bytes -= len(value) + 2
+        return value
+
+    def _encode_as_str(self, obj, budget, depth, parents):
+        return self._encode_str(str(obj), budget, depth, parents)
+
+    def _encode_enum(self, obj, budget, depth, parents):
+        return self._walk(obj.value, budget, depth, parents)
+
+    def _encode_datetime(self, obj, budget, depth, parents):
+        return self._encode_str(obj.isoformat(), budget, depth, parents)
+
+    def _encode_decimal(self, obj, budget, depth, parents):
+        budget.bytes -= _SCALAR_BYTES
         return float(obj)
-    if isinstance(obj, bytes):
+
+    def _encode_bytes(self, obj, budget, depth, parents):
+        head = bytes(obj[: max(min(_MAX_STRING_LENGTH, budget.bytes), 0)])
         try:
-            return _truncate_str(obj.decode("utf-8"))
-        except Exception:
-            return obj.hex()
-    if isinstance(obj, Path):
-        return str(obj)
-    if isinstance(obj, BaseModel):
-        return _to_json_safe(
-            obj.model_dump(), _seen=_seen, _path=f"{_path}<pydantic>", _depth=_depth + 1
-        )
-    if isinstance(obj, JSONResponse):
+            value = head.decode("utf-8")
+        except UnicodeDecodeError:
+            value = head.hex()
+        if len(head) < len(obj):
+            value += "…"
+        budget.bytes -= len(value) + 2
+        return value
+
+    def _encode_model(self, obj, budget, depth, parents):
+        # Fields are read one at a time instead of dumping the whole model
+        fields = obj.__class__.model_fields
+        items = ((name, getattr(obj, name)) for name in fields)
+        return self._encode_items(obj, items, len(fields), budget, depth, parents)
+
+    def _encode_response(self, obj, budget, depth, parents):
         body = obj.body
-        if isinstance(body, (bytes, bytearray)):
-            try:
-                body = body.decode("utf-8")
+        if len(body) > budget.bytes:
+            # Too big to log whole; keep the start rather than parsing it all
+            return self._encode_bytes(body, budget, depth, parents)
+        try:
+            body = json.loads(body)
+        except (ValueError, UnicodeDecodeError):
+            return self._encode_bytes(body, budget, depth, parents)
+        return self._walk(body, budget, depth + 1, parents)
+
+    def _encode_orm(self, obj, budget, depth, parents):
+        """Return a small, safe snapshot for a SQLAlchemy model."""
+        out = {"<type>": obj.__class__.__name__}
+        # try to read common fields without triggering lazy loads
+        for k in _SAFE_ORM_FIELDS:
+            if hasattr(obj, k):
                 try:
-                    body = json.loads(body)
+                    v = getattr(obj, k)
                 except Exception:
-                    pass
-            except Exception:
-                body = body.hex()
-        return _to_json_safe(
-            body, _seen=_seen, _path=f"{_path}<JSONResponse>", _depth=_depth + 1
+                    continue
+                out[k] = self._walk(v, budget, _MAX_DEPTH, parents)  # shallow
+        # always include primary key-ish if available
+        if "id" not in out:
+            out["id"] = repr(obj)
+        return out
+
+    def _encode_connection(self, obj, budget, depth, parents):
+        # A Request is a Mapping over its whole ASGI scope (headers, app,
+        # state); the log only needs to say which request it was
+        summary = {
+            "<type>": obj.__class__.__name__,
+            "method": obj.scope.get("method"),
+            "path": obj.scope.get("path"),
+        }
+        return self._encode_items(
+            obj, summary.items(), len(summary), budget, depth, parents
         )
 
-    # SQLAlchemy model → minimal snapshot
-    if _is_sa_model(obj):
-        return _orm_minimal(obj)
+    def _encode_opaque_mapping(self, obj, budget, depth, parents):
+        budget.bytes -= _SCALAR_BYTES
+        return {"<type>": obj.__class__.__name__, "size": len(obj)}
+
+    def _encode_mapping(self, obj, budget, depth, parents):
+        return self._encode_items(obj, obj.items(), len(obj), budget, depth, parents)
+
+    def _encode_object(self, obj, budget, depth, parents):
+        # objects with __dict__ → shallow snapshot without private/SQLA internals
+        try:
+            attrs = vars(obj)
+        except TypeError:
+            return self._encode_str(repr(obj), budget, depth, parents)
+        items = ((k, v) for k, v in attrs.items() if not k.startswith("_"))
+        out = self._encode_items(obj, items, None, budget, depth, parents)
+        return (
+            {"<type>": obj.__class__.__name__, **out} if isinstance(out, dict) else out
+        )
 
-    # mappings
-    if isinstance(obj, Mapping):
+    def _encode_items(self, obj, items, size, budget, depth, parents):
+        if depth >= _MAX_DEPTH:
+            return "<max_depth>"
+        if id(obj) in parents:
+            return "<cycle>"
+        parents.add(id(obj))
         out = {}
-        count = 0
-        for k, v in obj.items():
-            if count >= _MAX_ITEMS_PER_CONTAINER:
-                out["<truncated>"] = (
-                    f"only first {_MAX_ITEMS_PER_CONTAINER} items logged"
-                )
-                break
-            key = str(k)
-            if (
-                key in _SUMMARIZE_KEYS
-                and isinstance(v, Iterable)
-                and not isinstance(v, (str, bytes, bytearray, Mapping))
-            ):
-                # summarize large collections with count + sample
-                v_list = list(v)
-                summary = {
-                    "count": len(v_list),
-                    "sample": [
-                        _to_json_safe(
-                            x,
-                            _seen=_seen,
-                            _path=f"{_path}.{key}[{i}]",
-                            _depth=_depth + 1,
-                        )
-                        for i, x in enumerate(v_list[:_SAMPLE_ITEMS])
-                    ],
-                }
-                out[key] = summary
-            else:
-                safe_v = _to_json_safe(
-                    v, _seen=_seen, _path=f"{_path}.{key}", _depth=_depth + 1
-                )
-                out[key] = _redact_key(key, safe_v)
-            count += 1
+        try:
+            for key, value in items:
+                if budget.exhausted:
+                    out["<truncated>"] = f"{size} items" if size else "more items"
+                    break
+                key = str(key)
+                if key in _OMIT_KEYS:
+                    continue
+                budget.bytes -= len(key) + 4
+                if key.lower() in _REDACT_KEYS:
+                    out[key] = "***redacted***"
+                elif (
+                    key in _SUMMARIZE_KEYS
+                    and isinstance(value, Iterable)
+                    and not isinstance(value, (str, bytes, bytearray, Mapping))
+                ):
+                    # summarize large collections with count + sample
+                    out[key] = {
+                        "count": len(value) if isinstance(value, Sized) else None,
+                        "sample": self._encode_iterable(
+                            islice(value, _SAMPLE_ITEMS), budget, depth + 1, parents
+                        ),
+                    }
+                else:
+                    out[key] = self._walk(value, budget, depth + 1, parents)
+        finally:
+            parents.discard(id(obj))
         return out
 
-    # iterables (lists/tuples/sets/…)
-    if isinstance(obj, Iterable):
-        out_list = []
-        for idx, item in enumerate(obj):
-            if idx >= _MAX_ITEMS_PER_CONTAINER:
-                out_list.append(f"<truncated: first {_MAX_ITEMS_PER_CONTAINER} items>")
-                break
-            # if the list looks like ORM rows, produce a summarized list
-            if _is_sa_model(item):
-                # summarize entire list: count + sample
-                # convert current iterable to list once
-                seq = list(obj)
-                return {
-                    "count": len(seq),
-                    "sample": [
-                        _to_json_safe(
-                            x, _seen=_seen, _path=f"{_path}[{i}]", _depth=_depth + 1
-                        )
-                        for i, x in enumerate(seq[:_SAMPLE_ITEMS])
-                    ],
-                }
-            out_list.append(
-                _to_json_safe(
-                    item, _seen=_seen, _path=f"{_path}[{idx}]", _depth=_depth + 1
-                )
-            )
-        return out_list
-
-    # objects with __dict__ → shallow snapshot without private/SQLA internals
-    if hasattr(obj, "__dict__") and not _is_sa_model(obj):
-        data = {"<type>": obj.__class__.__name__}
+    def _encode_iterable(self, obj, budget, depth, parents):
+        if depth >= _MAX_DEPTH:
+            return "<max_depth>"
+        if id(obj) in parents:
+            return "<cycle>"
+        parents.add(id(obj))
+        out = []
         try:
-            attrs = {
-                k: v
-                for k, v in vars(obj).items()
-                if not k.startswith("_sa_") and not k.startswith("_")
-            }
-        except Exception:
-            attrs = {}
-        for i, (k, v) in enumerate(attrs.items()):
-            if i >= _MAX_ITEMS_PER_CONTAINER:
-                data["<truncated>"] = (
-                    f"only first {_MAX_ITEMS_PER_CONTAINER} attrs logged"
-                )
-                break
-            data[str(k)] = _to_json_safe(
-                v, _seen=_seen, _path=f"{_path}.{k}", _depth=_depth + 1
-            )
-        return data
-
-    # fallback
-    return repr(obj)
+            for item in obj:
+                if budget.exhausted:
+                    size = len(obj) if isinstance(obj, Sized) else None
+                    out.append(f"<truncated: {size} items>" if size else "<truncated>")
+                    break
+                out.append(self._walk(item, budget, depth + 1, parents))
+        finally:
+            parents.discard(id(obj))
+        return out
+
+
+log_serializer = LogSerializer()
 
 
 def get_serialized_result(result) -> str:
-    try:
-        safe_obj = _to_json_safe(result)
-        return json.dumps(safe_obj, ensure_ascii=False)
-    except Exception as e:
-        return f"<unserializable: {e!r}>"
-
-
-def serialize_value(value):
-    """Helper function to serialize a value for logging."""
-    if isinstance(value, Enum):
-        return value.value
-    if isinstance(value, BaseModel):
-        # Serialize BaseModel by converting Enum fields to their values
-        return {
-            k: (v.value if isinstance(v, Enum) else v)
-            for k, v in value.model_dump().items()
-        }
-    if hasattr(value, "dict"):
-        return value.dict()
-    if isinstance(value, dict):
-        return {k: (v.value if isinstance(v, Enum) else v) for k, v in value.items()}
-    try:
-        dumps({value})
-        return value
-    except TypeError:
-        return str(value)
+    return log_serializer.dumps(result)
 
 
 def serialize_args_kwargs(args, kwargs, params):
-    """Serialize function arguments and keyword arguments."""
-    args_dict = {
-        param: serialize_value(arg)
-        for param, arg in zip(params, args)
-        if param != "self" and param != "cls"
-    }
-    kwargs_dict = {key: serialize_value(value) for key, value in kwargs.items()}
+    """Serialize function arguments and keyword arguments under one budget."""
+    budget = log_serializer.budget()
+    args_dict = log_serializer.to_json_safe(
+        {
+            param: arg
+            for param, arg in zip(params, args)
+            if param != "self" and param != "cls"
+        },
+        budget,
+    )
+    kwargs_dict = log_serializer.to_json_safe(kwargs, budget)
     return args_dict, kwargs_dict
 
 
-def get_callee_class_name(inspect):
-    return (
-        inspect.stack()[1][0].f_locals["self"].__class__.__name__
-        if "self" in inspect.stack()[1][0].f_locals
-        else None
-    )
+class CallSite(NamedTuple):
+    function: str
+    filename: str
+    lineno: int
+    col_offset: int | None
+
+
+def get_call_site(frame) -> CallSite:
+    """Where ``frame`` is executing, read straight off the frame.
+
+    ``inspect.getframeinfo`` gives the same fields but also loads source lines.
+    """
+    code = frame.f_code
+    col_offset = None
+    if frame.f_lasti >= 0:
+        # One position per two-byte code unit, as in inspect.getframeinfo
+        positions = next(islice(code.co_positions(), frame.f_lasti // 2, None), None)
+        col_offset = positions[2] if positions else None
+    return CallSite(code.co_name, code.co_filename, frame.f_lineno, col_offset)
 
 
-def get_frame_info(inspect):
-    return inspect.getframeinfo(inspect.currentframe().f_back.f_back)
+def get_callee_class_name(frame) -> str | None:
+    if "self" not in frame.f_locals:
+        return None
+    return frame.f_locals["self"].__class__.__name__
 
 
 def convert_logfile_to_json(log_file_path: str):
@@ -0,0 +1,26 @@
+import base64
+import json
+from datetime import datetime
+from typing import Tuple
+
+from bson import ObjectId
+from bson.errors import InvalidId
+
+
+def encode_cursor(sort_value: datetime, document_id: ObjectId) -> str:
+    """Encode a ``(sort value, _id)`` keyset position into an opaque cursor."""
+    payload = json.dumps([sort_value.isoformat(), str(document_id)])
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, ObjectId]:
+    """Decode a cursor produced by ``encode_cursor``.
+
+    Raises ``ValueError`` when the cursor is malformed so routes can answer 400.
+    """
+    try:
+        payload = base64.urlsafe_b64decode(cursor.encode("ascii"))
+        sort_value, document_id = json.loads(payload)
+        return datetime.fromisoformat(sort_value), ObjectId(document_id)
+    except (ValueError, TypeError, InvalidId, UnicodeError):
+        raise ValueError("Invalid cursor")
@@ -0,0 +1,218 @@
+import asyncio
+import heapq
+import re
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+from itertools import islice
+from typing import AsyncIterator, Callable, Optional
+
+from libs.utils.common.custom_logger.src import CustomLogger
+
+log = CustomLogger("SearchIndex", is_request=False)
+logger, listener = log.get_logger()
+listener.start()
+
+_WORD = re.compile(r"[^\W_]+")
+
+# Share of the query's trigrams a key must contain to be returned
+MIN_QUERY_COVERAGE = 0.3
+# Changes applied between yields to the event loop while reloading; a driver
+# cursor hands over a whole buffered batch without ever yielding itself
+REFRESH_YIELD_EVERY = 250
+
+
+def _word_trigrams(word: str, prefix: bool = False) -> set[str]:
+    # Leading padding marks word starts so prefixes rank first; a prefix query
+    # leaves the end open because the user may still be typing
+    padded = f"  {word}" if prefix else f"  {word} "
+    return {padded[index : index + 3] for index in range(len(padded) - 2)}
+
+
+def text_trigrams(text: str, prefix: bool = False) -> set[str]:
+    """Trigrams of every word in ``text``; with ``prefix`` the last word is open."""
+    words = _WORD.findall(text.lower())
+    trigrams = set()
+    for position, word in enumerate(words):
+        trigrams |= _word_trigrams(word, prefix and position == len(words) - 1)
+    return trigrams
+
+
+class TrigramIndex:
+    """In-memory trigram index for fuzzy and prefix search over short fields.
+
+    Keys are mapped to small integer slots so posting sets stay compact.
+    ``upsert`` merges fields, so a partial update only needs the changed ones.
+    """
+
+    def __init__(self, max_candidates: int):
+        self.max_candidates = max_candidates
+        self._postings: dict[str, set[int]] = {}
+        self._slots: dict[str, int] = {}
+        self._keys: list[Optional[str]] = []
+        self._fields: list[Optional[dict]] = []
+        self._trigrams: list[Optional[frozenset]] = []
+        self._free_slots: list[int] = []
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._slots
+
+    def upsert(self, key: str, fields: dict) -> None:
+        slot = self._slots.get(key)
+        if slot is None:
+            slot = self._free_slots.pop() if self._free_slots else len(self._keys)
+            if slot == len(self._keys):
+                self._keys.append(None)
+                self._fields.append(None)
+                self._trigrams.append(None)
+            self._slots[key] = slot
+            self._keys[slot] = key
+            self._fields[slot] = {}
+            self._trigrams[slot] = frozenset()
+
+        merged = {**self._fields[slot], **fields}
+        trigrams = frozenset(
+            trigram
+            for value in merged.values()
+            if value
+            for trigram in text_trigrams(str(value))
+        )
+        previous = self._trigrams[slot]
+        for trigram in previous - trigrams:
+            self._discard_posting(trigram, slot)
+        for trigram in trigrams - previous:
+            self._postings.setdefault(trigram, set()).add(slot)
+        self._fields[slot] = merged
+        self._trigrams[slot] = trigrams
+
+    def remove(self, *keys: str) -> None:
+        for key in keys:
+            slot = self._slots.pop(key, None)
+            if slot is None:
+                continue
+            for trigram in self._trigrams[slot]:
+                self._discard_posting(trigram, slot)
+            self._keys[slot] = None
+            self._fields[slot] = None
+            self._trigrams[slot] = None
+            self._free_slots.append(slot)
+
+    def _discard_posting(self, trigram: str, slot: int) -> None:
+        posting = self._postings.get(trigram)
+        if posting is None:
+            return
+        posting.discard(slot)
+        if not posting:
+            del self._postings[trigram]
+
+    def search(self, query: str, limit: int) -> list[tuple[str, float]]:
+        """Return up to ``limit`` ``(key, score)`` pairs, best match first.
+
+        Postings are walked rarest first; once ``max_candidates`` keys have
+        been seen, the commoner trigrams only add to those keys' counts.
+        """
+        query_trigrams = text_trigrams(query, prefix=True)
+        if not query_trigrams:
+            return []
+        postings = sorted(
+            (self._postings.get(trigram, ()) for trigram in query_trigrams), key=len
+        )
+
+        counts = Counter()
+        for posting in postings:
+            room = self.max_candidates - len(counts)
+            if len(posting) <= room:
+                counts.update(posting)
+                continue
+            counts.update(posting.intersection(counts))
+            if room > 0:
+                counts.update(
+                    islice((slot for slot in posting if slot not in counts), room)
+                )
+
+        query_size = len(query_trigrams)
+        minimum = MIN_QUERY_COVERAGE * query_size
+        ranked = heapq.nlargest(
+            limit,
+            (
+                # Coverage of the query first, then overall (Jaccard) similarity
+                (
+                    shared / query_size,
+                    shared / (query_size + len(self._trigrams[slot]) - shared),
+                    slot,
+                )
+                for slot, shared in counts.items()
+                if shared >= minimum
+            ),
+        )
+        return [
+            (self._keys[slot], round((coverage + similarity) / 2, 4))
+            for coverage, similarity, slot in ranked
+        ]
+
+
+# Yields ``(key, fields, changed_at)``; ``fields`` is ``None`` for removed keys
+ChangesLoader = Callable[[Optional[datetime]], AsyncIterator[tuple]]
+
+
+class SyncedTrigramIndex(TrigramIndex):
+    """A ``TrigramIndex`` kept in step with a collection by delta reloads.
+
+    Local writes should be applied directly; ``refresh_if_stale`` reloads keys
+    changed since the last load, at most once every ``refresh_seconds``, so
+    writes made by other processes show up within that period. Reloads yield
+    to the event loop every ``REFRESH_YIELD_EVERY`` changes, so a full build
+    at startup does not hold up requests. Each reload
+    overlaps the previous one by ``overlap`` to tolerate clock skew between
+    writers.
+    """
+
+    def __init__(
+        self,
+        loader: ChangesLoader,
+        refresh_seconds: float,
+        max_candidates: int,
+        overlap: timedelta = timedelta(seconds=5),
+    ):
+        super().__init__(max_candidates)
+        self._loader = loader
+        self.refresh_seconds = refresh_seconds
+        self.overlap = overlap
+        self._synced_until: Optional[datetime] = None
+        self._refreshed_at = None
+
+    async def refresh_if_stale(self):
+        now = time.monotonic()
+        if (
+            self._refreshed_at is not None
+            and now - self._refreshed_at < self.refresh_seconds
+        ):
+            return
+        # Claim the refresh first so concurrent searches use the current index
+        self._refreshed_at = now
+        since = self._synced_until
+        if since is not None:
+            since -= self.overlap
+        synced_until = self._synced_until
+        try:
+            applied = 0
+            async for key, fields, changed_at in self._loader(since):
+                applied += 1
+                if applied % REFRESH_YIELD_EVERY == 0:
+                    # Indexing ~40us per change would otherwise stall every
+                    # request on this worker for the length of a full build
+                    await asyncio.sleep(0)
+                if fields is None:
+                    self.remove(key)
+                else:
+                    self.upsert(key, fields)
+                if changed_at and (synced_until is None or changed_at > synced_until):
+                    synced_until = changed_at
+        except Exception as error:
+            # Keep the old watermark so the next refresh reloads what was missed
+            logger.error(f"Failed to refresh the search index: {error}")
+            return
+        self._synced_until = synced_until
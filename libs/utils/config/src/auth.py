@@ -1,6 +1,25 @@
 from libs.utils.config.src import config
+from libs.utils.enums.src import AuthMode
 
 SECRET_KEY = config.get("SECRET_KEY", "jamshi")
 ACCESS_TOKEN_EXPIRE_MINUTES = int(config.get("ACCESS_TOKEN_EXPIRE_MINUTES", 30))
 REFRESH_TOKEN_EXPIRE_DAYS = int(config.get("REFRESH_TOKEN_EXPIRE_DAYS", 30))
 ALGORITHM = config.get("ALGORITHM", "HS256")
+
+# "stateless" trusts is_active/role claims in access tokens instead of reading
+# the user per request; revocations reach each worker within the refresh period
+AUTH_MODE = AuthMode((config.get("AUTH_MODE") or AuthMode.STATEFUL.value).lower())
+STATELESS_ACCESS_TOKEN_EXPIRE_MINUTES = int(
+    config.get("STATELESS_ACCESS_TOKEN_EXPIRE_MINUTES") or 5
+)
+REVOCATION_REFRESH_SECONDS = float(config.get("REVOCATION_REFRESH_SECONDS") or 30)
+
+VERIFIED_TOKEN_CACHE_SIZE = int(config.get("VERIFIED_TOKEN_CACHE_SIZE") or 10000)
+
+# bcrypt runs on a per-worker thread pool; beyond MAX_PENDING callers get a 503
+PASSWORD_HASH_WORKERS = int(config.get("PASSWORD_HASH_WORKERS") or 2)
+PASSWORD_HASH_MAX_PENDING = int(config.get("PASSWORD_HASH_MAX_PENDING") or 32)
+
+# bcrypt cost factor (2^rounds iterations); stored hashes at another cost are
+# rehashed on the next successful login. Measure with the password benchmark.
+BCRYPT_ROUNDS = int(config.get("BCRYPT_ROUNDS") or 12)
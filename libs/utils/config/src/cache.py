@@ -0,0 +1,18 @@
+from libs.utils.config.src import config
+
+# "memory" keeps a bounded LRU per worker process; "redis" shares it
+CACHE_BACKEND = (config.get("CACHE_BACKEND") or "memory").lower()
+REDIS_URL = config.get("REDIS_URL") or "redis://localhost:6379/0"
+
+EMPLOYEE_CACHE_TTL_SECONDS = float(config.get("EMPLOYEE_CACHE_TTL_SECONDS") or 60)
+EMPLOYEE_CACHE_NEGATIVE_TTL_SECONDS = float(
+    config.get("EMPLOYEE_CACHE_NEGATIVE_TTL_SECONDS") or 5
+)
+EMPLOYEE_CACHE_MAX_SIZE = int(config.get("EMPLOYEE_CACHE_MAX_SIZE") or 10000)
+
+# Principals are re-read often; keep the window a deactivation can be missed short
+PRINCIPAL_CACHE_TTL_SECONDS = float(config.get("PRINCIPAL_CACHE_TTL_SECONDS") or 10)
+PRINCIPAL_CACHE_MAX_SIZE = int(config.get("PRINCIPAL_CACHE_MAX_SIZE") or 10000)
+
+if CACHE_BACKEND not in ("memory", "redis"):
+    raise ValueError(f"CACHE_BACKEND must be 'memory' or 'redis', got: {CACHE_BACKEND}")
@@ -1,3 +1,6 @@
+from libs.utils.common.custom_logger.src.handlers import (
+    reinit_logging_after_fork,
+)
 from libs.utils.config.src.fastapi import (
     FASTAPI_APP_HOST,
     FASTAPI_APP_PORT,
@@ -21,4 +24,10 @@ errorlog = "-"  # stderr
 
 max_requests = 1000  # recycle workers to dodge memory leaks
 max_requests_jitter = 50
-preload_app = False  # lower RAM when many workers
+# Safe with preload: Mongo clients are created lazily per worker process, and
+# post_fork gives each worker its own log file and logger threads
+preload_app = True  # share imported code between workers, faster boot
+
+
+def post_fork(server, worker):
+    reinit_logging_after_fork()
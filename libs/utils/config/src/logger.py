@@ -16,6 +16,21 @@ MS_TEAMS_CRITICAL_ALERTS_WEBHOOK_URL = config.get(
     "MS_TEAMS_CRITICAL_ALERTS_WEBHOOK_URL"
 )
 
+# Level of every application logger; above DEBUG, @log.track skips argument
+# and result serialization and only logs failures
+LOG_LEVEL = str(config.get("LOG_LEVEL") or "DEBUG").upper()
+
+# Bytes of each response body kept for the request log; 0 logs no body
+LOG_RESPONSE_BODY_PREVIEW_BYTES = int(
+    config.get("LOG_RESPONSE_BODY_PREVIEW_BYTES") or 2048
+)
+# Bytes of a JSON request body kept for routes that opt in to body logging
+LOG_REQUEST_BODY_MAX_BYTES = int(config.get("LOG_REQUEST_BODY_MAX_BYTES") or 16384)
+# Values and encoded size a logged argument list or result may use before it
+# is cut short with a "<truncated>" marker
+LOG_SERIALIZE_MAX_ITEMS = int(config.get("LOG_SERIALIZE_MAX_ITEMS") or 500)
+LOG_SERIALIZE_MAX_BYTES = int(config.get("LOG_SERIALIZE_MAX_BYTES") or 8192)
+
 
 if MS_TEAMS_WEBHOOK_ENABLED:
     required = {
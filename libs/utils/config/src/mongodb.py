@@ -2,3 +2,20 @@ from libs.utils.config.src import config
 
 MONGO_URI = config.get("MONGO_URI", "mongodb://localhost:27017/")
 MONGO_DATABASE_NAME = config.get("MONGO_DATABASE_NAME", "habbot_connect_db")
+
+# Connection pool tuning, applied per worker process
+MONGO_MAX_POOL_SIZE = int(config.get("MONGO_MAX_POOL_SIZE") or 100)
+MONGO_MIN_POOL_SIZE = int(config.get("MONGO_MIN_POOL_SIZE") or 0)
+MONGO_WAIT_QUEUE_TIMEOUT_MS = config.get("MONGO_WAIT_QUEUE_TIMEOUT_MS")
+MONGO_WAIT_QUEUE_TIMEOUT_MS = (
+    int(MONGO_WAIT_QUEUE_TIMEOUT_MS) if MONGO_WAIT_QUEUE_TIMEOUT_MS else None
+)
+MONGO_SERVER_SELECTION_TIMEOUT_MS = int(
+    config.get("MONGO_SERVER_SELECTION_TIMEOUT_MS") or 30000
+)
+# Comma separated, e.g. "zstd,snappy,zlib"; empty disables wire compression
+MONGO_COMPRESSORS = [
+    compressor.strip()
+    for compressor in (config.get("MONGO_COMPRESSORS") or "").split(",")
+    if compressor.strip()
+]
@@ -0,0 +1,7 @@
+from libs.utils.config.src import config
+
+# Each worker keeps its own employee search index; writes made by other
+# workers are picked up by a delta reload at most this often
+SEARCH_INDEX_REFRESH_SECONDS = float(config.get("SEARCH_INDEX_REFRESH_SECONDS") or 10)
+# Candidates scored per query; bounds lookup cost for very common trigrams
+SEARCH_MAX_CANDIDATES = int(config.get("SEARCH_MAX_CANDIDATES") or 2000)
@@ -1,10 +1,36 @@
-from libs.utils.db.mongodb.operations.src.employees import EmployeesOperations
-from libs.utils.db.mongodb.operations.src.users import UsersOperations
+from libs.utils.db.mongodb.operations.src.employees import (
+    AsyncEmployeesOperations,
+    EmployeesOperations,
+)
+from libs.utils.db.mongodb.operations.src.headcounts import (
+    AsyncEmployeeHeadcountsOperations,
+)
+from libs.utils.db.mongodb.operations.src.refresh_tokens import (
+    AsyncRefreshTokensOperations,
+)
+from libs.utils.db.mongodb.operations.src.revoked_tokens import (
+    AsyncRevokedTokensOperations,
+)
+from libs.utils.db.mongodb.operations.src.users import (
+    AsyncUsersOperations,
+    UsersOperations,
+)
 
 users_operations = UsersOperations()
 employees_operations = EmployeesOperations()
 
+async_users_operations = AsyncUsersOperations()
+async_employees_operations = AsyncEmployeesOperations()
+async_revoked_tokens_operations = AsyncRevokedTokensOperations()
+async_refresh_tokens_operations = AsyncRefreshTokensOperations()
+async_employee_headcounts_operations = AsyncEmployeeHeadcountsOperations()
+
 __all__ = [
     "users_operations",
     "employees_operations",
+    "async_users_operations",
+    "async_employees_operations",
+    "async_revoked_tokens_operations",
+    "async_refresh_tokens_operations",
+    "async_employee_headcounts_operations",
 ]
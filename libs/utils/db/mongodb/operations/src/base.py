@@ -3,6 +3,7 @@ from typing import Any, Dict, Generic, List, Optional, TypeVar
 
 from bson import ObjectId
 
+from libs.utils.db.mongodb.src.async_base_repository import AsyncBaseRepository
 from libs.utils.db.mongodb.src.base_repository import BaseRepository
 
 T = TypeVar("T")
@@ -20,9 +21,11 @@ class BaseOperations(ABC, Generic[T]):
         """Get the underlying repository."""
         return self._repository
 
-    def find_by_id(self, entity_id: str) -> Optional[Dict[str, Any]]:
-        """Find a single document by its ID."""
-        return self._repository.find_one({"_id": ObjectId(entity_id)})
+    def find_by_id(
+        self, entity_id: str, projection: Optional[Dict[str, Any]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Find a single document by its ID, optionally limited to ``projection``."""
+        return self._repository.find_one({"_id": ObjectId(entity_id)}, projection)
 
     def find_all(
         self,
@@ -30,10 +33,15 @@ class BaseOperations(ABC, Generic[T]):
         limit: int = 0,
         sort_key: Optional[str] = None,
         sort_type: Optional[int] = None,
+        projection: Optional[Dict[str, Any]] = None,
     ) -> List[Dict[str, Any]]:
         """Find all documents matching the query."""
         cursor = self._repository.find(
-            query=query or {}, limit=limit, sort_key=sort_key, sort_type=sort_type
+            query=query or {},
+            projection=projection,
+            limit=limit,
+            sort_key=sort_key,
+            sort_type=sort_type,
         )
         return list(cursor)
 
@@ -49,6 +57,17 @@ class BaseOperations(ABC, Generic[T]):
         )
         return result.modified_count > 0
 
+    def find_one_and_update(
+        self,
+        query: Dict[str, Any],
+        update_data: Dict[str, Any],
+        projection: Optional[Dict[str, Any]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Apply ``$set`` to the first match and return it as updated, or ``None``."""
+        return self._repository.find_one_and_update(
+            query, {"$set": update_data}, projection
+        )
+
     def delete_by_id(self, entity_id: str) -> bool:
         """Delete a document by its ID."""
         result = self._repository.delete_one({"_id": ObjectId(entity_id)})
@@ -60,4 +79,77 @@ class BaseOperations(ABC, Generic[T]):
 
     def exists(self, query: Dict[str, Any]) -> bool:
         """Check if any document matches the query."""
-        return self._repository.find_one(query) is not None
+        return self._repository.find_one(query, {"_id": 1}) is not None
+
+
+class AsyncBaseOperations(ABC, Generic[T]):
+    """Async counterpart of ``BaseOperations`` backed by an ``AsyncBaseRepository``."""
+
+    def __init__(self, repository: AsyncBaseRepository):
+        """Initialize with an async repository instance."""
+        self._repository = repository
+
+    @property
+    def repository(self) -> AsyncBaseRepository:
+        """Get the underlying repository."""
+        return self._repository
+
+    async def find_by_id(
+        self, entity_id: str, projection: Optional[Dict[str, Any]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Find a single document by its ID, optionally limited to ``projection``."""
+        return await self._repository.find_one({"_id": ObjectId(entity_id)}, projection)
+
+    async def find_all(
+        self,
+        query: Optional[Dict[str, Any]] = None,
+        limit: int = 0,
+        sort_key: Optional[str] = None,
+        sort_type: Optional[int] = None,
+        projection: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Find all documents matching the query."""
+        cursor = self._repository.find(
+            query=query or {},
+            projection=projection,
+            limit=limit,
+            sort_key=sort_key,
+            sort_type=sort_type,
+        )
+        return await cursor.to_list(length=None)
+
+    async def create(self, data: Dict[str, Any]) -> str:
+        """Create a new document."""
+        result = await self._repository.insert_one(data)
+        return str(result.inserted_id)
+
+    async def update_by_id(self, entity_id: str, update_data: Dict[str, Any]) -> bool:
+        """Update a document by its ID."""
+        result = await self._repository.update_one(
+            {"_id": ObjectId(entity_id)}, {"$set": update_data}
+        )
+        return result.modified_count > 0
+
+    async def find_one_and_update(
+        self,
+        query: Dict[str, Any],
+        update_data: Dict[str, Any],
+        projection: Optional[Dict[str, Any]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Apply ``$set`` to the first match and return it as updated, or ``None``."""
+        return await self._repository.find_one_and_update(
+            query, {"$set": update_data}, projection
+        )
+
+    async def delete_by_id(self, entity_id: str) -> bool:
+        """Delete a document by its ID."""
+        result = await self._repository.delete_one({"_id": ObjectId(entity_id)})
+        return result.deleted_count > 0
+
+    async def count(self, query: Optional[Dict[str, Any]] = None) -> int:
+        """Count documents matching the query."""
+        return await self._repository.count_documents(query or {})
+
+    async def exists(self, query: Dict[str, Any]) -> bool:
+        """Check if any document matches the query."""
+        return await self._repository.find_one(query, {"_id": 1}) is not None
@@ -1,11 +1,36 @@
+import asyncio
 from datetime import datetime, timezone
+from typing import Optional
 
 import pymongo
 from bson import ObjectId
+from pymongo import ReturnDocument
+from pymongo.errors import BulkWriteError
 
+from libs.utils.common.cache.src import ReadThroughCache, create_cache_backend
 from libs.utils.common.custom_logger.src import CustomLogger
-from libs.utils.db.mongodb.operations.src.base import BaseOperations
+from libs.utils.common.pagination.src import decode_cursor, encode_cursor
+from libs.utils.common.search.src import SyncedTrigramIndex
+from libs.utils.config.src.cache import (
+    EMPLOYEE_CACHE_MAX_SIZE,
+    EMPLOYEE_CACHE_NEGATIVE_TTL_SECONDS,
+    EMPLOYEE_CACHE_TTL_SECONDS,
+)
+from libs.utils.config.src.search import (
+    SEARCH_INDEX_REFRESH_SECONDS,
+    SEARCH_MAX_CANDIDATES,
+)
+from libs.utils.db.mongodb.operations.src.base import (
+    AsyncBaseOperations,
+    BaseOperations,
+)
+from libs.utils.db.mongodb.operations.src.headcounts import (
+    AsyncEmployeeHeadcountsOperations,
+    count_headcounts,
+)
+from libs.utils.db.mongodb.src.base_repository import DuplicateRecordError
 from libs.utils.db.mongodb.src.repository import (
+    async_employees_repository,
     employees_repository,
 )
 from libs.utils.enums.src import DepartmentType, RoleType
@@ -14,54 +39,502 @@ log = CustomLogger("EmployeesOperations", is_request=False)
 logger, listener = log.get_logger()
 listener.start()
 
+# Keyset order for employee listings; ``_id`` breaks ties between equal dates.
+EMPLOYEE_LIST_SORT = {"date_joined": pymongo.DESCENDING, "_id": pymongo.DESCENDING}
+
+DUPLICATE_KEY = 11000
+DUPLICATE_EMAIL_MESSAGE = "Employee with email already exists"
+
+# Active employee documents keyed by id; writes below invalidate before returning
+employee_cache = ReadThroughCache(
+    create_cache_backend("employees", EMPLOYEE_CACHE_MAX_SIZE),
+    ttl_seconds=EMPLOYEE_CACHE_TTL_SECONDS,
+    negative_ttl_seconds=EMPLOYEE_CACHE_NEGATIVE_TTL_SECONDS,
+    name="employees",
+)
+
+
+def get_write_error_messages(error: BulkWriteError) -> dict[int, str]:
+    """Map the position of each failed write in a bulk request to its error."""
+    return {
+        write_error["index"]: (
+            DUPLICATE_EMAIL_MESSAGE
+            if write_error.get("code") == DUPLICATE_KEY
+            else write_error.get("errmsg", "Write failed")
+        )
+        for write_error in error.details.get("writeErrors", [])
+    }
+
+
+# Fields matched by employee search
+EMPLOYEE_SEARCH_FIELDS = ("name", "email")
+# Fields employee headcounts are grouped by
+HEADCOUNT_FIELDS = {"department", "role"}
+HEADCOUNT_PROJECTION = {field: 1 for field in HEADCOUNT_FIELDS}
+
+
+async def load_employee_search_changes(since=None):
+    """Yield search index changes: all active employees, or writes since ``since``."""
+    if since is None:
+        query = {"is_active": True}
+    else:
+        query = {"updatedAt": {"$gte": since}}
+    projection = {field: 1 for field in EMPLOYEE_SEARCH_FIELDS}
+    projection.update(is_active=1, updatedAt=1)
+    async for employee in async_employees_repository.find(query, projection):
+        fields = None
+        if employee.get("is_active"):
+            fields = {field: employee.get(field) for field in EMPLOYEE_SEARCH_FIELDS}
+        yield str(employee["_id"]), fields, employee.get("updatedAt")
+
+
+# Per-process name/email index; writes below apply to it before returning
+employee_search_index = SyncedTrigramIndex(
+    load_employee_search_changes,
+    refresh_seconds=SEARCH_INDEX_REFRESH_SECONDS,
+    max_candidates=SEARCH_MAX_CANDIDATES,
+)
+
+
+def get_deactivation_update(deactivated_at: datetime) -> dict:
+    """The update every soft delete applies, single or bulk."""
+    return {"$set": {"is_active": False, "deactivated_at": deactivated_at}}
+
+
+def get_search_fields(employee_data: dict) -> dict:
+    return {
+        field: employee_data[field]
+        for field in EMPLOYEE_SEARCH_FIELDS
+        if field in employee_data
+    }
+
+
+def build_employee_list_query(department: DepartmentType, role: RoleType) -> dict:
+    query = {"is_active": True}
+    if department:
+        query["department"] = department.value
+    if role:
+        query["role"] = role.value
+    return query
+
+
+def get_employee_list_cursor(employee: dict) -> str:
+    return encode_cursor(employee.get("date_joined"), employee.get("_id"))
+
+
+def split_employee_page(employees: list, page_size: int):
+    """Trim a ``page_size + 1`` fetch to one page and derive its next cursor."""
+    if len(employees) <= page_size:
+        return employees, None
+    employees = employees[:page_size]
+    return employees, get_employee_list_cursor(employees[-1])
+
+
+def apply_projection(document: dict, projection: dict = None):
+    """Apply an inclusion ``projection`` to a document already in memory."""
+    if document is None or not projection:
+        return document
+    return {
+        field: value
+        for field, value in document.items()
+        if field == "_id" or projection.get(field)
+    }
+
 
 class EmployeesOperations(BaseOperations):
     def __init__(self):
         super().__init__(employees_repository)
 
-    def get_employee_by_email(self, email):
-        return self.repository.find_one({"email": email, "is_active": True})
+    def get_employee_by_email(self, email, projection: dict = None):
+        return self.repository.find_one({"email": email, "is_active": True}, projection)
 
     def create_employee(self, employee_data: dict):
-        employee_data.update(
-            {"is_active": True}
-        )
+        employee_data.update({"is_active": True})
         return self.create(employee_data)
 
     def list_employees(
         self, department: DepartmentType, role: RoleType, page: int, page_size: int
     ):
-        query = {"is_active": True}
-        if department:
-            query["department"] = department.value
-        if role:
-            query["role"] = role.value
+        query = build_employee_list_query(department, role)
 
         total = self._repository.count_documents(query)
         skip = (page - 1) * page_size
 
         pipeline = [
             {"$match": query},
-            {"$sort": {"date_joined": pymongo.DESCENDING}},
+            {"$sort": EMPLOYEE_LIST_SORT},
             {"$skip": skip},
             {"$limit": page_size},
         ]
         return list(self.repository.aggregate(pipeline)), total
 
-    def get_employee_by_id(self, employee_id):
+    def get_employee_by_id(self, employee_id, projection: dict = None):
         return self.repository.find_one(
-            {"_id": ObjectId(employee_id), "is_active": True}
+            {"_id": ObjectId(employee_id), "is_active": True}, projection
+        )
+
+    def update_employee(
+        self, employee_id: str, employee_data: dict, projection: dict = None
+    ):
+        return self.find_one_and_update(
+            {"_id": ObjectId(employee_id), "is_active": True}, employee_data, projection
+        )
+
+    def delete_employee(self, employee_id: str) -> Optional[datetime]:
+        deactivated_at = datetime.now(timezone.utc)
+        result = self.repository.update_one(
+            {"_id": ObjectId(employee_id), "is_active": True},
+            get_deactivation_update(deactivated_at),
+        )
+        return deactivated_at if result.matched_count else None
+
+
+class AsyncEmployeesOperations(AsyncBaseOperations):
+    def __init__(self):
+        super().__init__(async_employees_repository)
+        self._headcounts = AsyncEmployeeHeadcountsOperations()
+
+    async def _get_headcount_fields(self, employee_ids) -> dict[str, dict]:
+        cursor = self.repository.find(
+            {
+                "_id": {"$in": [ObjectId(employee_id) for employee_id in employee_ids]},
+                "is_active": True,
+            },
+            HEADCOUNT_PROJECTION,
+        )
+        return {str(employee["_id"]): employee async for employee in cursor}
+
+    async def get_employee_by_email(self, email, projection: dict = None):
+        return await self.repository.find_one(
+            {"email": email, "is_active": True}, projection
         )
 
-    def update_employee(self, employee_id: str, employee_data: dict):
-        updated = self.repository.update_one(
-            {"_id": ObjectId(employee_id), "is_active": True}, {"$set": employee_data}
+    async def create_employee(self, employee_data: dict):
+        """Insert an active employee; the unique email index rejects duplicates."""
+        employee_data.update({"is_active": True})
+        try:
+            employee_id = await self.create(employee_data)
+        except DuplicateRecordError:
+            raise ValueError(DUPLICATE_EMAIL_MESSAGE)
+        await employee_cache.invalidate(employee_id)
+        employee_search_index.upsert(str(employee_id), get_search_fields(employee_data))
+        await self._headcounts.apply(count_headcounts([employee_data]))
+        return employee_id
+
+    async def create_employees(self, employees: list[dict]) -> dict[int, str]:
+        """Insert employees in one unordered batch.
+
+        Returns the positions that failed mapped to the server's error message;
+        every other document was inserted and carries its new ``_id``.
+        """
+        for employee in employees:
+            employee["is_active"] = True
+        failures = {}
+        try:
+            await self.repository.insert_many(employees, ordered=False)
+        except BulkWriteError as error:
+            failures = get_write_error_messages(error)
+        await employee_cache.invalidate(
+            *(str(employee["_id"]) for employee in employees if "_id" in employee)
+        )
+        inserted = [
+            employee
+            for index, employee in enumerate(employees)
+            if index not in failures and "_id" in employee
+        ]
+        for employee in inserted:
+            employee_search_index.upsert(
+                str(employee["_id"]), get_search_fields(employee)
+            )
+        await self._headcounts.apply(count_headcounts(inserted))
+        return failures
+
+    async def get_active_employee_emails(self, emails: list[str]) -> set[str]:
+        cursor = self.repository.find(
+            {"email": {"$in": emails}, "is_active": True}, {"_id": 0, "email": 1}
+        )
+        return {employee["email"] async for employee in cursor}
+
+    async def get_active_employee_ids(self, employee_ids: list[str]) -> set[str]:
+        cursor = self.repository.find(
+            {
+                "_id": {"$in": [ObjectId(employee_id) for employee_id in employee_ids]},
+                "is_active": True,
+            },
+            {"_id": 1},
+        )
+        return {str(employee["_id"]) async for employee in cursor}
+
+    async def bulk_update_employees(
+        self, updates: dict[str, dict]
+    ) -> tuple[int, dict[str, str]]:
+        """Apply a ``$set`` per employee id in one unordered bulk write.
+
+        Returns the matched count and the ids whose write failed, such as on a
+        duplicate email, mapped to the error; every other update was applied.
+
+        Headcounts are moved using department and role read just before the
+        write; a concurrent change to the same employees can skew them until
+        the next reconcile.
+        """
+        previous = {}
+        moved_ids = [
+            employee_id
+            for employee_id, employee_data in updates.items()
+            if HEADCOUNT_FIELDS & employee_data.keys()
+        ]
+        if moved_ids:
+            previous = await self._get_headcount_fields(moved_ids)
+        employee_ids = list(updates)
+        failures = {}
+        try:
+            result = await self.repository.bulk_write(
+                [
+                    self.repository.update_one_op(
+                        {"_id": ObjectId(employee_id), "is_active": True},
+                        {"$set": employee_data},
+                    )
+                    for employee_id, employee_data in updates.items()
+                ],
+                ordered=False,
+            )
+            matched = result.matched_count
+        except BulkWriteError as error:
+            matched = error.details.get("nMatched", 0)
+            failures = {
+                employee_ids[index]: message
+                for index, message in get_write_error_messages(error).items()
+            }
+        await employee_cache.invalidate(*updates)
+        applied = {
+            employee_id: employee_data
+            for employee_id, employee_data in updates.items()
+            if employee_id not in failures
+        }
+        for employee_id, employee_data in applied.items():
+            # Ids that are not indexed did not match an active employee
+            search_fields = get_search_fields(employee_data)
+            if search_fields and employee_id in employee_search_index:
+                employee_search_index.upsert(employee_id, search_fields)
+        moved = {
+            employee_id: employee
+            for employee_id, employee in previous.items()
+            if employee_id in applied
+        }
+        deltas = count_headcounts(moved.values(), -1)
+        deltas.update(
+            count_headcounts(
+                {**employee, **applied[employee_id]}
+                for employee_id, employee in moved.items()
+            )
         )
-        if updated:
-            return self.find_by_id(employee_id)
-        return None
+        await self._headcounts.apply(deltas)
+        return matched, failures
+
+    async def bulk_delete_employees(self, employee_ids: list[str]) -> int:
+        """Soft delete many employees in one unordered bulk write."""
+        previous = await self._get_headcount_fields(employee_ids)
+        deactivated_at = datetime.now(timezone.utc)
+        result = await self.repository.bulk_write(
+            [
+                self.repository.update_one_op(
+                    {"_id": ObjectId(employee_id), "is_active": True},
+                    get_deactivation_update(deactivated_at),
+                )
+                for employee_id in employee_ids
+            ],
+            ordered=False,
+        )
+        await employee_cache.invalidate(*employee_ids)
+        employee_search_index.remove(*employee_ids)
+        if result.matched_count != len(previous):
+            logger.warning(
+                f"Bulk delete matched {result.matched_count} of {len(previous)} "
+                "employees read for headcounts; counts may drift until reconciled"
+            )
+        await self._headcounts.apply(count_headcounts(previous.values(), -1))
+        return result.matched_count
+
+    async def search_employees(self, query: str, limit: int, projection: dict = None):
+        """Return up to ``limit`` active employees matching ``query``, best first.
+
+        Matching runs on ``employee_search_index``; only the hits are read
+        from the database.
+        """
+        await employee_search_index.refresh_if_stale()
+        hits = employee_search_index.search(query, limit)
+        if not hits:
+            return []
+        cursor = self.repository.find(
+            {
+                "_id": {"$in": [ObjectId(employee_id) for employee_id, _ in hits]},
+                "is_active": True,
+            },
+            projection,
+        )
+        employees = {str(employee["_id"]): employee async for employee in cursor}
+        return [
+            employees[employee_id]
+            for employee_id, _ in hits
+            if employee_id in employees
+        ]
+
+    async def count_employees(self, department: DepartmentType, role: RoleType) -> int:
+        """Count listed employees.
+
+        Unfiltered, this counts ``is_active`` keys of ``is_active_date_joined_id``
+        without fetching documents; deactivated employees are never included.
+        """
+        return await self.repository.count_documents(
+            build_employee_list_query(department, role)
+        )
+
+    async def list_employees(
+        self,
+        department: DepartmentType,
+        role: RoleType,
+        page: int,
+        page_size: int,
+        include_total: bool = True,
+        projection: dict = None,
+    ):
+        """List a page of employees.
+
+        Filtered lists fetch the page and its total in one ``$facet`` round
+        trip; ``include_total=False`` skips counting entirely.
+        """
+        skip = (page - 1) * page_size
+        page_stages = [{"$skip": skip}, {"$limit": page_size + 1}]
+        if projection:
+            page_stages.append({"$project": projection})
+        pipeline = [
+            {"$match": build_employee_list_query(department, role)},
+            {"$sort": EMPLOYEE_LIST_SORT},
+        ]
+
+        total = None
+        if include_total and (department or role):
+            pipeline.append(
+                {"$facet": {"items": page_stages, "total": [{"$count": "count"}]}}
+            )
+            result = await self.repository.aggregate(pipeline).to_list(length=None)
+            employees = result[0]["items"]
+            total = result[0]["total"][0]["count"] if result[0]["total"] else 0
+        elif include_total:
+            employees, total = await asyncio.gather(
+                self.repository.aggregate(pipeline + page_stages).to_list(length=None),
+                self.count_employees(department, role),
+            )
+        else:
+            employees = await self.repository.aggregate(pipeline + page_stages).to_list(
+                length=None
+            )
+
+        employees, next_cursor = split_employee_page(employees, page_size)
+        return employees, total, next_cursor
+
+    async def list_employees_after_cursor(
+        self,
+        department: DepartmentType,
+        role: RoleType,
+        cursor: str,
+        page_size: int,
+        include_total: bool = False,
+        projection: dict = None,
+    ):
+        """List the page that follows ``cursor`` by seeking on (date_joined, _id).
+
+        Unlike ``$skip`` this costs the same for every page depth; the total
+        does not, so it is only counted with ``include_total``.
+        """
+        date_joined, employee_id = decode_cursor(cursor)
+        query = build_employee_list_query(department, role)
+        query["$or"] = [
+            {"date_joined": {"$lt": date_joined}},
+            {"date_joined": date_joined, "_id": {"$lt": employee_id}},
+        ]
+
+        pipeline = [
+            {"$match": query},
+            {"$sort": EMPLOYEE_LIST_SORT},
+            {"$limit": page_size + 1},
+        ]
+        if projection:
+            pipeline.append({"$project": projection})
+
+        total = None
+        if include_total:
+            employees, total = await asyncio.gather(
+                self.repository.aggregate(pipeline).to_list(length=None),
+                self.count_employees(department, role),
+            )
+        else:
+            employees = await self.repository.aggregate(pipeline).to_list(length=None)
+
+        employees, next_cursor = split_employee_page(employees, page_size)
+        return employees, total, next_cursor
+
+    async def get_employee_by_id(self, employee_id, projection: dict = None):
+        """Read an active employee through ``employee_cache``.
+
+        The whole document is cached so one entry serves every ``projection``.
+        """
+        employee = await employee_cache.get_or_load(
+            str(employee_id),
+            lambda: self.repository.find_one(
+                {"_id": ObjectId(employee_id), "is_active": True}
+            ),
+        )
+        return apply_projection(employee, projection)
+
+    async def update_employee(
+        self, employee_id: str, employee_data: dict, projection: dict = None
+    ):
+        """Update an active employee; the unique email index rejects duplicates."""
+        query = {"_id": ObjectId(employee_id), "is_active": True}
+        moves_headcount = bool(HEADCOUNT_FIELDS & employee_data.keys())
+        employee = previous = None
+        try:
+            if not moves_headcount:
+                employee = await self.find_one_and_update(
+                    query, employee_data, projection
+                )
+            else:
+                # The old department and role are needed to move the headcount
+                previous = await self.repository.find_one_and_update(
+                    query,
+                    {"$set": employee_data},
+                    return_document=ReturnDocument.BEFORE,
+                )
+        except DuplicateRecordError:
+            raise ValueError(DUPLICATE_EMAIL_MESSAGE)
+        if previous is not None:
+            employee = {**previous, **employee_data}
+            deltas = count_headcounts([previous], -1)
+            deltas.update(count_headcounts([employee]))
+            await self._headcounts.apply(deltas)
+            employee = apply_projection(employee, projection)
+        await employee_cache.invalidate(str(employee_id))
+        search_fields = get_search_fields(employee_data)
+        if employee is not None and search_fields:
+            employee_search_index.upsert(str(employee_id), search_fields)
+        return employee
+
+    async def delete_employee(self, employee_id: str) -> Optional[datetime]:
+        """Deactivate an active employee in one conditional write.
 
-    def delete_employee(self, employee_id: str):
-        return self.repository.update_one(
-            {"_id": ObjectId(employee_id)}, {"$set": {"is_active": False}}
+        Returns when the employee was deactivated, or ``None`` when no active
+        employee has that id.
+        """
+        deactivated_at = datetime.now(timezone.utc)
+        employee = await self.repository.find_one_and_update(
+            {"_id": ObjectId(employee_id), "is_active": True},
+            get_deactivation_update(deactivated_at),
+            HEADCOUNT_PROJECTION,
         )
+        if employee is None:
+            return None
+        await employee_cache.invalidate(str(employee_id))
+        employee_search_index.remove(str(employee_id))
+        await self._headcounts.apply(count_headcounts([employee], -1))
+        return deactivated_at
@@ -0,0 +1,122 @@
+from collections import Counter
+from typing import Iterable
+
+from pymongo import ReplaceOne, UpdateMany, UpdateOne
+
+from libs.utils.common.custom_logger.src import CustomLogger
+from libs.utils.db.mongodb.operations.src.base import AsyncBaseOperations
+from libs.utils.db.mongodb.src.repository import (
+    async_employee_headcounts_repository,
+    async_employees_repository,
+)
+
+log = CustomLogger("HeadcountsOperations", is_request=False)
+logger, listener = log.get_logger()
+listener.start()
+
+
+def get_headcount_key(department, role) -> str:
+    return f"{department}:{role}"
+
+
+def _plain(value):
+    # Documents built from DTOs still hold enum members; counters use values
+    return getattr(value, "value", value)
+
+
+def count_headcounts(employees: Iterable[dict], sign: int = 1) -> Counter:
+    """Headcount deltas for ``employees``; ``sign=-1`` for departures."""
+    deltas = Counter()
+    for employee in employees:
+        department = _plain(employee.get("department"))
+        deltas[(department, _plain(employee.get("role")))] += sign
+    return deltas
+
+
+class AsyncEmployeeHeadcountsOperations(AsyncBaseOperations):
+    """Active employee counts per (department, role), one counter document each.
+
+    Employee writes apply deltas with ``$inc`` as they happen; ``reconcile``
+    rebuilds every counter from the employees collection in one aggregation.
+    """
+
+    def __init__(self):
+        super().__init__(async_employee_headcounts_repository)
+
+    async def apply(self, deltas: Counter):
+        """Add ``deltas`` keyed by ``(department, role)`` to the counters.
+
+        A failure is logged rather than raised: the employee write it follows
+        has already succeeded, and the next reconcile corrects the counts.
+        """
+        requests = [
+            UpdateOne(
+                {"_id": get_headcount_key(department, role)},
+                {
+                    "$inc": {"count": delta},
+                    "$setOnInsert": {"department": department, "role": role},
+                },
+                upsert=True,
+            )
+            for (department, role), delta in deltas.items()
+            if delta
+        ]
+        if not requests:
+            return
+        try:
+            await self._repository.bulk_write(requests, ordered=False)
+        except Exception as error:
+            logger.error(f"Failed to update employee headcounts {deltas}: {error}")
+
+    async def get_headcounts(self) -> list[dict]:
+        cursor = self._repository.find(
+            {"count": {"$gt": 0}}, {"_id": 0, "department": 1, "role": 1, "count": 1}
+        )
+        return await cursor.to_list(length=None)
+
+    async def reconcile(self) -> list[dict]:
+        """Recount active employees with one ``$group`` and overwrite the counters.
+
+        Deltas applied while the aggregation runs may be overwritten, so run
+        it when writes are quiet or simply run it again.
+        """
+        groups = await async_employees_repository.aggregate(
+            [
+                {"$match": {"is_active": True}},
+                {
+                    "$group": {
+                        "_id": {"department": "$department", "role": "$role"},
+                        "count": {"$sum": 1},
+                    }
+                },
+            ]
+        ).to_list(length=None)
+        headcounts = [
+            {
+                "_id": get_headcount_key(
+                    group["_id"]["department"], group["_id"]["role"]
+                ),
+                "department": group["_id"]["department"],
+                "role": group["_id"]["role"],
+                "count": group["count"],
+            }
+            for group in groups
+        ]
+        requests = [
+            ReplaceOne({"_id": headcount["_id"]}, headcount, upsert=True)
+            for headcount in headcounts
+        ]
+        requests.append(
+            UpdateMany(
+                {"_id": {"$nin": [headcount["_id"] for headcount in headcounts]}},
+                {"$set": {"count": 0}},
+            )
+        )
+        await self._repository.bulk_write(requests)
+        logger.info(f"Reconciled {len(headcounts)} employee headcounts")
+        return headcounts
+
+    async def ensure_headcounts(self):
+        """Build the counters once when none exist yet, e.g. on first deploy."""
+        if await self._repository.find_one({}, {"_id": 1}) is None:
+            await self.reconcile()
@@ -0,0 +1,40 @@
+from datetime import datetime, timezone
+
+from libs.utils.common.custom_logger.src import CustomLogger
+from libs.utils.db.mongodb.operations.src.base import AsyncBaseOperations
+from libs.utils.db.mongodb.src.repository import async_refresh_tokens_repository
+
+log = CustomLogger("RefreshTokensOperations", is_request=False)
+logger, listener = log.get_logger()
+listener.start()
+
+
+class AsyncRefreshTokensOperations(AsyncBaseOperations):
+    """Outstanding refresh tokens, one document per ``jti``.
+
+    A token is valid while its document exists; rotating deletes it, and the
+    TTL index on ``expires_at`` removes the ones never used.
+    """
+
+    def __init__(self):
+        super().__init__(async_refresh_tokens_repository)
+
+    async def save(self, jti: str, user_id: str, expires_at: datetime):
+        await self._repository.insert_one(
+            {"_id": jti, "user_id": str(user_id), "expires_at": expires_at}
+        )
+
+    async def consume(self, jti: str, user_id: str) -> bool:
+        """Atomically use up a refresh token; ``False`` if unknown or already used."""
+        result = await self._repository.delete_one(
+            {
+                "_id": jti,
+                "user_id": str(user_id),
+                "expires_at": {"$gt": datetime.now(timezone.utc)},
+            }
+        )
+        return result.deleted_count == 1
+
+    async def revoke_user(self, user_id: str) -> int:
+        result = await self._repository.delete_many({"user_id": str(user_id)})
+        return result.deleted_count
@@ -0,0 +1,53 @@
+from datetime import datetime, timezone
+
+from libs.utils.common.custom_logger.src import CustomLogger
+from libs.utils.db.mongodb.operations.src.base import AsyncBaseOperations
+from libs.utils.db.mongodb.src.repository import async_revoked_tokens_repository
+
+log = CustomLogger("RevokedTokensOperations", is_request=False)
+logger, listener = log.get_logger()
+listener.start()
+
+
+class AsyncRevokedTokensOperations(AsyncBaseOperations):
+    """Deny-list entries for stateless access tokens.
+
+    ``kind`` is ``"user"`` (every token of the user issued up to ``revoked_at``)
+    or ``"token"`` (a single ``jti``). ``expires_at`` drives the TTL index.
+    """
+
+    def __init__(self):
+        super().__init__(async_revoked_tokens_repository)
+
+    async def _revoke(self, kind: str, value: str, expires_at: datetime):
+        await self._repository.update_one(
+            {"kind": kind, "value": value},
+            {
+                "$set": {
+                    "revoked_at": datetime.now(timezone.utc),
+                    "expires_at": expires_at,
+                }
+            },
+            upsert=True,
+        )
+
+    async def revoke_user(self, user_id: str, expires_at: datetime):
+        await self._revoke("user", str(user_id), expires_at)
+
+    async def revoke_token(self, jti: str, expires_at: datetime):
+        await self._revoke("token", jti, expires_at)
+
+    async def get_revocations(self) -> tuple[dict[str, float], set[str]]:
+        """Return revoked user ids mapped to their cut-off timestamp, and revoked jtis."""
+        cursor = self._repository.find(
+            {"expires_at": {"$gt": datetime.now(timezone.utc)}},
+            {"_id": 0, "kind": 1, "value": 1, "revoked_at": 1},
+        )
+        users, tokens = {}, set()
+        async for entry in cursor:
+            if entry["kind"] == "user":
+                revoked_at = entry["revoked_at"].replace(tzinfo=timezone.utc)
+                users[entry["value"]] = revoked_at.timestamp()
+            else:
+                tokens.add(entry["value"])
+        return users, tokens
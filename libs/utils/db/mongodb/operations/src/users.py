@@ -1,26 +1,67 @@
+from datetime import datetime, timedelta, timezone
+
+from bson import ObjectId
+
 from libs.fastapi.platform.modules.auth.src import (
+    async_get_password_hash,
+    async_verify_and_update_password,
     get_password_hash,
     verify_password,
 )
+from libs.utils.common.cache.src import ReadThroughCache, create_cache_backend
 from libs.utils.common.custom_logger.src import CustomLogger
-from libs.utils.db.mongodb.operations.src.base import BaseOperations
-from libs.utils.db.mongodb.src.repository import users_repository
+from libs.utils.config.src.auth import STATELESS_ACCESS_TOKEN_EXPIRE_MINUTES
+from libs.utils.config.src.cache import (
+    PRINCIPAL_CACHE_MAX_SIZE,
+    PRINCIPAL_CACHE_TTL_SECONDS,
+)
+from libs.utils.db.mongodb.operations.src.base import (
+    AsyncBaseOperations,
+    BaseOperations,
+)
+from libs.utils.db.mongodb.operations.src.refresh_tokens import (
+    AsyncRefreshTokensOperations,
+)
+from libs.utils.db.mongodb.operations.src.revoked_tokens import (
+    AsyncRevokedTokensOperations,
+)
+from libs.utils.db.mongodb.src.base_repository import DuplicateRecordError
+from libs.utils.db.mongodb.src.repository import (
+    async_users_repository,
+    users_repository,
+)
 
 log = CustomLogger("UsersOperations", is_request=False)
 logger, listener = log.get_logger()
 listener.start()
 
+# Fields ``authenticate`` needs to verify a password and issue tokens
+AUTHENTICATION_PROJECTION = {"email": 1, "password": 1, "role": 1}
+
+# The principal carries what routes read from ``current_user`` and token claims need
+PRINCIPAL_PROJECTION = {"email": 1, "is_active": 1, "role": 1}
+
+# Principals resolved per request by ``require_user``, keyed by user id
+principal_cache = ReadThroughCache(
+    create_cache_backend("principals", PRINCIPAL_CACHE_MAX_SIZE),
+    ttl_seconds=PRINCIPAL_CACHE_TTL_SECONDS,
+    negative_ttl_seconds=PRINCIPAL_CACHE_TTL_SECONDS,
+    name="principals",
+)
+
 
 class UsersOperations(BaseOperations):
     def __init__(self):
         super().__init__(users_repository)
 
-    def get_user_by_email(self, email: str):
-        return self._repository.find_one({"email": email, "is_active": True})
+    def get_user_by_email(self, email: str, projection: dict = None):
+        return self._repository.find_one(
+            {"email": email, "is_active": True}, projection
+        )
 
     def authenticate(self, email: str, password: str):
         try:
-            user = self.get_user_by_email(email)
+            user = self.get_user_by_email(email, AUTHENTICATION_PROJECTION)
             if not user:
                 return None
             if not verify_password(password, user.get("password")):
@@ -30,8 +71,8 @@ class UsersOperations(BaseOperations):
             logger.error(f"Error in authenticate: {e}", exc_info=True)
             raise
 
-    def get_user_by_id(self, user_id: str):
-        return self.find_by_id(user_id)
+    def get_user_by_id(self, user_id: str, projection: dict = None):
+        return self.find_by_id(user_id, projection)
 
     def create_user(self, name: str, email: str, password: str):
         try:
@@ -48,3 +89,95 @@ class UsersOperations(BaseOperations):
         except Exception as e:
             logger.error(f"Error in create_user: {e}", exc_info=True)
             raise
+
+
+class AsyncUsersOperations(AsyncBaseOperations):
+    def __init__(self):
+        super().__init__(async_users_repository)
+        self._revoked_tokens = AsyncRevokedTokensOperations()
+        self._refresh_tokens = AsyncRefreshTokensOperations()
+
+    async def get_user_by_email(self, email: str, projection: dict = None):
+        return await self._repository.find_one(
+            {"email": email, "is_active": True}, projection
+        )
+
+    async def authenticate(self, email: str, password: str):
+        try:
+            user = await self.get_user_by_email(email, AUTHENTICATION_PROJECTION)
+            if not user:
+                return None
+            verified, new_hash = await async_verify_and_update_password(
+                password, user.get("password")
+            )
+            if not verified:
+                return None
+            if new_hash:
+                await self._rehash_password(user.get("_id"), new_hash)
+            return user
+        except Exception as e:
+            logger.error(f"Error in authenticate: {e}", exc_info=True)
+            raise
+
+    async def get_user_by_id(self, user_id: str, projection: dict = None):
+        return await self.find_by_id(user_id, projection)
+
+    async def _rehash_password(self, user_id, new_hash: str):
+        """Store a hash at the current cost; a failure must not fail the login."""
+        try:
+            await self._repository.update_one(
+                {"_id": user_id}, {"$set": {"password": new_hash}}
+            )
+        except Exception as e:
+            logger.warning(f"Failed to rehash password for {user_id}: {e}")
+
+    async def get_principal(self, user_id: str):
+        """Resolve the request principal through ``principal_cache``."""
+        return await principal_cache.get_or_load(
+            str(user_id), lambda: self.get_user_by_id(user_id, PRINCIPAL_PROJECTION)
+        )
+
+    async def invalidate_principal(self, user_id: str):
+        """Drop a cached principal; call after any write to that user."""
+        await principal_cache.invalidate(str(user_id))
+
+    async def create_user(self, name: str, email: str, password: str):
+        try:
+            hashed_password = await async_get_password_hash(password)
+            user = await self.create(
+                {
+                    "email": email,
+                    "password": hashed_password,
+                    "name": name,
+                    "is_active": True,
+                }
+            )
+            await self.invalidate_principal(user)
+            return user
+        except DuplicateRecordError:
+            raise ValueError("Email already exists")
+        except Exception as e:
+            logger.error(f"Error in create_user: {e}", exc_info=True)
+            raise
+
+    async def update_user(self, user_id: str, user_data: dict) -> bool:
+        result = await self._repository.update_one(
+            {"_id": ObjectId(user_id)}, {"$set": user_data}
+        )
+        await self.invalidate_principal(user_id)
+        return result.matched_count > 0
+
+    async def deactivate_user(self, user_id: str) -> bool:
+        result = await self._repository.update_one(
+            {"_id": ObjectId(user_id), "is_active": True},
+            {"$set": {"is_active": False}},
+        )
+        await self.invalidate_principal(user_id)
+        await self._refresh_tokens.revoke_user(user_id)
+        # Stateless access tokens still claim is_active until they expire
+        await self._revoked_tokens.revoke_user(
+            user_id,
+            datetime.now(timezone.utc)
+            + timedelta(minutes=STATELESS_ACCESS_TOKEN_EXPIRE_MINUTES),
+        )
+        return result.matched_count > 0
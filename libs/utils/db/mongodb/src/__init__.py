@@ -1,17 +1,115 @@
+import os
+import threading
+
+from motor.motor_asyncio import AsyncIOMotorClient
 from pymongo import MongoClient
 from pymongo.errors import PyMongoError
 
-from libs.utils.config.src.mongodb import MONGO_DATABASE_NAME, MONGO_URI
+from libs.utils.config.src.mongodb import (
+    MONGO_COMPRESSORS,
+    MONGO_DATABASE_NAME,
+    MONGO_MAX_POOL_SIZE,
+    MONGO_MIN_POOL_SIZE,
+    MONGO_SERVER_SELECTION_TIMEOUT_MS,
+    MONGO_URI,
+    MONGO_WAIT_QUEUE_TIMEOUT_MS,
+)
+
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+def get_client_options() -> dict:
+    options = {
+        "maxPoolSize": MONGO_MAX_POOL_SIZE,
+        "minPoolSize": MONGO_MIN_POOL_SIZE,
+        "serverSelectionTimeoutMS": MONGO_SERVER_SELECTION_TIMEOUT_MS,
+    }
+    if MONGO_WAIT_QUEUE_TIMEOUT_MS is not None:
+        options["waitQueueTimeoutMS"] = MONGO_WAIT_QUEUE_TIMEOUT_MS
+    if MONGO_COMPRESSORS:
+        options["compressors"] = MONGO_COMPRESSORS
+    return options
+
+
+def _get_process_client(kind: str, client_factory):
+    """Return this process's client of ``kind``, creating it on first use.
+
+    Clients are keyed by pid, so a gunicorn worker forked from a preloaded
+    master builds its own pool instead of reusing the parent's sockets and
+    monitor threads.
+    """
+    pid = os.getpid()
+    client = _clients.get((kind, pid))
+    if client is not None:
+        return client
+
+    with _clients_lock:
+        client = _clients.get((kind, pid))
+        if client is None:
+            try:
+                client = client_factory(MONGO_URI, **get_client_options())
+            except PyMongoError as error:
+                raise Exception(f"Failed to create {kind} client, ERROR: {str(error)}")
+            # Drop handles inherited from a parent process; they are unusable here
+            for key in [key for key in _clients if key[1] != pid]:
+                _clients.pop(key)
+            _clients[(kind, pid)] = client
+    return client
+
+
+def get_client() -> MongoClient:
+    return _get_process_client("MongoClient", MongoClient)
+
+
+def get_async_client() -> AsyncIOMotorClient:
+    return _get_process_client("AsyncIOMotorClient", AsyncIOMotorClient)
+
+
+class LazyCollection:
+    """Collection handle resolved against the current process's client on use."""
+
+    def __init__(self, database: "LazyDatabase", name: str):
+        self.name = name
+        self._database = database
+        self._pid = None
+        self._collection = None
+
+    def resolve(self):
+        pid = os.getpid()
+        if self._pid != pid:
+            self._collection = self._database.resolve()[self.name]
+            self._pid = pid
+        return self._collection
+
+    def __getattr__(self, item):
+        return getattr(self.resolve(), item)
+
+
+class LazyDatabase:
+    """Database handle that defers client creation until first query."""
+
+    def __init__(self, db_name: str, client_getter):
+        self.name = db_name
+        self._client_getter = client_getter
+        self._collections = {}
+
+    def resolve(self):
+        return self._client_getter()[self.name]
+
+    def __getitem__(self, name: str) -> LazyCollection:
+        if name not in self._collections:
+            self._collections[name] = LazyCollection(self, name)
+        return self._collections[name]
+
+
+def connect_db(db_name: str) -> LazyDatabase:
+    return LazyDatabase(db_name, get_client)
 
 
-def connect_db(db_name: str):
-    try:
-        client = MongoClient(MONGO_URI)
-        return client[db_name]
-    except PyMongoError as error:
-        raise Exception(
-            f'Failed to connect to database: "{db_name}",ERROR: {str(error)}'
-        )
+def connect_async_db(db_name: str) -> LazyDatabase:
+    return LazyDatabase(db_name, get_async_client)
 
 
 db = connect_db(MONGO_DATABASE_NAME)
+async_db = connect_async_db(MONGO_DATABASE_NAME)
@@ -0,0 +1,142 @@
+from typing import Any, Mapping, Optional, Sequence
+
+from motor.motor_asyncio import AsyncIOMotorCommandCursor, AsyncIOMotorCursor
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError, OperationFailure
+from pymongo.results import (
+    BulkWriteResult,
+    DeleteResult,
+    InsertManyResult,
+    InsertOneResult,
+    UpdateResult,
+)
+
+from libs.utils.db.mongodb.src.base_repository import (
+    INDEX_NOT_FOUND,
+    BaseRepository,
+    DuplicateRecordError,
+)
+
+
+class AsyncBaseRepository(BaseRepository):
+    """Motor backed counterpart of ``BaseRepository``.
+
+    Shares the timestamp handling of the synchronous repository but awaits
+    every round trip so callers never block the event loop.
+    """
+
+    async def insert_one(self, doc: dict) -> InsertOneResult:
+        self._add_timestamps(doc)
+        try:
+            return await self.collection.insert_one(doc)
+        except DuplicateKeyError as error:
+            raise DuplicateRecordError.from_error(error) from error
+
+    async def insert_many(self, docs: dict, ordered: bool = True) -> InsertManyResult:
+        for doc in docs:
+            self._add_timestamps(doc)
+        return await self.collection.insert_many(docs, ordered=ordered)
+
+    async def find_one(self, query: dict, projection: dict = None) -> dict:
+        return await self.collection.find_one(query, projection)
+
+    def find(
+        self,
+        query: dict = None,
+        projection: dict = None,
+        limit: int = 0,
+        skip: int = 0,
+        sort_key: str = None,
+        sort_type: 1 | -1 = None,
+    ) -> AsyncIOMotorCursor:
+        if query is None:
+            query = {}
+
+        cursor = self.collection.find(query, projection)
+        if sort_key is not None:
+            cursor = cursor.sort(sort_key, sort_type)
+        return cursor.skip(skip).limit(limit)
+
+    async def update_one(
+        self, query: dict, update: dict, upsert: bool = False
+    ) -> UpdateResult:
+        self._update_timestamps(update, upsert)
+        try:
+            return await self.collection.update_one(query, update, upsert)
+        except DuplicateKeyError as error:
+            raise DuplicateRecordError.from_error(error) from error
+
+    async def update_many(
+        self, query: dict, update: dict, upsert: bool = False
+    ) -> UpdateResult:
+        self._update_timestamps(update, upsert)
+        return await self.collection.update_many(query, update, upsert)
+
+    async def find_one_and_update(
+        self,
+        query: dict,
+        update: dict,
+        projection: dict = None,
+        upsert: bool = False,
+        return_document: bool = ReturnDocument.AFTER,
+    ) -> Optional[dict]:
+        self._update_timestamps(update, upsert)
+        try:
+            return await self.collection.find_one_and_update(
+                query,
+                update,
+                projection=projection,
+                upsert=upsert,
+                return_document=return_document,
+            )
+        except DuplicateKeyError as error:
+            raise DuplicateRecordError.from_error(error) from error
+
+    async def count_documents(self, query: dict = None) -> int:
+        if query is None:
+            query = {}
+        return await self.collection.count_documents(query)
+
+    async def estimated_document_count(self) -> int:
+        return await self.collection.estimated_document_count()
+
+    async def delete_one(self, query: dict) -> DeleteResult:
+        return await self.collection.delete_one(query)
+
+    async def delete_many(self, query: dict) -> DeleteResult:
+        return await self.collection.delete_many(query)
+
+    async def bulk_write(
+        self, requests: Sequence[Any], ordered: bool = True
+    ) -> BulkWriteResult:
+        try:
+            return await self.collection.bulk_write(list(requests), ordered=ordered)
+        except DuplicateKeyError as error:
+            # Per-write failures arrive as BulkWriteError and are left to callers
+            raise DuplicateRecordError.from_error(error) from error
+
+    def aggregate(
+        self,
+        pipeline: Sequence[Mapping[str, Any]],
+        allow_disk_use: bool = False,
+    ) -> AsyncIOMotorCommandCursor:
+        return self.collection.aggregate(pipeline, allowDiskUse=allow_disk_use)
+
+    async def create_index(self, keys: Sequence[tuple], **kwargs) -> str:
+        return await self.collection.create_index(keys, **kwargs)
+
+    async def ensure_indexes(self) -> list[str]:
+        """Create the declared indexes, then drop the ones they replace.
+
+        Already existing indexes are left as is.
+        """
+        names = []
+        if self.indexes:
+            names = await self.collection.create_indexes(self.indexes)
+        for name in self.obsolete_indexes:
+            try:
+                await self.collection.drop_index(name)
+            except OperationFailure as error:
+                if error.code != INDEX_NOT_FOUND:
+                    raise
+        return names
@@ -1,26 +1,54 @@
 from datetime import datetime, timezone
-from typing import Any, Mapping, Sequence
+from typing import Any, Mapping, Optional, Sequence
 
+from pymongo import IndexModel, ReturnDocument, UpdateOne
 from pymongo.cursor import Cursor
+from pymongo.errors import DuplicateKeyError, OperationFailure
 from pymongo.results import (
+    BulkWriteResult,
     DeleteResult,
     InsertManyResult,
     InsertOneResult,
     UpdateResult,
 )
 
+# Server code for "index not found" when dropping an index that is already gone
+INDEX_NOT_FOUND = 27
+
+
+class DuplicateRecordError(ValueError):
+    """A write violated a unique index; ``fields`` names the conflicting keys."""
+
+    def __init__(self, fields: Sequence[str]):
+        self.fields = list(fields)
+        super().__init__(f"Duplicate value for {', '.join(self.fields) or 'key'}")
+
+    @classmethod
+    def from_error(cls, error: DuplicateKeyError) -> "DuplicateRecordError":
+        details = error.details or {}
+        return cls(list(details.get("keyPattern") or details.get("keyValue") or {}))
+
 
 class BaseRepository:
-    def __init__(self, collection, timestamps: bool = False):
+    def __init__(
+        self,
+        collection,
+        timestamps: bool = False,
+        indexes: Sequence[IndexModel] = (),
+        obsolete_indexes: Sequence[str] = (),
+    ):
         self.collection = collection
         self.timestamps = timestamps
+        self.indexes = list(indexes)
+        # Names of indexes replaced by ``indexes``; dropped by ``ensure_indexes``
+        self.obsolete_indexes = list(obsolete_indexes)
 
-    def __add_timestamps(self, doc: dict):
+    def _add_timestamps(self, doc: dict):
         if self.timestamps:
             current_time = datetime.now(timezone.utc)
             doc.update({"createdAt": current_time, "updatedAt": current_time})
 
-    def __update_timestamps(self, doc: dict, upsert: bool):
+    def _update_timestamps(self, doc: dict, upsert: bool):
         if not self.timestamps:
             return
 
@@ -42,18 +70,23 @@ class BaseRepository:
     def get_name(self):
         return self.collection.name
 
+    @property
+    def has_unique_index(self) -> bool:
+        return any(index.document.get("unique") for index in self.indexes)
+
     def insert_one(self, doc: dict) -> InsertOneResult:
-        self.__add_timestamps(doc)
-        return self.collection.insert_one(doc)
+        self._add_timestamps(doc)
+        try:
+            return self.collection.insert_one(doc)
+        except DuplicateKeyError as error:
+            raise DuplicateRecordError.from_error(error) from error
 
-    def insert_many(self, docs: dict) -> InsertManyResult:
+    def insert_many(self, docs: dict, ordered: bool = True) -> InsertManyResult:
         for doc in docs:
-            self.__add_timestamps(doc)
-        return self.collection.insert_many(docs)
+            self._add_timestamps(doc)
+        return self.collection.insert_many(docs, ordered=ordered)
 
     def find_one(self, query: dict, projection: dict = None) -> dict:
-        if projection is None:
-            projection = {}
         return self.collection.find_one(query, projection)
 
     def find(
@@ -67,8 +100,6 @@ class BaseRepository:
     ) -> Cursor[dict]:
         if query is None:
             query = {}
-        if projection is None:
-            projection = {}
 
         if sort_key is not None:
             self.collection.find(query, projection).sort(sort_key, sort_type)
@@ -77,15 +108,39 @@ class BaseRepository:
     def update_one(
         self, query: dict, update: dict, upsert: bool = False
     ) -> UpdateResult:
-        self.__update_timestamps(update, upsert)
-        return self.collection.update_one(query, update, upsert)
+        self._update_timestamps(update, upsert)
+        try:
+            return self.collection.update_one(query, update, upsert)
+        except DuplicateKeyError as error:
+            raise DuplicateRecordError.from_error(error) from error
 
     def update_many(
         self, query: dict, update: dict, upsert: bool = False
     ) -> UpdateResult:
-        self.__update_timestamps(update, upsert)
+        self._update_timestamps(update, upsert)
         return self.collection.update_many(query, update, upsert)
 
+    def find_one_and_update(
+        self,
+        query: dict,
+        update: dict,
+        projection: dict = None,
+        upsert: bool = False,
+        return_document: bool = ReturnDocument.AFTER,
+    ) -> Optional[dict]:
+        """Update one document and return it (after the update by default)."""
+        self._update_timestamps(update, upsert)
+        try:
+            return self.collection.find_one_and_update(
+                query,
+                update,
+                projection=projection,
+                upsert=upsert,
+                return_document=return_document,
+            )
+        except DuplicateKeyError as error:
+            raise DuplicateRecordError.from_error(error) from error
+
     def count_documents(self, query: dict = None) -> int:
         if query is None:
             query = {}
@@ -100,9 +155,45 @@ class BaseRepository:
     def delete_many(self, query: dict) -> DeleteResult:
         return self.collection.delete_many(query)
 
+    def update_one_op(
+        self, query: dict, update: dict, upsert: bool = False
+    ) -> UpdateOne:
+        """An ``UpdateOne`` for ``bulk_write``, timestamped like ``update_one``."""
+        self._update_timestamps(update, upsert)
+        return UpdateOne(query, update, upsert=upsert)
+
+    def bulk_write(
+        self, requests: Sequence[Any], ordered: bool = True
+    ) -> BulkWriteResult:
+        """Send ``requests`` unchanged; ``update_one_op`` builds timestamped ones."""
+        try:
+            return self.collection.bulk_write(list(requests), ordered=ordered)
+        except DuplicateKeyError as error:
+            # Per-write failures arrive as BulkWriteError and are left to callers
+            raise DuplicateRecordError.from_error(error) from error
+
     def aggregate(
         self,
         pipeline: Sequence[Mapping[str, Any]],
         allow_disk_use: bool = False,
     ) -> Cursor[dict]:
         return self.collection.aggregate(pipeline, allowDiskUse=allow_disk_use)
+
+    def create_index(self, keys: Sequence[tuple], **kwargs) -> str:
+        return self.collection.create_index(keys, **kwargs)
+
+    def ensure_indexes(self) -> list[str]:
+        """Create the declared indexes, then drop the ones they replace.
+
+        Already existing indexes are left as is.
+        """
+        names = []
+        if self.indexes:
+            names = self.collection.create_indexes(self.indexes)
+        for name in self.obsolete_indexes:
+            try:
+                self.collection.drop_index(name)
+            except OperationFailure as error:
+                if error.code != INDEX_NOT_FOUND:
+                    raise
+        return names
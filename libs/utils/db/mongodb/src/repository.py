@@ -1,12 +1,163 @@
-from libs.utils.db.mongodb.src import db
+from pymongo import ASCENDING, DESCENDING, IndexModel
+
+from libs.utils.db.mongodb.src import async_db, db
+from libs.utils.db.mongodb.src.async_base_repository import AsyncBaseRepository
 from libs.utils.db.mongodb.src.base_repository import BaseRepository
 
+ACTIVE_ONLY = {"is_active": True}
+
+# Index specs, ensured idempotently at app startup
+
+# Active emails are unique; deactivated records may reuse an address
+UNIQUE_ACTIVE_EMAIL_INDEX = IndexModel(
+    [("email", ASCENDING)],
+    name="email_unique_active",
+    unique=True,
+    partialFilterExpression=ACTIVE_ONLY,
+)
+# Superseded by UNIQUE_ACTIVE_EMAIL_INDEX
+OBSOLETE_EMAIL_INDEXES = ["email_active"]
+
+USERS_INDEXES = [UNIQUE_ACTIVE_EMAIL_INDEX]
+EMPLOYEES_INDEXES = [
+    UNIQUE_ACTIVE_EMAIL_INDEX,
+    IndexModel(
+        [("is_active", ASCENDING), ("date_joined", DESCENDING), ("_id", DESCENDING)],
+        name="is_active_date_joined_id",
+    ),
+    IndexModel(
+        [
+            ("department", ASCENDING),
+            ("role", ASCENDING),
+            ("date_joined", DESCENDING),
+            ("_id", DESCENDING),
+        ],
+        name="department_role_date_joined_id_active",
+        partialFilterExpression=ACTIVE_ONLY,
+    ),
+    # Department-only lists: the index above leaves role unbounded between
+    # department and the sort keys, which would need a blocking sort
+    IndexModel(
+        [("department", ASCENDING), ("date_joined", DESCENDING), ("_id", DESCENDING)],
+        name="department_date_joined_id_active",
+        partialFilterExpression=ACTIVE_ONLY,
+    ),
+    IndexModel(
+        [("role", ASCENDING), ("date_joined", DESCENDING), ("_id", DESCENDING)],
+        name="role_date_joined_id_active",
+        partialFilterExpression=ACTIVE_ONLY,
+    ),
+    # Delta reloads of the employee search index read writes since a timestamp
+    IndexModel([("updatedAt", ASCENDING)], name="updatedAt"),
+]
+# Entries are removed by Mongo once no token they deny can still be valid
+REVOKED_TOKENS_INDEXES = [
+    IndexModel(
+        [("expires_at", ASCENDING)], name="expires_at_ttl", expireAfterSeconds=0
+    ),
+]
+REFRESH_TOKENS_INDEXES = [
+    IndexModel(
+        [("expires_at", ASCENDING)], name="expires_at_ttl", expireAfterSeconds=0
+    ),
+    IndexModel([("user_id", ASCENDING)], name="user_id"),
+]
+
 # Collection references
 users_collection = db["users"]
 employees_collection = db["employees"]
 
+async_users_collection = async_db["users"]
+async_employees_collection = async_db["employees"]
+async_revoked_tokens_collection = async_db["revoked_tokens"]
+async_refresh_tokens_collection = async_db["refresh_tokens"]
+async_employee_headcounts_collection = async_db["employee_headcounts"]
+
 # Repository instances
-users_repository = BaseRepository(collection=users_collection, timestamps=True)
-employees_repository = BaseRepository(collection=employees_collection, timestamps=True)
+users_repository = BaseRepository(
+    collection=users_collection,
+    timestamps=True,
+    indexes=USERS_INDEXES,
+    obsolete_indexes=OBSOLETE_EMAIL_INDEXES,
+)
+employees_repository = BaseRepository(
+    collection=employees_collection,
+    timestamps=True,
+    indexes=EMPLOYEES_INDEXES,
+    obsolete_indexes=OBSOLETE_EMAIL_INDEXES,
+)
+
+async_users_repository = AsyncBaseRepository(
+    collection=async_users_collection,
+    timestamps=True,
+    indexes=USERS_INDEXES,
+    obsolete_indexes=OBSOLETE_EMAIL_INDEXES,
+)
+async_employees_repository = AsyncBaseRepository(
+    collection=async_employees_collection,
+    timestamps=True,
+    indexes=EMPLOYEES_INDEXES,
+    obsolete_indexes=OBSOLETE_EMAIL_INDEXES,
+)
+
+async_revoked_tokens_repository = AsyncBaseRepository(
+    collection=async_revoked_tokens_collection, indexes=REVOKED_TOKENS_INDEXES
+)
+async_refresh_tokens_repository = AsyncBaseRepository(
+    collection=async_refresh_tokens_collection, indexes=REFRESH_TOKENS_INDEXES
+)
+
+# Counter documents keyed by "<department>:<role>"; no secondary indexes needed
+async_employee_headcounts_repository = AsyncBaseRepository(
+    collection=async_employee_headcounts_collection
+)
+
+async_repositories = [
+    async_users_repository,
+    async_employees_repository,
+    async_revoked_tokens_repository,
+    async_refresh_tokens_repository,
+]
+
+
+class UniqueIndexError(RuntimeError):
+    """A unique index could not be ensured, so duplicates would go unchecked."""
+
+    def __init__(self, failures: dict[str, Exception]):
+        self.failures = failures
+        super().__init__(
+            "; ".join(f"{name}: {error}" for name, error in failures.items())
+        )
+
+
+async def ensure_indexes() -> dict[str, Exception]:
+    """Ensure every repository's indexes, each independently of the others.
+
+    Returns the errors of repositories whose indexes could not be ensured, by
+    collection name. Raises ``UniqueIndexError`` with all of them if one of
+    those declares a unique index: nothing else enforces uniqueness.
+    """
+    failures = {}
+    unique_failed = False
+    for repository in async_repositories:
+        try:
+            await repository.ensure_indexes()
+        except Exception as error:
+            failures[repository.get_name()] = error
+            unique_failed = unique_failed or repository.has_unique_index
+    if unique_failed:
+        raise UniqueIndexError(failures)
+    return failures
+
 
-__all__ = ["users_repository", "employees_repository"]
+__all__ = [
+    "users_repository",
+    "employees_repository",
+    "async_users_repository",
+    "async_employees_repository",
+    "async_revoked_tokens_repository",
+    "async_refresh_tokens_repository",
+    "async_employee_headcounts_repository",
+    "ensure_indexes",
+    "UniqueIndexError",
+]
@@ -5,6 +5,11 @@ class TokenType(Enum):
     Bearer = "Bearer"
 
 
+class AuthMode(str, Enum):
+    STATEFUL = "stateful"
+    STATELESS = "stateless"
+
+
 class DepartmentType(str, Enum):
     HR = "HR"
     SALES = "SALES"
@@ -1,6 +1,7 @@
 import sys
 from pathlib import Path
 
+import motor.motor_asyncio
 import pymongo
 import pytest
 from fastapi.testclient import TestClient
@@ -14,6 +15,12 @@ class _DummyCollection:
     def __init__(self, name: str):
         self.name = name
 
+    async def create_indexes(self, indexes):
+        return [index.document["name"] for index in indexes]
+
+    async def drop_index(self, name):
+        return None
+
 
 class _DummyDatabase:
     def __getitem__(self, name: str):
@@ -30,6 +37,7 @@ def _dummy_mongo_client(*_args, **_kwargs):
 
 
 pymongo.MongoClient = _dummy_mongo_client
+motor.motor_asyncio.AsyncIOMotorClient = _dummy_mongo_client
 
 
 @pytest.fixture
@@ -1,7 +1,9 @@
 def test_login_uses_service_stub(client, monkeypatch):
-    from apps.fastapi.platform.modules.auth.src import service as auth_service_module
+    from apps.fastapi.platform.modules.auth.src import (
+        service as auth_service_module,
+    )
 
-    def fake_login_user(_login_data):
+    async def fake_login_user(_login_data):
         return {
             "success": True,
             "message": "Successfully logged in",
@@ -28,9 +30,11 @@ def test_login_uses_service_stub(client, monkeypatch):
 
 
 def test_signup_uses_service_stub(client, monkeypatch):
-    from apps.fastapi.platform.modules.auth.src import service as auth_service_module
+    from apps.fastapi.platform.modules.auth.src import (
+        service as auth_service_module,
+    )
 
-    def fake_signup_user(_signup_data):
+    async def fake_signup_user(_signup_data):
         return {
             "success": True,
             "message": "Successfully registered",
@@ -55,9 +59,11 @@ def test_signup_uses_service_stub(client, monkeypatch):
 
 
 def test_login_returns_400_on_value_error(client, monkeypatch):
-    from apps.fastapi.platform.modules.auth.src import service as auth_service_module
+    from apps.fastapi.platform.modules.auth.src import (
+        service as auth_service_module,
+    )
 
-    def fake_login_user(_login_data):
+    async def fake_login_user(_login_data):
         raise ValueError("Incorrect email or password")
 
     monkeypatch.setattr(auth_service_module.auth_service, "login_user", fake_login_user)
@@ -71,3 +77,415 @@ def test_login_returns_400_on_value_error(client, monkeypatch):
     payload = response.json()
     assert payload["success"] is False
     assert payload["message"] == "Incorrect email or password"
+
+
+def test_require_user_awaits_async_user_lookup(client, monkeypatch):
+    from apps.fastapi.auth.src import helpers as auth_helpers
+    from apps.fastapi.platform.modules.employees.src import (
+        service as employee_service,
+    )
+    from libs.fastapi.platform.modules.auth.src import create_token
+    from libs.utils.common.cache.src import (
+        InMemoryCacheBackend,
+        ReadThroughCache,
+    )
+    from libs.utils.db.mongodb.operations.src import users as user_ops
+
+    monkeypatch.setattr(
+        user_ops, "principal_cache", ReadThroughCache(InMemoryCacheBackend(10), 60, 60)
+    )
+    projections = []
+
+    async def fake_get_user_by_id(user_id, projection=None):
+        projections.append(projection)
+        return {"_id": user_id, "email": "user@example.com", "is_active": True}
+
+    async def fake_list_employees(
+        _department, _role, _page, _page_size, _cursor, _include_total
+    ):
+        return {"success": True, "data": None}
+
+    monkeypatch.setattr(
+        auth_helpers.async_users_operations, "get_user_by_id", fake_get_user_by_id
+    )
+    monkeypatch.setattr(
+        employee_service.employee_service, "list_employees", fake_list_employees
+    )
+
+    token = create_token({"user_id": "user-123"})
+    for _ in range(2):
+        response = client.get(
+            "/api/employees", headers={"Authorization": f"Bearer {token}"}
+        )
+        assert response.status_code == 200
+        assert response.json()["success"] is True
+
+    assert projections == [user_ops.PRINCIPAL_PROJECTION]
+    assert user_ops.principal_cache.stats()["hits"] == 1
+
+
+def test_deactivate_user_invalidates_cached_principal(client, monkeypatch):
+    from bson import ObjectId
+
+    from apps.fastapi.auth.src import helpers as auth_helpers
+    from apps.fastapi.platform.modules.employees.src import (
+        service as employee_service,
+    )
+    from libs.fastapi.platform.modules.auth.src import create_token
+    from libs.utils.common.cache.src import (
+        InMemoryCacheBackend,
+        ReadThroughCache,
+    )
+    from libs.utils.db.mongodb.operations.src import users as user_ops
+
+    class _UpdateResult:
+        matched_count = 1
+
+    class _UsersRepository:
+        def __init__(self):
+            self.user = {"email": "user@example.com", "is_active": True}
+            self.find_one_calls = 0
+
+        async def find_one(self, query, projection=None):
+            self.find_one_calls += 1
+            return {"_id": query["_id"], **self.user}
+
+        async def update_one(self, query, update, upsert=False):
+            self.user.update(update["$set"])
+            return _UpdateResult()
+
+    class _RevokedTokens:
+        def __init__(self):
+            self.revoked_users = []
+
+        async def revoke_user(self, user_id, expires_at=None):
+            self.revoked_users.append(user_id)
+
+    async def fake_list_employees(
+        _department, _role, _page, _page_size, _cursor, _include_total
+    ):
+        return {"success": True, "data": None}
+
+    repository = _UsersRepository()
+    revoked_tokens = _RevokedTokens()
+    refresh_tokens = _RevokedTokens()
+    monkeypatch.setattr(
+        auth_helpers.async_users_operations, "_revoked_tokens", revoked_tokens
+    )
+    monkeypatch.setattr(
+        auth_helpers.async_users_operations, "_refresh_tokens", refresh_tokens
+    )
+    monkeypatch.setattr(
+        user_ops, "principal_cache", ReadThroughCache(InMemoryCacheBackend(10), 60, 60)
+    )
+    monkeypatch.setattr(auth_helpers.async_users_operations, "_repository", repository)
+    monkeypatch.setattr(
+        employee_service.employee_service, "list_employees", fake_list_employees
+    )
+    user_id = str(ObjectId())
+    headers = {"Authorization": f"Bearer {create_token({'user_id': user_id})}"}
+
+    assert client.get("/api/employees", headers=headers).status_code == 200
+    assert client.get("/api/employees", headers=headers).status_code == 200
+    assert repository.find_one_calls == 1
+
+    client.portal.call(auth_helpers.async_users_operations.deactivate_user, user_id)
+
+    assert client.get("/api/employees", headers=headers).status_code == 403
+    assert repository.find_one_calls == 2
+    assert revoked_tokens.revoked_users == [user_id]
+    assert refresh_tokens.revoked_users == [user_id]
+
+
+def test_stateless_mode_trusts_claims_and_honours_revocations(client, monkeypatch):
+    from apps.fastapi.auth.src import helpers as auth_helpers
+    from apps.fastapi.platform.modules.employees.src import (
+        service as employee_service,
+    )
+    from libs.fastapi.platform.modules.auth.src import (
+        RevocationList,
+        create_token,
+    )
+    from libs.utils.enums.src import AuthMode
+
+    revoked_users = {}
+
+    async def load_revocations():
+        return dict(revoked_users), set()
+
+    async def fail_get_principal(_user_id):
+        raise AssertionError("stateless mode must not look the user up")
+
+    async def fake_list_employees(
+        _department, _role, _page, _page_size, _cursor, _include_total
+    ):
+        return {"success": True, "data": None}
+
+    monkeypatch.setattr(auth_helpers, "AUTH_MODE", AuthMode.STATELESS)
+    monkeypatch.setattr(
+        auth_helpers, "revocation_list", RevocationList(load_revocations, 0)
+    )
+    monkeypatch.setattr(
+        auth_helpers.async_users_operations, "get_principal", fail_get_principal
+    )
+    monkeypatch.setattr(
+        employee_service.employee_service, "list_employees", fake_list_employees
+    )
+    token = create_token({"user_id": "user-123", "is_active": True, "role": "ADMIN"})
+    headers = {"Authorization": f"Bearer {token}"}
+
+    assert client.get("/api/employees", headers=headers).status_code == 200
+
+    revoked_users["user-123"] = float("inf")
+    response = client.get("/api/employees", headers=headers)
+
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Token revoked"
+
+
+def test_bearer_token_is_verified_once_across_requests(client, monkeypatch):
+    from apps.fastapi.auth.src import helpers as auth_helpers
+    from apps.fastapi.platform.modules.employees.src import (
+        service as employee_service,
+    )
+    from libs.fastapi.platform.modules.auth.src import create_token
+    from libs.utils.common.cache.src import InMemoryCacheBackend
+
+    decoded = []
+    decode_jwt_claims = auth_helpers.decode_jwt_claims
+
+    def counting_decode_jwt_claims(token):
+        decoded.append(token)
+        return decode_jwt_claims(token)
+
+    async def fake_get_principal(user_id):
+        return {"_id": user_id, "email": "user@example.com", "is_active": True}
+
+    async def fake_list_employees(
+        _department, _role, _page, _page_size, _cursor, _include_total
+    ):
+        return {"success": True, "data": None}
+
+    monkeypatch.setattr(auth_helpers, "decode_jwt_claims", counting_decode_jwt_claims)
+    monkeypatch.setattr(auth_helpers, "verified_tokens", InMemoryCacheBackend(10))
+    monkeypatch.setattr(
+        auth_helpers.async_users_operations, "get_principal", fake_get_principal
+    )
+    monkeypatch.setattr(
+        employee_service.employee_service, "list_employees", fake_list_employees
+    )
+    headers = {"Authorization": f"Bearer {create_token({'user_id': 'user-123'})}"}
+
+    for _ in range(3):
+        assert client.get("/api/employees", headers=headers).status_code == 200
+
+    assert len(decoded) == 1
+
+
+def test_invalid_bearer_token_is_rejected(client):
+    response = client.get(
+        "/api/employees", headers={"Authorization": "Bearer not-a-token"}
+    )
+
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Invalid token"
+
+
+def test_login_returns_503_when_password_hashing_is_saturated(client, monkeypatch):
+    from apps.fastapi.platform.modules.auth.src import (
+        service as auth_service_module,
+    )
+    from libs.fastapi.platform.modules.auth.src import PasswordHasherBusyError
+
+    async def fake_login_user(_login_data):
+        raise PasswordHasherBusyError("Too many password operations in progress")
+
+    monkeypatch.setattr(auth_service_module.auth_service, "login_user", fake_login_user)
+
+    response = client.post(
+        "/api/auth/login",
+        json={"email": "user@example.com", "password": "secret123"},
+    )
+
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "1"
+    assert response.json()["success"] is False
+
+
+def test_password_jobs_run_off_the_event_loop_with_a_queue_limit(monkeypatch):
+    import asyncio
+    import threading
+
+    import pytest
+
+    from libs.fastapi.platform.modules.auth.src import (
+        helpers as auth_lib_helpers,
+    )
+
+    monkeypatch.setattr(auth_lib_helpers, "PASSWORD_HASH_MAX_PENDING", 1)
+    release = threading.Event()
+
+    def blocking_job():
+        release.wait(timeout=5)
+        return threading.current_thread().name
+
+    async def scenario():
+        first = asyncio.ensure_future(auth_lib_helpers._run_password_job(blocking_job))
+        await asyncio.sleep(0)
+        with pytest.raises(auth_lib_helpers.PasswordHasherBusyError):
+            await auth_lib_helpers._run_password_job(blocking_job)
+        release.set()
+        return await first
+
+    thread_name = asyncio.run(scenario())
+
+    assert thread_name.startswith("password-hash")
+    assert auth_lib_helpers._pending_password_jobs == 0
+
+
+def test_cancelled_password_job_keeps_its_slot_until_it_finishes(monkeypatch):
+    import asyncio
+    import threading
+    import time
+
+    import pytest
+
+    from libs.fastapi.platform.modules.auth.src import (
+        helpers as auth_lib_helpers,
+    )
+
+    monkeypatch.setattr(auth_lib_helpers, "PASSWORD_HASH_MAX_PENDING", 1)
+    started = threading.Event()
+    release = threading.Event()
+
+    def blocking_job():
+        started.set()
+        release.wait(timeout=5)
+
+    async def scenario():
+        first = asyncio.ensure_future(auth_lib_helpers._run_password_job(blocking_job))
+        await asyncio.to_thread(started.wait, 5)
+        # The client went away, but bcrypt is still running in the pool
+        first.cancel()
+        await asyncio.sleep(0)
+        with pytest.raises(auth_lib_helpers.PasswordHasherBusyError):
+            await auth_lib_helpers._run_password_job(blocking_job)
+
+    asyncio.run(scenario())
+    assert auth_lib_helpers._pending_password_jobs == 1
+
+    release.set()
+    deadline = time.monotonic() + 5
+    while auth_lib_helpers._pending_password_jobs and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert auth_lib_helpers._pending_password_jobs == 0
+
+
+def test_refresh_rotates_tokens_and_rejects_reuse(client, monkeypatch):
+    from apps.fastapi.auth.src import helpers as auth_helpers
+    from apps.fastapi.platform.modules.auth.src import (
+        service as auth_service_module,
+    )
+    from libs.fastapi.platform.modules.auth.src import InMemoryRefreshTokenStore
+
+    user = {"_id": "user-123", "email": "user@example.com", "is_active": True}
+
+    async def fake_authenticate(_email, _password):
+        return user
+
+    async def fake_get_principal(_user_id):
+        return user
+
+    store = InMemoryRefreshTokenStore()
+    monkeypatch.setattr(auth_service_module, "refresh_token_store", store)
+    monkeypatch.setattr(
+        auth_helpers.async_users_operations, "authenticate", fake_authenticate
+    )
+    monkeypatch.setattr(
+        auth_helpers.async_users_operations, "get_principal", fake_get_principal
+    )
+
+    login = client.post(
+        "/api/auth/login",
+        json={"email": "user@example.com", "password": "secret123"},
+    ).json()["data"]
+    first_refresh = login["refresh_token"]
+
+    refreshed = client.post("/api/auth/refresh", json={"refresh_token": first_refresh})
+    assert refreshed.status_code == 200
+    second_refresh = refreshed.json()["data"]["refresh_token"]
+    assert second_refresh != first_refresh
+
+    reused = client.post("/api/auth/refresh", json={"refresh_token": first_refresh})
+    assert reused.status_code == 401
+
+    # Reuse ends the whole session family, including the newest refresh token
+    revoked = client.post("/api/auth/refresh", json={"refresh_token": second_refresh})
+    assert revoked.status_code == 401
+
+    as_access = client.get(
+        "/api/employees", headers={"Authorization": f"Bearer {second_refresh}"}
+    )
+    assert as_access.status_code == 401
+    assert as_access.json()["detail"] == "Invalid token type"
+
+
+def test_refresh_rejects_access_tokens(client):
+    from libs.fastapi.platform.modules.auth.src import (
+        ACCESS_TOKEN_TYPE,
+        create_token,
+    )
+
+    access_token = create_token({"user_id": "user-123", "type": ACCESS_TOKEN_TYPE})
+
+    response = client.post("/api/auth/refresh", json={"refresh_token": access_token})
+
+    assert response.status_code == 401
+    assert response.json()["message"] == "Invalid refresh token"
+
+
+def test_authenticate_rehashes_passwords_stored_at_an_old_cost(monkeypatch):
+    import asyncio
+
+    from bson import ObjectId
+
+    from libs.fastapi.platform.modules.auth.src import (
+        build_password_context,
+    )
+    from libs.fastapi.platform.modules.auth.src import (
+        helpers as auth_lib_helpers,
+    )
+    from libs.utils.db.mongodb.operations.src.users import AsyncUsersOperations
+
+    class _UsersRepository:
+        def __init__(self, user):
+            self.user = user
+            self.updates = []
+
+        async def find_one(self, query, projection=None):
+            return dict(self.user)
+
+        async def update_one(self, query, update, upsert=False):
+            self.updates.append(update)
+            self.user.update(update["$set"])
+
+    monkeypatch.setattr(auth_lib_helpers, "pwd_context", build_password_context(5))
+    repository = _UsersRepository(
+        {
+            "_id": ObjectId(),
+            "email": "user@example.com",
+            "password": build_password_context(4).hash("secret123"),
+        }
+    )
+    operations = AsyncUsersOperations()
+    operations._repository = repository
+
+    async def scenario():
+        assert await operations.authenticate("user@example.com", "wrong") is None
+        assert await operations.authenticate("user@example.com", "secret123")
+        assert await operations.authenticate("user@example.com", "secret123")
+
+    asyncio.run(scenario())
+
+    assert len(repository.updates) == 1
+    assert repository.user["password"].startswith("$2b$05$")
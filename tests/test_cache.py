@@ -0,0 +1,200 @@
+class _FakeRedis:
+    """Local stand-in for ``redis.asyncio.Redis`` covering the calls we make."""
+
+    def __init__(self):
+        self.values = {}
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def set(self, key, value, px=None):
+        self.values[key] = value
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.values.pop(key, None)
+
+    async def eval(self, script, numkeys, *keys_and_args):
+        from libs.utils.common.cache.src import RedisCacheBackend
+
+        keys, args = keys_and_args[:numkeys], keys_and_args[numkeys:]
+        if script == RedisCacheBackend.DELETE_SCRIPT:
+            for key in keys:
+                self.values.pop(key, None)
+                version = int(self.values.get(f"{key}#version", 0)) + 1
+                self.values[f"{key}#version"] = str(version).encode()
+            return None
+        version = self.values.get(f"{keys[0]}#version", b"").decode()
+        if version != args[0]:
+            return 0
+        self.values[keys[0]] = args[1]
+        return 1
+
+
+class _CountingEmployeesRepository:
+    def __init__(self, document):
+        self.document = document
+        self.find_one_calls = 0
+
+    async def find_one(self, query, projection=None):
+        self.find_one_calls += 1
+        return self.document
+
+    async def find_one_and_update(self, query, update, projection=None, **kwargs):
+        self.document = {**self.document, **update["$set"]}
+        return self.document
+
+
+def test_in_memory_backend_evicts_least_recently_used_and_expired():
+    import asyncio
+
+    from libs.utils.common.cache.src import MISSING, InMemoryCacheBackend
+
+    async def scenario():
+        backend = InMemoryCacheBackend(max_size=2)
+        await backend.set("a", 1, 60)
+        await backend.set("b", 2, 60)
+        await backend.get("a")
+        await backend.set("c", 3, 60)
+        assert await backend.get("b") is MISSING
+        assert await backend.get("a") == 1
+
+        await backend.set("d", None, -1)
+        assert await backend.get("d") is MISSING
+
+    asyncio.run(scenario())
+
+
+def test_read_through_cache_counts_hits_and_caches_missing_values():
+    import asyncio
+
+    from libs.utils.common.cache.src import (
+        InMemoryCacheBackend,
+        ReadThroughCache,
+    )
+
+    loads = []
+
+    async def load_missing():
+        loads.append("missing")
+        return None
+
+    async def scenario():
+        cache = ReadThroughCache(InMemoryCacheBackend(10), 60, 60)
+        assert await cache.get_or_load("x", load_missing) is None
+        assert await cache.get_or_load("x", load_missing) is None
+        await cache.invalidate("x")
+        assert await cache.get_or_load("x", load_missing) is None
+        return cache.stats()
+
+    stats = asyncio.run(scenario())
+
+    assert loads == ["missing", "missing"]
+    assert stats == {"hits": 1, "misses": 2, "hit_ratio": 1 / 3}
+
+
+def test_redis_backend_round_trips_bson_values():
+    import asyncio
+    from datetime import datetime
+
+    from bson import ObjectId
+
+    from libs.utils.common.cache.src import MISSING, RedisCacheBackend
+
+    document = {"_id": ObjectId(), "date_joined": datetime(2025, 1, 1)}
+
+    async def scenario():
+        client = _FakeRedis()
+        backend = RedisCacheBackend(client, "employees")
+        await backend.set("1", document, 60)
+        await backend.set("2", None, 5)
+        assert set(client.values) == {"employees:1", "employees:2"}
+        assert await backend.get("1") == document
+        assert await backend.get("2") is None
+        await backend.delete("1", "2")
+        assert await backend.get("1") is MISSING
+        assert await backend.get("2") is MISSING
+
+    asyncio.run(scenario())
+
+
+def test_redis_fill_is_dropped_after_another_workers_invalidation():
+    import asyncio
+
+    from libs.utils.common.cache.src import (
+        MISSING,
+        ReadThroughCache,
+        RedisCacheBackend,
+    )
+
+    client = _FakeRedis()
+    # Two workers with their own cache objects over one Redis
+    reader = ReadThroughCache(RedisCacheBackend(client, "employees"), 60, 5)
+    writer = ReadThroughCache(RedisCacheBackend(client, "employees"), 60, 5)
+
+    async def scenario():
+        loading = asyncio.Event()
+        written = asyncio.Event()
+
+        async def load_before_write():
+            loading.set()
+            await written.wait()
+            return {"name": "Alice"}
+
+        async def write():
+            await loading.wait()
+            await writer.invalidate("1")
+            written.set()
+
+        stale, _ = await asyncio.gather(
+            reader.get_or_load("1", load_before_write), write()
+        )
+        assert stale == {"name": "Alice"}
+        assert await reader.backend.get("1") is MISSING
+
+        async def load_after_write():
+            return {"name": "Alicia"}
+
+        await reader.get_or_load("1", load_after_write)
+        assert await reader.backend.get("1") == {"name": "Alicia"}
+
+    asyncio.run(scenario())
+
+
+def test_get_employee_by_id_is_served_from_cache_until_updated(monkeypatch):
+    import asyncio
+
+    from bson import ObjectId
+
+    from libs.utils.common.cache.src import (
+        InMemoryCacheBackend,
+        ReadThroughCache,
+    )
+    from libs.utils.db.mongodb.operations.src import employees as employee_ops
+
+    monkeypatch.setattr(
+        employee_ops,
+        "employee_cache",
+        ReadThroughCache(InMemoryCacheBackend(10), 60, 5),
+    )
+    employee_id = ObjectId()
+    repository = _CountingEmployeesRepository(
+        {"_id": employee_id, "name": "Alice", "email": "alice@example.com"}
+    )
+    operations = employee_ops.AsyncEmployeesOperations()
+    operations._repository = repository
+
+    async def scenario():
+        first = await operations.get_employee_by_id(str(employee_id), {"name": 1})
+        second = await operations.get_employee_by_id(str(employee_id))
+        assert repository.find_one_calls == 1
+        assert first == {"_id": employee_id, "name": "Alice"}
+        assert second["email"] == "alice@example.com"
+
+        await operations.update_employee(str(employee_id), {"name": "Alicia"})
+        return await operations.get_employee_by_id(str(employee_id))
+
+    employee = asyncio.run(scenario())
+
+    assert repository.find_one_calls == 2
+    assert employee["name"] == "Alicia"
@@ -5,3 +5,12 @@ def test_health_endpoint_returns_success(client):
     payload = response.json()
     assert payload["success"] is True
     assert "uptime" in payload
+
+
+def test_metrics_endpoint_reports_cache_counters(client):
+    response = client.get("/api/metrics")
+
+    assert response.status_code == 200
+    caches = response.json()["caches"]
+    assert {"employees", "principals"} <= set(caches)
+    assert set(caches["principals"]) == {"hits", "misses", "hit_ratio"}
@@ -0,0 +1,93 @@
+def test_mongo_client_is_lazy_and_recreated_after_fork(monkeypatch):
+    from libs.utils.db.mongodb import src as mongodb
+
+    created = []
+
+    class _RecordingClient:
+        def __init__(self, uri, **options):
+            self.options = options
+            created.append(self)
+
+        def __getitem__(self, name):
+            return {"employees": f"{name}.employees"}
+
+    monkeypatch.setattr(mongodb, "_clients", {})
+    monkeypatch.setattr(mongodb, "MongoClient", _RecordingClient)
+
+    database = mongodb.connect_db("habbot_connect_db")
+    collection = database["employees"]
+    assert created == []
+
+    assert collection.resolve() == "habbot_connect_db.employees"
+    collection.resolve()
+    assert len(created) == 1
+    assert created[0].options["maxPoolSize"] == mongodb.MONGO_MAX_POOL_SIZE
+
+    monkeypatch.setattr(mongodb.os, "getpid", lambda: -1)
+    collection.resolve()
+    assert len(created) == 2
+    assert list(mongodb._clients) == [("MongoClient", -1)]
+
+
+def test_ensure_indexes_tries_every_repository_and_fails_on_unique_ones(
+    monkeypatch,
+):
+    import asyncio
+
+    import pytest
+    from pymongo.errors import OperationFailure
+
+    from libs.utils.db.mongodb.src import repository
+    from libs.utils.db.mongodb.src.async_base_repository import (
+        AsyncBaseRepository,
+    )
+
+    class _Collection:
+        def __init__(self, name, error=None):
+            self.name = name
+            self.error = error
+            self.created = []
+
+        async def create_indexes(self, indexes):
+            if self.error:
+                raise self.error
+            self.created.extend(indexes)
+            return [index.document["name"] for index in indexes]
+
+    def _repository(name, indexes, error=None):
+        return AsyncBaseRepository(collection=_Collection(name, error), indexes=indexes)
+
+    refresh_tokens = _repository("refresh_tokens", repository.REFRESH_TOKENS_INDEXES)
+    monkeypatch.setattr(
+        repository,
+        "async_repositories",
+        [
+            _repository(
+                "employees",
+                repository.EMPLOYEES_INDEXES[1:],
+                OperationFailure("operation exceeded time limit"),
+            ),
+            refresh_tokens,
+        ],
+    )
+    failures = asyncio.run(repository.ensure_indexes())
+    assert list(failures) == ["employees"]
+    assert refresh_tokens.collection.created == repository.REFRESH_TOKENS_INDEXES
+
+    revoked_tokens = _repository("revoked_tokens", repository.REVOKED_TOKENS_INDEXES)
+    monkeypatch.setattr(
+        repository,
+        "async_repositories",
+        [
+            _repository(
+                "users",
+                repository.USERS_INDEXES,
+                OperationFailure("E11000 duplicate key error", code=11000),
+            ),
+            revoked_tokens,
+        ],
+    )
+    with pytest.raises(repository.UniqueIndexError) as raised:
+        asyncio.run(repository.ensure_indexes())
+    assert list(raised.value.failures) == ["users"]
+    assert revoked_tokens.collection.created == repository.REVOKED_TOKENS_INDEXES
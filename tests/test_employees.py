@@ -6,9 +6,13 @@ def test_employees_requires_auth(client):
 
 def test_employees_list_with_override(app, client, monkeypatch):
     from apps.fastapi.auth.src.helpers import require_user
-    from apps.fastapi.platform.modules.employees.src import service as employee_service
+    from apps.fastapi.platform.modules.employees.src import (
+        service as employee_service,
+    )
 
-    def fake_list_employees(_department, _role, _page, _page_size):
+    async def fake_list_employees(
+        _department, _role, _page, _page_size, _cursor, _include_total
+    ):
         return {
             "success": True,
             "message": "Employees list fetched successfully",
@@ -35,9 +39,11 @@ def test_employees_list_with_override(app, client, monkeypatch):
 
 def test_employees_create_with_override(app, client, monkeypatch):
     from apps.fastapi.auth.src.helpers import require_user
-    from apps.fastapi.platform.modules.employees.src import service as employee_service
+    from apps.fastapi.platform.modules.employees.src import (
+        service as employee_service,
+    )
 
-    def fake_create_employee(_employee_data):
+    async def fake_create_employee(_employee_data):
         return {
             "success": True,
             "message": "Employee created successfully",
@@ -73,9 +79,11 @@ def test_employees_create_with_override(app, client, monkeypatch):
 
 def test_employees_update_with_override(app, client, monkeypatch):
     from apps.fastapi.auth.src.helpers import require_user
-    from apps.fastapi.platform.modules.employees.src import service as employee_service
+    from apps.fastapi.platform.modules.employees.src import (
+        service as employee_service,
+    )
 
-    def fake_update_employee(_employee_id, _updated_data):
+    async def fake_update_employee(_employee_id, _updated_data):
         return {
             "success": True,
             "message": "Employee updated successfully",
@@ -105,11 +113,17 @@ def test_employees_update_with_override(app, client, monkeypatch):
 
 
 def test_employees_delete_with_override(app, client, monkeypatch):
+    from datetime import datetime, timezone
+
     from apps.fastapi.auth.src.helpers import require_user
-    from apps.fastapi.platform.modules.employees.src import service as employee_service
+    from apps.fastapi.platform.modules.employees.src import (
+        service as employee_service,
+    )
 
-    def fake_delete_employee(_employee_id):
-        return None
+    deactivated_at = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+    async def fake_delete_employee(_employee_id):
+        return deactivated_at
 
     app.dependency_overrides[require_user] = lambda: {"email": "tester@example.com"}
     monkeypatch.setattr(
@@ -119,3 +133,905 @@ def test_employees_delete_with_override(app, client, monkeypatch):
     response = client.delete("/api/employees/emp-123")
 
     assert response.status_code == 204
+    assert response.headers["x-deactivated-at"] == deactivated_at.isoformat()
+
+
+def test_employees_delete_missing_returns_404(app, client, monkeypatch):
+    from apps.fastapi.auth.src.helpers import require_user
+    from apps.fastapi.platform.modules.employees.src import (
+        service as employee_service,
+    )
+
+    async def fake_delete_employee(_employee_id):
+        return None
+
+    app.dependency_overrides[require_user] = lambda: {"email": "tester@example.com"}
+    monkeypatch.setattr(
+        employee_service.async_employees_operations,
+        "delete_employee",
+        fake_delete_employee,
+    )
+
+    response = client.delete("/api/employees/507f1f77bcf86cd799439011")
+
+    assert response.status_code == 404
+    assert response.json() == {"success": False, "message": "Employee not found"}
+
+
+def test_employee_list_cursor_round_trip():
+    from datetime import datetime
+
+    from bson import ObjectId
+
+    from libs.utils.common.pagination.src import decode_cursor, encode_cursor
+
+    date_joined = datetime(2025, 1, 1, 12, 30)
+    employee_id = ObjectId()
+
+    assert decode_cursor(encode_cursor(date_joined, employee_id)) == (
+        date_joined,
+        employee_id,
+    )
+
+
+def test_employees_list_rejects_invalid_cursor(app, client):
+    from apps.fastapi.auth.src.helpers import require_user
+
+    app.dependency_overrides[require_user] = lambda: {"email": "tester@example.com"}
+
+    response = client.get("/api/employees?cursor=not-a-cursor")
+
+    assert response.status_code == 400
+    assert response.json()["message"] == "Invalid cursor"
+
+
+def test_employees_list_counts_cursor_pages_only_when_asked(app, client, monkeypatch):
+    from apps.fastapi.auth.src.helpers import require_user
+    from apps.fastapi.platform.modules.employees.src import (
+        service as employee_service,
+    )
+
+    include_totals = []
+
+    async def fake_list_employees(
+        _department, _role, _page, _page_size, include_total, _projection
+    ):
+        include_totals.append(include_total)
+        return [], 0 if include_total else None, None
+
+    async def fake_list_employees_after_cursor(
+        _department, _role, _cursor, _page_size, include_total, _projection
+    ):
+        include_totals.append(include_total)
+        return [], 0 if include_total else None, None
+
+    app.dependency_overrides[require_user] = lambda: {"email": "tester@example.com"}
+    operations = employee_service.async_employees_operations
+    monkeypatch.setattr(operations, "list_employees", fake_list_employees)
+    monkeypatch.setattr(
+        operations, "list_employees_after_cursor", fake_list_employees_after_cursor
+    )
+
+    for query in ("page=2", "cursor=abc", "cursor=abc&include_total=true"):
+        assert client.get(f"/api/employees?{query}").status_code == 200
+
+    assert include_totals == [True, False, True]
+
+
+class _FakeAggregateCursor:
+    def __init__(self, documents):
+        self._documents = documents
+
+    async def to_list(self, length=None):
+        return self._documents
+
+
+class _FakeEmployeesRepository:
+    def __init__(self, documents):
+        self.documents = documents
+        self.calls = []
+
+    def aggregate(self, pipeline, allow_disk_use=False):
+        self.calls.append(("aggregate", pipeline))
+        if "$facet" in pipeline[-1]:
+            return _FakeAggregateCursor(
+                [{"items": self.documents, "total": [{"count": 42}]}]
+            )
+        return _FakeAggregateCursor(self.documents)
+
+    async def count_documents(self, query=None):
+        self.calls.append(("count_documents", query))
+        return len(self.documents)
+
+
+def _employee_documents(count):
+    from datetime import datetime, timedelta
+
+    from bson import ObjectId
+
+    start = datetime(2025, 1, 1)
+    return [
+        {"_id": ObjectId(), "name": f"E{i}", "date_joined": start - timedelta(days=i)}
+        for i in range(count)
+    ]
+
+
+def test_filtered_employee_list_uses_single_facet_round_trip():
+    import asyncio
+
+    from libs.utils.db.mongodb.operations.src.employees import (
+        AsyncEmployeesOperations,
+    )
+    from libs.utils.enums.src import DepartmentType
+
+    repository = _FakeEmployeesRepository(_employee_documents(3))
+    operations = AsyncEmployeesOperations()
+    operations._repository = repository
+
+    employees, total, next_cursor = asyncio.run(
+        operations.list_employees(DepartmentType.HR, None, 1, 2)
+    )
+
+    assert [call[0] for call in repository.calls] == ["aggregate"]
+    assert total == 42
+    assert len(employees) == 2
+    assert next_cursor is not None
+
+
+def test_unfiltered_employee_list_counts_only_active_employees():
+    import asyncio
+
+    from libs.utils.db.mongodb.operations.src.employees import (
+        AsyncEmployeesOperations,
+    )
+
+    repository = _FakeEmployeesRepository(_employee_documents(3))
+    operations = AsyncEmployeesOperations()
+    operations._repository = repository
+
+    employees, total, _ = asyncio.run(operations.list_employees(None, None, 1, 10))
+
+    assert ("count_documents", {"is_active": True}) in repository.calls
+    assert total == 3
+    assert len(employees) == 3
+
+
+def test_employee_list_without_total_skips_counting():
+    import asyncio
+
+    from libs.utils.db.mongodb.operations.src.employees import (
+        AsyncEmployeesOperations,
+    )
+
+    repository = _FakeEmployeesRepository(_employee_documents(2))
+    operations = AsyncEmployeesOperations()
+    operations._repository = repository
+
+    employees, total, next_cursor = asyncio.run(
+        operations.list_employees(None, None, 1, 10, include_total=False)
+    )
+
+    assert [call[0] for call in repository.calls] == ["aggregate"]
+    assert total is None
+    assert len(employees) == 2
+    assert next_cursor is None
+
+
+def test_employees_bulk_import_reports_each_row(app, client, monkeypatch):
+    from bson import ObjectId
+
+    from apps.fastapi.auth.src.helpers import require_user
+    from apps.fastapi.platform.modules.employees.src import (
+        service as employee_service,
+    )
+
+    inserted = []
+
+    async def fake_get_active_employee_emails(emails):
+        return {"taken@example.com"} & set(emails)
+
+    async def fake_create_employees(employees):
+        for employee in employees:
+            employee["_id"] = ObjectId()
+        inserted.extend(employees)
+        return {}
+
+    app.dependency_overrides[require_user] = lambda: {"email": "tester@example.com"}
+    monkeypatch.setattr(
+        employee_service.async_employees_operations,
+        "get_active_employee_emails",
+        fake_get_active_employee_emails,
+    )
+    monkeypatch.setattr(
+        employee_service.async_employees_operations,
+        "create_employees",
+        fake_create_employees,
+    )
+
+    body = "\n".join(
+        [
+            '{"name": "A", "email": "a@example.com", "department": "HR", "role": "MANAGER"}',
+            "not json",
+            '{"name": "B", "email": "b@example.com", "department": "LEGAL", "role": "MANAGER"}',
+            '{"name": "A2", "email": "a@example.com", "department": "HR", "role": "ANALYST"}',
+            '{"name": "T", "email": "taken@example.com", "department": "HR", "role": "ANALYST"}',
+        ]
+    )
+    response = client.post(
+        "/api/employees/bulk",
+        content=body,
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert (data["total"], data["succeeded"], data["failed"]) == (5, 1, 4)
+    assert [item["status"] for item in data["items"]] == [
+        "created",
+        "failed",
+        "failed",
+        "failed",
+        "failed",
+    ]
+    assert data["items"][0]["id"] == str(inserted[0]["_id"])
+    assert data["items"][3]["error"] == "Duplicate email in import"
+    assert data["items"][4]["error"] == "Employee with email already exists"
+
+
+def test_csv_import_rows_are_streamed_across_chunks():
+    import asyncio
+
+    from libs.fastapi.platform.modules.employees.src import iter_import_rows
+
+    async def chunks():
+        yield b"name,email,department,role\nAlice,alice@exam"
+        yield b"ple.com,HR,MANAGER\r\nBob,bob@example.com\n"
+
+    async def collect():
+        return [row async for row in iter_import_rows(chunks(), "text/csv")]
+
+    rows = asyncio.run(collect())
+
+    assert rows[0] == (
+        1,
+        {
+            "name": "Alice",
+            "email": "alice@example.com",
+            "department": "HR",
+            "role": "MANAGER",
+        },
+        None,
+    )
+    assert rows[1] == (2, None, "Expected 4 columns, got 2")
+
+
+def test_employees_bulk_delete_reports_each_id(app, client, monkeypatch):
+    from bson import ObjectId
+
+    from apps.fastapi.auth.src.helpers import require_user
+    from apps.fastapi.platform.modules.employees.src import (
+        service as employee_service,
+    )
+
+    active_id, missing_id = str(ObjectId()), str(ObjectId())
+    deleted = []
+
+    async def fake_get_active_employee_ids(employee_ids):
+        return {active_id} & set(employee_ids)
+
+    async def fake_bulk_delete_employees(employee_ids):
+        deleted.extend(employee_ids)
+        return len(employee_ids)
+
+    app.dependency_overrides[require_user] = lambda: {"email": "tester@example.com"}
+    monkeypatch.setattr(
+        employee_service.async_employees_operations,
+        "get_active_employee_ids",
+        fake_get_active_employee_ids,
+    )
+    monkeypatch.setattr(
+        employee_service.async_employees_operations,
+        "bulk_delete_employees",
+        fake_bulk_delete_employees,
+    )
+
+    response = client.post(
+        "/api/employees/bulk/delete",
+        json={"ids": [active_id, missing_id, "bad-id", active_id]},
+    )
+
+    assert response.status_code == 200
+    items = response.json()["data"]["items"]
+    assert [(item["status"], item["error"]) for item in items] == [
+        ("deleted", None),
+        ("failed", "Employee not found"),
+        ("failed", "Invalid employee id"),
+        ("failed", "Duplicate employee id in request"),
+    ]
+    assert deleted == [active_id]
+
+
+def test_repository_update_one_op_stamps_updated_at():
+    import asyncio
+
+    from pymongo import UpdateOne
+
+    from libs.utils.db.mongodb.src.async_base_repository import (
+        AsyncBaseRepository,
+    )
+
+    class _Collection:
+        async def bulk_write(self, requests, ordered=True):
+            self.requests = requests
+            self.ordered = ordered
+
+    collection = _Collection()
+    repository = AsyncBaseRepository(collection, timestamps=True)
+    update = {"$set": {"department": "SALES"}}
+
+    request = repository.update_one_op({"_id": 1}, update)
+    asyncio.run(repository.bulk_write([request], ordered=False))
+
+    assert "updatedAt" in update["$set"]
+    assert collection.requests == [UpdateOne({"_id": 1}, update, upsert=False)]
+    assert collection.ordered is False
+
+
+def test_update_employee_is_one_find_one_and_update_round_trip():
+    import asyncio
+
+    from bson import ObjectId
+    from pymongo import ReturnDocument
+
+    from libs.utils.db.mongodb.operations.src.employees import (
+        AsyncEmployeesOperations,
+    )
+    from libs.utils.db.mongodb.src.async_base_repository import (
+        AsyncBaseRepository,
+    )
+
+    class _Collection:
+        def __init__(self):
+            self.calls = []
+
+        async def find_one_and_update(self, query, update, **kwargs):
+            self.calls.append((query, update, kwargs))
+            if query["_id"] == missing_id:
+                return None
+            return {"_id": query["_id"], **update["$set"]}
+
+    employee_id, missing_id = ObjectId(), ObjectId()
+    collection = _Collection()
+    operations = AsyncEmployeesOperations()
+    operations._repository = AsyncBaseRepository(collection, timestamps=True)
+
+    updated = asyncio.run(
+        operations.update_employee(str(employee_id), {"name": "Bob"}, {"name": 1})
+    )
+    missing = asyncio.run(operations.update_employee(str(missing_id), {"name": "X"}))
+
+    assert updated["name"] == "Bob"
+    assert missing is None
+    query, update, kwargs = collection.calls[0]
+    assert query == {"_id": employee_id, "is_active": True}
+    assert "updatedAt" in update["$set"]
+    assert kwargs["projection"] == {"name": 1}
+    assert kwargs["return_document"] is ReturnDocument.AFTER
+
+
+class _RecordingHeadcounts:
+    def __init__(self):
+        self.deltas = []
+
+    async def apply(self, deltas):
+        self.deltas.append(dict(deltas))
+
+
+def test_delete_employee_is_one_conditional_write():
+    import asyncio
+
+    from bson import ObjectId
+
+    from libs.utils.db.mongodb.operations.src.employees import (
+        AsyncEmployeesOperations,
+    )
+    from libs.utils.db.mongodb.src.async_base_repository import (
+        AsyncBaseRepository,
+    )
+
+    class _Collection:
+        def __init__(self):
+            self.calls = []
+
+        async def find_one_and_update(self, query, update, **kwargs):
+            self.calls.append((query, update, kwargs))
+            if query["_id"] == missing_id:
+                return None
+            return {"_id": query["_id"], "department": "HR", "role": "MANAGER"}
+
+    employee_id, missing_id = ObjectId(), ObjectId()
+    collection = _Collection()
+    operations = AsyncEmployeesOperations()
+    operations._repository = AsyncBaseRepository(collection, timestamps=True)
+    operations._headcounts = _RecordingHeadcounts()
+
+    deactivated_at = asyncio.run(operations.delete_employee(str(employee_id)))
+    missing = asyncio.run(operations.delete_employee(str(missing_id)))
+
+    assert missing is None
+    query, update, kwargs = collection.calls[0]
+    assert query == {"_id": employee_id, "is_active": True}
+    assert update["$set"]["is_active"] is False
+    assert update["$set"]["deactivated_at"] == deactivated_at
+    assert kwargs["projection"] == {"department": 1, "role": 1}
+    assert len(collection.calls) == 2
+    assert operations._headcounts.deltas == [{("HR", "MANAGER"): -1}]
+
+
+def test_concurrent_creates_with_the_same_email_insert_once(app, client, monkeypatch):
+    import asyncio
+    from concurrent.futures import ThreadPoolExecutor
+
+    from bson import ObjectId
+    from pymongo.errors import DuplicateKeyError
+    from pymongo.results import InsertOneResult
+
+    from apps.fastapi.auth.src.helpers import require_user
+    from apps.fastapi.platform.modules.employees.src import (
+        service as employee_service,
+    )
+    from libs.utils.db.mongodb.src.async_base_repository import (
+        AsyncBaseRepository,
+    )
+
+    class _UniqueEmailCollection:
+        """Enforces the unique active-email index the way the server does."""
+
+        def __init__(self):
+            self.emails = set()
+
+        async def insert_one(self, doc):
+            # Let concurrent requests reach the insert before any completes
+            await asyncio.sleep(0.01)
+            if doc["email"] in self.emails:
+                raise DuplicateKeyError(
+                    "E11000 duplicate key error",
+                    11000,
+                    {"keyPattern": {"email": 1}, "keyValue": {"email": doc["email"]}},
+                )
+            self.emails.add(doc["email"])
+            doc["_id"] = ObjectId()
+            return InsertOneResult(doc["_id"], True)
+
+    app.dependency_overrides[require_user] = lambda: {"email": "tester@example.com"}
+    monkeypatch.setattr(
+        employee_service.async_employees_operations,
+        "_repository",
+        AsyncBaseRepository(_UniqueEmailCollection(), timestamps=True),
+    )
+    payload = {
+        "name": "Alice",
+        "email": "alice@example.com",
+        "department": "HR",
+        "role": "MANAGER",
+    }
+
+    with ThreadPoolExecutor(max_workers=10) as executor:
+        responses = list(
+            executor.map(
+                lambda _: client.post("/api/employees", json=payload), range(10)
+            )
+        )
+
+    status_codes = sorted(response.status_code for response in responses)
+    assert status_codes == [201] + [400] * 9
+    assert {
+        response.json()["message"]
+        for response in responses
+        if response.status_code == 400
+    } == {"Employee with email already exists"}
+
+
+def test_employees_update_to_a_taken_email_returns_400(app, client, monkeypatch):
+    from bson import ObjectId
+    from pymongo.errors import DuplicateKeyError
+
+    from apps.fastapi.auth.src.helpers import require_user
+    from apps.fastapi.platform.modules.employees.src import (
+        service as employee_service,
+    )
+    from libs.utils.db.mongodb.src.async_base_repository import (
+        AsyncBaseRepository,
+    )
+
+    class _UniqueEmailCollection:
+        async def find_one_and_update(self, query, update, **kwargs):
+            raise DuplicateKeyError(
+                "E11000 duplicate key error collection: employees",
+                11000,
+                {"keyPattern": {"email": 1}, "keyValue": update["$set"]},
+            )
+
+    app.dependency_overrides[require_user] = lambda: {"email": "tester@example.com"}
+    monkeypatch.setattr(
+        employee_service.async_employees_operations,
+        "_repository",
+        AsyncBaseRepository(_UniqueEmailCollection(), timestamps=True),
+    )
+
+    response = client.put(
+        f"/api/employees/{ObjectId()}", json={"email": "taken@example.com"}
+    )
+
+    assert response.status_code == 400
+    assert response.json()["message"] == "Employee with email already exists"
+
+
+def test_employees_search_route_is_not_taken_for_an_id(app, client, monkeypatch):
+    from datetime import datetime
+
+    from bson import ObjectId
+
+    from apps.fastapi.auth.src.helpers import require_user
+    from apps.fastapi.platform.modules.employees.src import (
+        service as employee_service,
+    )
+
+    employee_id = ObjectId()
+    searched = []
+
+    async def fake_search_employees(query, limit, projection=None):
+        searched.append((query, limit))
+        return [
+            {
+                "_id": employee_id,
+                "name": "Alice",
+                "email": "alice@example.com",
+                "department": "ENGINEERING",
+                "role": "DEVELOPER",
+                "date_joined": datetime(2025, 1, 1),
+            }
+        ]
+
+    app.dependency_overrides[require_user] = lambda: {"email": "tester@example.com"}
+    monkeypatch.setattr(
+        employee_service.async_employees_operations,
+        "search_employees",
+        fake_search_employees,
+    )
+
+    response = client.get("/api/employees/search", params={"q": "ali"})
+
+    assert response.status_code == 200
+    assert response.json()["data"]["items"][0]["id"] == str(employee_id)
+    assert searched == [("ali", employee_service.FUZZY_SEARCH_TOP_N)]
+    assert client.get("/api/employees/search").status_code == 422
+
+
+class _SearchableEmployeesRepository:
+    """Just enough of the repository for writes followed by a search."""
+
+    def __init__(self):
+        self.documents = {}
+
+    async def insert_one(self, document):
+        from bson import ObjectId
+        from pymongo.results import InsertOneResult
+
+        document["_id"] = ObjectId()
+        self.documents[document["_id"]] = document
+        return InsertOneResult(document["_id"], True)
+
+    async def find_one_and_update(self, query, update, projection=None, **kwargs):
+        document = self.documents.get(query["_id"])
+        if not document or not document["is_active"]:
+            return None
+        document.update(update["$set"])
+        return document
+
+    def update_one_op(self, query, update, upsert=False):
+        return query, update
+
+    async def update_one(self, query, update, upsert=False):
+        from pymongo.results import UpdateResult
+
+        document = self.documents.get(query["_id"])
+        matched = int(bool(document and document["is_active"]))
+        if matched:
+            document.update(update["$set"])
+        return UpdateResult({"n": matched, "nModified": matched}, True)
+
+    def find(self, query, projection=None):
+        async def documents():
+            for document in self.documents.values():
+                if document["_id"] in query["_id"]["$in"] and document["is_active"]:
+                    yield document
+
+        return documents()
+
+
+def test_search_index_follows_employee_writes(monkeypatch):
+    import asyncio
+
+    from libs.utils.common.search.src import SyncedTrigramIndex
+    from libs.utils.db.mongodb.operations.src import employees as employee_ops
+
+    async def no_changes(_since):
+        return
+        yield
+
+    monkeypatch.setattr(
+        employee_ops,
+        "employee_search_index",
+        SyncedTrigramIndex(no_changes, refresh_seconds=60, max_candidates=100),
+    )
+    operations = employee_ops.AsyncEmployeesOperations()
+    operations._repository = _SearchableEmployeesRepository()
+
+    async def search(query):
+        employees = await operations.search_employees(query, 10)
+        return [employee["name"] for employee in employees]
+
+    async def scenario():
+        alice_id = await operations.create_employee(
+            {"name": "Alice Johnson", "email": "alice@example.com"}
+        )
+        await operations.create_employee(
+            {"name": "Bob Smith", "email": "bob@example.com"}
+        )
+        assert await search("alic") == ["Alice Johnson"]
+
+        await operations.update_employee(alice_id, {"name": "Alicia Jones"})
+        assert await search("jones") == ["Alicia Jones"]
+
+        await operations.delete_employee(alice_id)
+        assert await search("alicia") == []
+        assert await search("smith") == ["Bob Smith"]
+
+    asyncio.run(scenario())
+
+
+def test_bulk_update_reports_duplicate_emails_and_applies_the_rest(
+    app, client, monkeypatch
+):
+    import asyncio
+
+    from pymongo.errors import BulkWriteError
+
+    from apps.fastapi.auth.src.helpers import require_user
+    from apps.fastapi.platform.modules.employees.src import (
+        service as employee_service,
+    )
+    from libs.utils.common.search.src import SyncedTrigramIndex
+    from libs.utils.db.mongodb.operations.src import employees as employee_ops
+    from libs.utils.enums.src import DepartmentType, RoleType
+
+    async def no_changes(_since):
+        return
+        yield
+
+    class _Repository(_SearchableEmployeesRepository):
+        async def bulk_write(self, requests, ordered=True):
+            write_errors = []
+            for index, (query, update) in enumerate(requests):
+                if update["$set"].get("email") == "taken@example.com":
+                    write_errors.append(
+                        {"index": index, "code": 11000, "errmsg": "E11000 ..."}
+                    )
+                else:
+                    self.documents[query["_id"]] = {
+                        **self.documents[query["_id"]],
+                        **update["$set"],
+                    }
+            raise BulkWriteError(
+                {
+                    "writeErrors": write_errors,
+                    "nMatched": len(requests) - len(write_errors),
+                }
+            )
+
+    index = SyncedTrigramIndex(no_changes, refresh_seconds=60, max_candidates=100)
+    monkeypatch.setattr(employee_ops, "employee_search_index", index)
+    operations = employee_service.async_employees_operations
+    monkeypatch.setattr(operations, "_repository", _Repository())
+    monkeypatch.setattr(operations, "_headcounts", _RecordingHeadcounts())
+    app.dependency_overrides[require_user] = lambda: {"email": "tester@example.com"}
+
+    async def create(name, email):
+        return str(
+            await operations.create_employee(
+                {
+                    "name": name,
+                    "email": email,
+                    "department": DepartmentType.HR,
+                    "role": RoleType.MANAGER,
+                }
+            )
+        )
+
+    alice_id = asyncio.run(create("Alice", "alice@example.com"))
+    bob_id = asyncio.run(create("Bob", "bob@example.com"))
+    operations._headcounts.deltas.clear()
+
+    response = client.put(
+        "/api/employees/bulk",
+        json={
+            "items": [
+                {"id": alice_id, "name": "Alicia", "department": "SALES"},
+                {"id": bob_id, "email": "taken@example.com", "department": "SALES"},
+            ]
+        },
+    )
+
+    assert response.status_code == 200
+    items = response.json()["data"]["items"]
+    assert [(item["status"], item["error"]) for item in items] == [
+        ("updated", None),
+        ("failed", "Employee with email already exists"),
+    ]
+    # Side effects follow only the update that was written
+    assert [key for key, _ in index.search("alicia", 10)] == [alice_id]
+    assert operations._headcounts.deltas == [
+        {("HR", "MANAGER"): -1, ("SALES", "MANAGER"): 1}
+    ]
+
+
+def test_single_and_bulk_deletes_stamp_the_same_fields():
+    import asyncio
+
+    from pymongo.results import BulkWriteResult
+
+    from libs.utils.db.mongodb.operations.src import employees as employee_ops
+
+    class _Repository(_SearchableEmployeesRepository):
+        async def bulk_write(self, requests, ordered=True):
+            for query, update in requests:
+                await self.find_one_and_update(query, update)
+            return BulkWriteResult({"nMatched": len(requests)}, True)
+
+    operations = employee_ops.AsyncEmployeesOperations()
+    operations._repository = _Repository()
+    operations._headcounts = _RecordingHeadcounts()
+
+    async def scenario():
+        first, second = [
+            str(
+                await operations.create_employee(
+                    {"name": name, "email": f"{name}@example.com"}
+                )
+            )
+            for name in ("alice", "bob")
+        ]
+        await operations.delete_employee(first)
+        await operations.bulk_delete_employees([second])
+
+    asyncio.run(scenario())
+
+    single, bulk = operations._repository.documents.values()
+    assert single.keys() == bulk.keys()
+    assert bulk["is_active"] is False
+    assert bulk["deactivated_at"] is not None
+
+
+def test_headcounts_follow_create_and_department_change():
+    import asyncio
+
+    from libs.utils.db.mongodb.operations.src import employees as employee_ops
+    from libs.utils.enums.src import DepartmentType, RoleType
+
+    class _Repository(_SearchableEmployeesRepository):
+        async def find_one_and_update(self, query, update, projection=None, **kwargs):
+            document = self.documents.get(query["_id"])
+            if not document or not document["is_active"]:
+                return None
+            previous = dict(document)
+            document.update(update["$set"])
+            return previous
+
+    operations = employee_ops.AsyncEmployeesOperations()
+    operations._repository = _Repository()
+    operations._headcounts = _RecordingHeadcounts()
+
+    async def scenario():
+        employee_id = await operations.create_employee(
+            {
+                "name": "Alice",
+                "email": "alice@example.com",
+                "department": DepartmentType.HR,
+                "role": RoleType.MANAGER,
+            }
+        )
+        updated = await operations.update_employee(
+            employee_id, {"department": DepartmentType.SALES}, {"department": 1}
+        )
+        unchanged = await operations.update_employee(employee_id, {"name": "Alicia"})
+        return updated, unchanged
+
+    updated, unchanged = asyncio.run(scenario())
+
+    assert updated["department"] == DepartmentType.SALES
+    assert "name" not in updated
+    assert unchanged is not None
+    assert operations._headcounts.deltas == [
+        {("HR", "MANAGER"): 1},
+        {("HR", "MANAGER"): -1, ("SALES", "MANAGER"): 1},
+    ]
+
+
+def test_reconcile_rebuilds_headcounts_with_one_aggregation(monkeypatch):
+    import asyncio
+
+    from pymongo import ReplaceOne, UpdateMany
+
+    from libs.utils.db.mongodb.operations.src import headcounts as headcount_ops
+
+    class _Cursor:
+        def __init__(self, documents):
+            self.documents = documents
+
+        async def to_list(self, length=None):
+            return self.documents
+
+    class _EmployeesRepository:
+        def __init__(self):
+            self.pipelines = []
+
+        def aggregate(self, pipeline):
+            self.pipelines.append(pipeline)
+            return _Cursor(
+                [{"_id": {"department": "HR", "role": "MANAGER"}, "count": 3}]
+            )
+
+    class _HeadcountsRepository:
+        def __init__(self):
+            self.requests = []
+
+        async def bulk_write(self, requests, ordered=True):
+            self.requests.extend(requests)
+
+    employees_repository = _EmployeesRepository()
+    monkeypatch.setattr(
+        headcount_ops, "async_employees_repository", employees_repository
+    )
+    operations = headcount_ops.AsyncEmployeeHeadcountsOperations()
+    operations._repository = _HeadcountsRepository()
+
+    headcounts = asyncio.run(operations.reconcile())
+
+    assert len(employees_repository.pipelines) == 1
+    assert headcounts == [
+        {"_id": "HR:MANAGER", "department": "HR", "role": "MANAGER", "count": 3}
+    ]
+    replace, reset = operations._repository.requests
+    assert isinstance(replace, ReplaceOne)
+    assert isinstance(reset, UpdateMany)
+    assert reset._filter == {"_id": {"$nin": ["HR:MANAGER"]}}
+
+
+def test_employee_stats_route_reports_totals(app, client, monkeypatch):
+    from apps.fastapi.auth.src.helpers import require_user
+    from apps.fastapi.platform.modules.employees.src import (
+        service as employee_service,
+    )
+
+    async def fake_get_headcounts():
+        return [
+            {"department": "HR", "role": "MANAGER", "count": 2},
+            {"department": "SALES", "role": "MANAGER", "count": 3},
+        ]
+
+    app.dependency_overrides[require_user] = lambda: {"email": "tester@example.com"}
+    monkeypatch.setattr(
+        employee_service.async_employee_headcounts_operations,
+        "get_headcounts",
+        fake_get_headcounts,
+    )
+
+    response = client.get("/api/employees/stats")
+
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert data["total"] == 5
+    assert data["by_department"] == {"HR": 2, "SALES": 3, "ENGINEERING": 0}
+    assert data["by_role"]["MANAGER"] == 5
+    assert data["by_role"]["DEVELOPER"] == 0
@@ -0,0 +1,240 @@
+import asyncio
+import os
+from datetime import datetime, timedelta
+
+import pytest
+from bson import ObjectId, json_util
+from pymongo.errors import PyMongoError
+from pymongo.mongo_client import MongoClient
+
+MONGO_TEST_URI = os.environ.get("MONGO_TEST_URI")
+INDEX_STAGES = ("IXSCAN", "COUNT_SCAN", "IDHACK", "EXPRESS")
+EXPLAIN_UNCHOSEN_KEYS = {
+    "command",
+    "originalCommand",
+    "rejectedPlans",
+    "allPlansExecution",
+}
+
+pytestmark = pytest.mark.skipif(
+    not MONGO_TEST_URI, reason="MONGO_TEST_URI is not set; needs a live MongoDB"
+)
+
+
+class _RecordingCursor:
+    async def to_list(self, length=None):
+        return []
+
+
+class _RecordingRepository:
+    """Stands in for AsyncBaseRepository and records every query it is sent."""
+
+    def __init__(self):
+        self.calls = []
+
+    async def find_one(self, query, projection=None):
+        self.calls.append(("find_one", query))
+        return None
+
+    def aggregate(self, pipeline, allow_disk_use=False):
+        self.calls.append(("aggregate", pipeline))
+        return _RecordingCursor()
+
+    async def count_documents(self, query=None):
+        self.calls.append(("count_documents", query))
+        return 0
+
+    async def update_one(self, query, update, upsert=False):
+        self.calls.append(("update_one", query))
+
+    async def find_one_and_update(self, query, update, projection=None, **kwargs):
+        self.calls.append(("find_one_and_update", query))
+
+
+@pytest.fixture(scope="module")
+def database():
+    client = MongoClient(MONGO_TEST_URI, serverSelectionTimeoutMS=2000)
+    try:
+        client.admin.command("ping")
+    except PyMongoError as error:
+        pytest.skip(f"MongoDB is not reachable: {error}")
+
+    database = client[f"habbot_connect_index_test_{os.getpid()}"]
+    yield database
+    client.drop_database(database.name)
+    client.close()
+
+
+@pytest.fixture(scope="module")
+def collections(database):
+    from libs.utils.db.mongodb.src.repository import (
+        EMPLOYEES_INDEXES,
+        USERS_INDEXES,
+    )
+
+    users = database["users"]
+    employees = database["employees"]
+    users.create_indexes(USERS_INDEXES)
+    employees.create_indexes(EMPLOYEES_INDEXES)
+
+    start = datetime(2025, 1, 1)
+    users.insert_many(
+        [{"email": f"user{i}@example.com", "is_active": True} for i in range(50)]
+    )
+    employees.insert_many(
+        [
+            {
+                "name": f"Employee {i}",
+                "email": f"employee{i}@example.com",
+                "department": ("HR", "SALES", "ENGINEERING")[i % 3],
+                "role": ("MANAGER", "DEVELOPER", "ANALYST")[i % 3],
+                "date_joined": start - timedelta(days=i),
+                "is_active": i % 5 != 0,
+            }
+            for i in range(200)
+        ]
+    )
+    return {"users": users, "employees": employees}
+
+
+def _explain(collection, method, query):
+    database = collection.database
+    if method == "find_one":
+        return collection.find(query).limit(1).explain()
+    if method == "count_documents":
+        return database.command("explain", {"count": collection.name, "query": query})
+    if method == "aggregate":
+        return database.command(
+            "explain",
+            {"aggregate": collection.name, "pipeline": query, "cursor": {}},
+        )
+    if method == "update_one":
+        return database.command(
+            "explain",
+            {
+                "update": collection.name,
+                "updates": [{"q": query, "u": {"$set": {"name": "x"}}}],
+            },
+        )
+    if method == "find_one_and_update":
+        return database.command(
+            "explain",
+            {
+                "findAndModify": collection.name,
+                "query": query,
+                "update": {"$set": {"name": "x"}},
+            },
+        )
+    raise AssertionError(f"No explain strategy for {method}")
+
+
+def _sorts_in_memory(explain) -> bool:
+    """Whether the chosen plan sorts in memory, in a SORT stage or a $sort."""
+    if isinstance(explain, list):
+        return any(_sorts_in_memory(item) for item in explain)
+    if not isinstance(explain, dict):
+        return False
+    if explain.get("stage") == "SORT" or "$sort" in explain:
+        return True
+    return any(
+        _sorts_in_memory(value)
+        for key, value in explain.items()
+        # The echoed command and the plans not chosen do not run
+        if key not in EXPLAIN_UNCHOSEN_KEYS
+    )
+
+
+def _assert_uses_index(collection, calls):
+    assert calls
+    for method, query in calls:
+        explain = _explain(collection, method, query)
+        plan = json_util.dumps(explain)
+        assert "COLLSCAN" not in plan, f"{method} {query} scans the collection"
+        assert any(stage in plan for stage in INDEX_STAGES), (
+            f"{method} {query} does not use an index"
+        )
+        assert not _sorts_in_memory(explain), f"{method} {query} sorts in memory"
+
+
+def _record(operations, call):
+    repository = _RecordingRepository()
+    operations._repository = repository
+    asyncio.run(call(operations))
+    return repository.calls
+
+
+def test_employee_operations_use_indexes(collections):
+    from libs.utils.common.pagination.src import encode_cursor
+    from libs.utils.db.mongodb.operations.src.employees import (
+        AsyncEmployeesOperations,
+    )
+    from libs.utils.enums.src import DepartmentType, RoleType
+
+    employee_id = str(ObjectId())
+    cursor = encode_cursor(datetime(2024, 6, 1), ObjectId())
+    filters = [
+        (None, None),
+        (DepartmentType.HR, None),
+        (None, RoleType.MANAGER),
+        (DepartmentType.SALES, RoleType.DEVELOPER),
+    ]
+
+    operation_calls = [
+        lambda ops: ops.get_employee_by_email("employee1@example.com"),
+        lambda ops: ops.get_employee_by_id(employee_id),
+        lambda ops: ops.update_employee(employee_id, {"name": "x"}),
+        lambda ops: ops.delete_employee(employee_id),
+    ]
+    for department, role in filters:
+        operation_calls.append(
+            lambda ops, d=department, r=role: ops.list_employees(d, r, 3, 10)
+        )
+        operation_calls.append(
+            lambda ops, d=department, r=role: ops.list_employees_after_cursor(
+                d, r, cursor, 10
+            )
+        )
+
+    for call in operation_calls:
+        calls = _record(AsyncEmployeesOperations(), call)
+        _assert_uses_index(collections["employees"], calls)
+
+
+def test_user_operations_use_indexes(collections):
+    from libs.utils.db.mongodb.operations.src.users import AsyncUsersOperations
+
+    operation_calls = [
+        lambda ops: ops.get_user_by_email("user1@example.com"),
+        lambda ops: ops.get_user_by_id(str(ObjectId())),
+        lambda ops: ops.authenticate("missing@example.com", "secret"),
+    ]
+
+    for call in operation_calls:
+        calls = _record(AsyncUsersOperations(), call)
+        _assert_uses_index(collections["users"], calls)
+
+
+def test_unique_active_email_index_rejects_concurrent_duplicates(collections):
+    from concurrent.futures import ThreadPoolExecutor
+
+    from libs.utils.db.mongodb.src.base_repository import (
+        BaseRepository,
+        DuplicateRecordError,
+    )
+
+    repository = BaseRepository(collections["employees"], timestamps=True)
+
+    def insert(_):
+        try:
+            repository.insert_one({"email": "race@example.com", "is_active": True})
+            return "inserted"
+        except DuplicateRecordError as error:
+            assert error.fields == ["email"]
+            return "duplicate"
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        outcomes = sorted(executor.map(insert, range(8)))
+
+    assert outcomes == ["duplicate"] * 7 + ["inserted"]
+    # Inactive records may keep an address that an active one now owns
+    repository.insert_one({"email": "race@example.com", "is_active": False})
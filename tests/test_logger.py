@@ -0,0 +1,221 @@
+def _tracked_logger(monkeypatch, level):
+
+    from libs.utils.common.custom_logger.src import CustomLogger
+
+    log = CustomLogger("TrackTest", is_request=False)
+    log.root_logger.handlers = []
+    log.root_logger.setLevel(level)
+    records = []
+    for method in ("debug", "error"):
+        monkeypatch.setattr(
+            log.root_logger,
+            method,
+            lambda message, extra=None, method=method: records.append(
+                (method, message, extra)
+            ),
+        )
+    return log, records
+
+
+def test_track_logs_caller_details_when_debug_is_enabled(monkeypatch):
+    import asyncio
+    import logging
+
+    log, records = _tracked_logger(monkeypatch, logging.DEBUG)
+
+    class EmployeesService:
+        @staticmethod
+        @log.track
+        async def get_employee(employee_id, projection=None):
+            return {"_id": employee_id}
+
+    class EmployeesRoute:
+        async def handle(self):
+            return await EmployeesService.get_employee("1", projection={})
+
+    assert asyncio.run(EmployeesRoute().handle()) == {"_id": "1"}
+
+    (_, _, called), (_, _, returned) = records
+    assert called["arguments"] == {"employee_id": "1"}
+    assert called["kwargs"] == {"projection": {}}
+    assert called["qualname"].endswith("EmployeesService.get_employee")
+    assert called["calleeClassName"] == "EmployeesRoute"
+    assert called["calleeFunctionName"] == "handle"
+    assert called["fileName"] == "test_logger.py"
+    assert returned["line"] == called["line"]
+    assert returned["returns"] == {"_id": "1"}
+
+
+def test_track_skips_serialization_but_logs_errors_above_debug(monkeypatch):
+    import logging
+
+    from libs.utils.common import custom_logger
+
+    log, records = _tracked_logger(monkeypatch, logging.INFO)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("serialized while DEBUG is disabled")
+
+    monkeypatch.setattr(custom_logger.src, "serialize_args_kwargs", fail)
+    monkeypatch.setattr(custom_logger.src.log_serializer, "to_json_safe", fail)
+
+    @log.track
+    def divide(a, b):
+        return a / b
+
+    assert divide(4, 2) == 2
+    assert records == []
+
+    try:
+        divide(1, 0)
+    except ZeroDivisionError:
+        pass
+
+    [(method, message, extra)] = records
+    assert method == "error"
+    assert message == "division by zero"
+    assert extra["qualname"].endswith("divide")
+    assert extra["calleeFunctionName"].startswith("test_track_skips")
+
+
+def test_log_serializer_stops_at_its_item_and_byte_budgets():
+    from libs.utils.common.custom_logger.src.helper import LogSerializer
+
+    page = [{"_id": str(number), "name": "Alice"} for number in range(100000)]
+
+    by_items = LogSerializer(max_items=10, max_bytes=100000).to_json_safe(page)
+    assert by_items[0] == {"_id": "0", "name": "Alice"}
+    assert by_items[-1] == "<truncated: 100000 items>"
+    assert len(by_items) < 10
+
+    serializer = LogSerializer(max_items=100000, max_bytes=200)
+    assert "<truncated" in str(serializer.to_json_safe(page))
+    # The encoded text is cut to the byte budget too
+    assert len(serializer.dumps(page)) <= 201
+
+    # Long strings are cut to what is left of the budget
+    assert serializer.to_json_safe("x" * 1000) == "x" * 200 + "…"
+
+
+def test_log_serializer_converts_redacts_and_handles_cycles(monkeypatch):
+    import json
+    from datetime import datetime
+    from decimal import Decimal
+    from enum import Enum
+
+    from pydantic import BaseModel
+    from starlette.responses import JSONResponse
+
+    from libs.utils.common.custom_logger.src import helper
+
+    class Department(str, Enum):
+        HR = "HR"
+
+    class Employee(BaseModel):
+        name: str
+        department: Department
+        password: str
+
+    cyclic = {"name": "loop"}
+    cyclic["self"] = cyclic
+    value = {
+        "employee": Employee(name="Alice", department="HR", password="secret"),
+        "joined": datetime(2025, 1, 1),
+        "salary": Decimal("10.5"),
+        "user_id": "hidden",
+        "response": JSONResponse({"ok": True}),
+        "cyclic": cyclic,
+    }
+    expected = {
+        "employee": {
+            "name": "Alice",
+            "department": "HR",
+            "password": "***redacted***",
+        },
+        "joined": "2025-01-01T00:00:00",
+        "salary": 10.5,
+        "response": {"ok": True},
+        "cyclic": {"name": "loop", "self": "<cycle>"},
+    }
+
+    serializer = helper.LogSerializer()
+    assert serializer.to_json_safe(value) == expected
+
+    encoded = serializer.dumps(value)
+    # Without orjson the standard library produces the same document
+    monkeypatch.setattr(helper, "orjson", None)
+    assert json.loads(serializer.dumps(value)) == json.loads(encoded)
+
+
+def test_log_serializer_summarizes_requests_and_redacts_credential_headers():
+    from starlette.datastructures import Headers
+    from starlette.requests import Request
+
+    from libs.utils.common.custom_logger.src.helper import (
+        get_serialized_args,
+        serialize_args_kwargs,
+    )
+
+    request = Request(
+        {
+            "type": "http",
+            "method": "POST",
+            "path": "/api/employees/bulk",
+            "headers": [(b"authorization", b"Bearer secret-jwt")],
+            "app": object(),
+        }
+    )
+
+    args, kwargs = serialize_args_kwargs(
+        (request,), {"headers": Headers(raw=request.scope["headers"])}, ("request",)
+    )
+
+    assert args == {
+        "request": {
+            "<type>": "Request",
+            "method": "POST",
+            "path": "/api/employees/bulk",
+        }
+    }
+    assert kwargs == {"headers": {"authorization": "***redacted***"}}
+    assert "secret-jwt" not in get_serialized_args(args) + str(kwargs)
+
+
+def test_queue_listener_writes_records_logged_in_a_forked_child(tmp_path):
+    import logging
+    import os
+    import queue
+    from logging.handlers import QueueHandler
+
+    import pytest
+
+    from libs.utils.common.custom_logger.src.handlers import (
+        ForkSafeQueueListener,
+        reinit_logging_after_fork,
+    )
+
+    if not hasattr(os, "fork"):
+        pytest.skip("needs os.fork")
+
+    log_path = tmp_path / "child.log"
+    file_handler = logging.FileHandler(log_path, delay=True)
+    listener = ForkSafeQueueListener(QueueHandler(queue.Queue()), file_handler)
+    logger = logging.getLogger("ForkTest")
+    logger.propagate = False
+    logger.addHandler(listener.queue_handler)
+    listener.start()
+
+    pid = os.fork()
+    if pid == 0:
+        # Child: without a restart nothing would drain the queue here
+        try:
+            reinit_logging_after_fork()
+            logger.warning("from the child")
+            listener.stop()
+        finally:
+            os._exit(0)
+
+    os.waitpid(pid, 0)
+    listener.stop()
+    file_handler.close()
+    assert log_path.read_text().strip() == "from the child"
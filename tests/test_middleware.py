@@ -0,0 +1,136 @@
+def _build_app(endpoint, body_preview_bytes=8):
+    from starlette.applications import Starlette
+    from starlette.middleware import Middleware
+    from starlette.routing import Route
+    from starlette_context import plugins
+    from starlette_context.middleware import RawContextMiddleware
+
+    from apps.fastapi.auth.src.middleware import LoggingMiddleware
+
+    return Starlette(
+        routes=[Route("/items", endpoint, methods=["GET", "POST"])],
+        middleware=[
+            Middleware(RawContextMiddleware, plugins=[plugins.RequestIdPlugin()]),
+            Middleware(LoggingMiddleware, body_preview_bytes=body_preview_bytes),
+        ],
+    )
+
+
+def test_logging_middleware_streams_and_keeps_only_a_preview(monkeypatch):
+    from starlette.responses import StreamingResponse
+    from starlette.testclient import TestClient
+
+    from apps.fastapi.auth.src import middleware
+
+    logged = []
+    monkeypatch.setattr(
+        middleware.logger,
+        "info",
+        lambda message, extra=None: logged.append((message, extra)),
+    )
+
+    async def chunks():
+        for _ in range(100):
+            yield b"data: 0123456789\n\n"
+
+    async def endpoint(request):
+        return StreamingResponse(chunks(), media_type="text/event-stream")
+
+    with TestClient(_build_app(endpoint)) as client:
+        response = client.get("/items")
+
+    assert response.status_code == 200
+    assert len(response.content) == 1800
+    message, extra = logged[-1]
+    assert message.startswith("✅")
+    assert extra["response"]["statusCode"] == 200
+    assert extra["response"]["bodySize"] == 1800
+    assert extra["response"]["body"] == "data: 01…"
+    assert extra["response"]["headers"]["content-type"].startswith("text/event-stream")
+
+
+def test_logging_middleware_logs_bodies_of_opted_in_routes_only(monkeypatch):
+    from starlette.responses import JSONResponse
+    from starlette.testclient import TestClient
+
+    from apps.fastapi.auth.src import middleware
+    from libs.utils.common.custom_logger.src.helper import log_request_body
+
+    logged = []
+    monkeypatch.setattr(
+        middleware.logger,
+        "info",
+        lambda message, extra=None: logged.append((message, extra)),
+    )
+
+    @log_request_body
+    async def opted_in(request):
+        payload = await request.json()
+        if payload.get("fail"):
+            raise RuntimeError("boom")
+        return JSONResponse(payload)
+
+    async def not_opted_in(request):
+        return JSONResponse({"size": len(await request.body())})
+
+    with TestClient(_build_app(opted_in), raise_server_exceptions=False) as client:
+        echoed = client.post("/items", json={"name": "Alice", "password": "secret"})
+        failed = client.post("/items", json={"fail": True})
+        client.post("/items", json={"name": "x" * 100000})
+    with TestClient(_build_app(not_opted_in)) as client:
+        client.post("/items", json={"name": "Alice"})
+        uploaded = client.post(
+            "/items", content=b"a,b\n1,2\n", headers={"content-type": "text/csv"}
+        )
+
+    assert echoed.json() == {"name": "Alice", "password": "secret"}
+    completed = [extra for message, extra in logged if message.startswith("✅")]
+    assert completed[0]["request"]["body"] == {
+        "name": "Alice",
+        "password": "***redacted***",
+    }
+    assert completed[1]["request"]["body"] == {"<truncated>": "100011 bytes"}
+    assert completed[2]["request"]["body"] == {}
+    assert completed[3]["request"]["body"] == {}
+    # Bodies that are not logged still have their size recorded
+    assert completed[3]["request"]["bodySize"] == 8
+    assert uploaded.json() == {"size": 8}
+    assert failed.status_code == 500
+    assert failed.json() == {"success": False, "error": "boom"}
+    assert any(message.startswith("❌") for message, _ in logged)
+
+
+def test_logging_middleware_reads_path_params_from_the_routed_scope(monkeypatch):
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+    from starlette_context import plugins
+    from starlette_context.middleware import RawContextMiddleware
+
+    from apps.fastapi.auth.src import middleware
+    from apps.fastapi.auth.src.middleware import LoggingMiddleware
+
+    logged = []
+    monkeypatch.setattr(
+        middleware.logger,
+        "info",
+        lambda message, extra=None: logged.append((message, extra)),
+    )
+
+    app = FastAPI()
+    app.add_middleware(LoggingMiddleware)
+    app.add_middleware(RawContextMiddleware, plugins=[plugins.RequestIdPlugin()])
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: str):
+        return {"id": item_id}
+
+    with TestClient(app) as client:
+        client.get("/items/42", params={"verbose": "1"})
+
+    initiated = [extra for message, extra in logged if message.startswith("🚀")]
+    completed = [extra for message, extra in logged if message.startswith("✅")]
+    # Routing has not run when the request starts
+    assert initiated[0]["request"]["params"] == {}
+    assert completed[0]["request"]["route"] == "/items/{item_id}"
+    assert completed[0]["request"]["params"] == {"item_id": "42"}
+    assert completed[0]["request"]["query"] == {"verbose": "1"}
@@ -0,0 +1,116 @@
+def _build_index(**kwargs):
+    from libs.utils.common.search.src import TrigramIndex
+
+    index = TrigramIndex(max_candidates=kwargs.get("max_candidates", 1000))
+    index.upsert("1", {"name": "Alice Johnson", "email": "alice@example.com"})
+    index.upsert("2", {"name": "Alicia Keys", "email": "akeys@example.com"})
+    index.upsert("3", {"name": "Bob Smith", "email": "bob@example.com"})
+    return index
+
+
+def test_trigram_index_matches_prefixes_and_typos():
+    index = _build_index()
+
+    assert {key for key, _ in index.search("ali", 2)} == {"1", "2"}
+    assert index.search("bob", 10)[0][0] == "3"
+    assert index.search("alcie johnsno", 10)[0][0] == "1"
+    assert index.search("akeys@", 10)[0][0] == "2"
+    assert index.search("zzzz", 10) == []
+    assert index.search("  ", 10) == []
+
+
+def test_trigram_index_applies_partial_updates_and_removals():
+    index = _build_index()
+
+    index.upsert("3", {"name": "Robert Smith"})
+    assert index.search("robert", 10)[0][0] == "3"
+    # The email was kept when only the name changed
+    assert index.search("bob@example", 10)[0][0] == "3"
+
+    index.remove("1", "missing")
+    assert "1" not in index
+    assert len(index) == 2
+    assert "1" not in [key for key, _ in index.search("alice", 10)]
+
+    index.upsert("4", {"name": "Alice Cooper"})
+    assert index.search("alice cooper", 1)[0][0] == "4"
+
+
+def test_trigram_index_caps_candidates_for_common_trigrams():
+    from libs.utils.common.search.src import TrigramIndex
+
+    index = TrigramIndex(max_candidates=50)
+    for number in range(500):
+        index.upsert(str(number), {"name": f"Sam {number}"})
+    index.upsert("rare", {"name": "Samwise Gamgee"})
+
+    results = index.search("sam gamgee", 5)
+
+    assert results[0][0] == "rare"
+    assert len(results) == 5
+
+
+def test_synced_index_reloads_changes_since_last_load():
+    import asyncio
+    from datetime import datetime, timedelta
+
+    from libs.utils.common.search.src import SyncedTrigramIndex
+
+    started = datetime(2025, 1, 1)
+    changes = [
+        ("1", {"name": "Alice"}, started),
+        ("2", {"name": "Bob"}, started + timedelta(seconds=1)),
+    ]
+    requested = []
+
+    async def loader(since):
+        requested.append(since)
+        for change in changes:
+            yield change
+
+    index = SyncedTrigramIndex(loader, refresh_seconds=0, max_candidates=100)
+
+    async def scenario():
+        await index.refresh_if_stale()
+        changes[:] = [("1", None, started + timedelta(seconds=2))]
+        await index.refresh_if_stale()
+
+    asyncio.run(scenario())
+
+    assert requested == [None, started + timedelta(seconds=1) - index.overlap]
+    assert "1" not in index
+    assert "2" in index
+
+
+def test_synced_index_reload_yields_to_the_event_loop():
+    import asyncio
+
+    from libs.utils.common.search.src import (
+        REFRESH_YIELD_EVERY,
+        SyncedTrigramIndex,
+    )
+
+    async def loader(since):
+        # Like a driver cursor draining a buffered batch: no awaits in between
+        for number in range(REFRESH_YIELD_EVERY * 4):
+            yield str(number), {"name": f"Employee {number}"}, None
+
+    index = SyncedTrigramIndex(loader, refresh_seconds=0, max_candidates=100)
+    ticks = []
+
+    async def scenario():
+        async def ticker():
+            while True:
+                ticks.append(len(index))
+                await asyncio.sleep(0)
+
+        task = asyncio.create_task(ticker())
+        await asyncio.sleep(0)
+        await index.refresh_if_stale()
+        task.cancel()
+
+    asyncio.run(scenario())
+
+    assert len(index) == REFRESH_YIELD_EVERY * 4
+    # Other tasks ran while the index was only partly built
+    assert any(0 < size < len(index) for size in ticks)